@@ -0,0 +1,70 @@
+"""
+Opaque keyset pagination cursors.
+
+A cursor records where the previous page ended so the next page can seek instead of skip:
+
+    {"s": "lastname:asc,id:asc",    # sort fingerprint - a cursor is only valid for the same sort
+     "v": ["smith", "01hq..."],     # sort key values of the last document (id tiebreaker last)
+     "p": "..."}                    # optional driver state (Elasticsearch point-in-time id)
+
+Tokens are base32 without padding, lowercase. Query params are lowercased upstream, so the
+encoding must survive that (base64 would not).
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Tuple
+
+
+def sort_fingerprint(sort: List[Tuple[str, str]]) -> str:
+    """Stable description of a sort spec, used to reject cursors replayed with another sort"""
+    return ','.join(f"{field.lower()}:{direction.lower()}" for field, direction in sort)
+
+
+def matches_sort(state: Dict[str, Any], keyset: List[Tuple[str, str]]) -> bool:
+    """True if a decoded cursor was issued for this keyset (sort fields plus the id tiebreaker)"""
+    return state.get('s') == sort_fingerprint(keyset) and len(state.get('v', [])) == len(keyset)
+
+
+def _encode_value(value: Any) -> Any:
+    """Tag values JSON can't carry so drivers get back the type they compare against"""
+    if isinstance(value, datetime):
+        return {'$dt': value.isoformat()}
+    if isinstance(value, date):
+        return {'$d': value.isoformat()}
+    if isinstance(value, Decimal):
+        return {'$n': str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and len(value) == 1:
+        if '$dt' in value:
+            return datetime.fromisoformat(value['$dt'])
+        if '$d' in value:
+            return date.fromisoformat(value['$d'])
+        if '$n' in value:
+            return Decimal(value['$n'])
+    return value
+
+
+def encode_cursor(state: Dict[str, Any]) -> str:
+    """Encode cursor state as an opaque, lowercase URL-safe token"""
+    payload = {**state, 'v': [_encode_value(v) for v in state.get('v', [])]}
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.b32encode(raw).decode('ascii').rstrip('=').lower()
+
+
+def decode_cursor(token: str) -> Dict[str, Any]:
+    """Decode a cursor token. Raises ValueError if it is malformed."""
+    try:
+        padded = token.strip().upper() + '=' * (-len(token.strip()) % 8)
+        state = json.loads(base64.b32decode(padded).decode('utf-8'))
+    except Exception:
+        raise ValueError("malformed cursor")
+    if not isinstance(state, dict) or not isinstance(state.get('v'), list) or not isinstance(state.get('s'), str):
+        raise ValueError("malformed cursor")
+    state['v'] = [_decode_value(v) for v in state['v']]
+    return state
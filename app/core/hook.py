@@ -53,11 +53,14 @@ class HookService:
             if entity_name == hook_entity_name and hook_preflight and operation == hook_operation:
                 # Check if callback is async before calling
                 if inspect.iscoroutinefunction(callback):
-                    return await callback(**context)
+                    proceed = await callback(**context)
                 else:
-                    return callback(**context)
+                    proceed = callback(**context)
+                # Any hook can abort the operation
+                if not proceed:
+                    return False
 
-        # No hook found - default: allow operation to proceed
+        # No hook found or all hooks agreed - allow operation to proceed
         return True
 
     @staticmethod
@@ -70,6 +73,7 @@ class HookService:
             operation: Operation being performed (e.g., "create", "update")
             doc: Result document(s) from operation.  get_all will be List[] while other ops will be a single Dict
             doc_count: Number of documents
+            **context: Flexible context passed to hook (update/delete pass the document id)
 
         Returns:
             Tuple[List[Dict[str, Any]], int]: Potentially modified (docs, doc_count)
@@ -77,11 +81,11 @@ class HookService:
         assert( entity_name and operation )
         for hook_entity_name, hook_preflight, hook_operation, callback in HookService._hooks:
             if entity_name == hook_entity_name and not hook_preflight and operation == hook_operation:
-                # Check if callback is async before calling
+                # Hooks are chained in registration order - each sees the previous hook's result
                 if inspect.iscoroutinefunction(callback):
-                    return await callback(doc, doc_count, **context)
+                    doc, doc_count = await callback(doc, doc_count, **context)
                 else:
-                    return callback(doc, doc_count, **context)
+                    doc, doc_count = callback(doc, doc_count, **context)
 
         # No hook found - default: return unchanged
         return doc, doc_count
\ No newline at end of file
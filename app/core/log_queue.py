@@ -0,0 +1,113 @@
+"""
+Queue-backed logging and per-type log sampling / rate limiting.
+
+start_queue_logging() puts a QueueHandler on the root logger and moves the real handlers
+(console, app.log) onto a QueueListener thread. A log call on the request path only renders its
+message (msg % args, while the arguments still hold their values) and enqueues the record - the
+formatter and the I/O run on the listener thread.
+
+LogLimiter decides, per key (e.g. the notification type), whether a message is logged at all:
+keep 1 in `sample`, then at most `per_second` a second with bursts up to `burst`. What it drops
+is counted and reported with the next message it lets through.
+
+LogLimiter is safe to call from the threadpool that runs sync endpoints as well as the event loop.
+"""
+
+import atexit
+import copy
+import logging
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Hashable, List, Optional
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves the formatter to the listener thread"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock prepare() runs the whole formatter here, on the caller's thread. Only what can't
+        # wait is done now: msg % args (the arguments may be live objects the request goes on to
+        # change) and the traceback (its frames don't outlive the request). Records a LogLimiter
+        # drops never get this far.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def start_queue_logging(level: str, fmt: str, handlers: List[logging.Handler]) -> QueueListener:
+    """Route root logging through a queue to `handlers` on a listener thread (stopped at exit)"""
+    formatter = logging.Formatter(fmt)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(stop_queue_logging, listener)
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(_DeferredQueueHandler(log_queue))
+    return listener
+
+
+def stop_queue_logging(listener: QueueListener) -> None:
+    """Flush what is still queued and stop the listener thread (safe to call twice)"""
+    if listener._thread is not None:
+        listener.stop()
+
+
+class LogLimiter:
+    """Per-key sampling and token-bucket rate limit for log messages"""
+
+    def __init__(self, settings: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        settings: {key: {"sample": n, "per_second": r, "burst": b}}, plus an optional "default"
+        entry used for keys not listed. Without settings every message is logged.
+        """
+        self._settings = settings or {}
+        self._state: Dict[Hashable, List[float]] = {}   # key -> [seen, tokens, last refill, dropped]
+        self._lock = threading.Lock()
+
+    def allow(self, key: Hashable) -> int:
+        """
+        0 if this message should be dropped, otherwise 1 + the number dropped for the key since
+        the last one allowed (so the caller can say so).
+        """
+        settings = self._settings.get(key) or self._settings.get('default')
+        if not settings:
+            return 1
+
+        per_second = float(settings.get('per_second', 0))
+        burst = float(settings.get('burst', per_second or 1))
+        sample = int(settings.get('sample', 1))
+        with self._lock:    # sync endpoints notify from threadpool threads
+            state = self._state.get(key)
+            now = time.monotonic()
+            if state is None:
+                state = self._state[key] = [0, burst, now, 0]
+
+            state[0] += 1
+            if sample > 1 and state[0] % sample != 1:
+                state[3] += 1
+                return 0
+
+            if per_second > 0:
+                state[1] = min(burst, state[1] + (now - state[2]) * per_second)
+                state[2] = now
+                if state[1] < 1:
+                    state[3] += 1
+                    return 0
+                state[1] -= 1
+
+            dropped = int(state[3])
+            state[3] = 0
+            return dropped + 1
@@ -7,11 +7,19 @@ class MetadataService:
     # New structure: { 'authn': { 'provider': 'cookies.redis', 'entity_configs': {'Auth': {...}, 'User': {...}} } }
     _entity_services : Dict[str, Any] = {}
 
+    # Lowercase-keyed indexes built once by initialize() so lookups are dict hits, not scans
+    _entity_names: Dict[str, str] = {}                          # 'userevent' -> 'UserEvent'
+    _field_names: Dict[str, Dict[str, str]] = {}                # 'user' -> {'firstname': 'firstName', ...}
+    _descriptors: Dict[str, Dict[str, Dict[str, Any]]] = {}     # 'user' -> {'firstName': descriptor, ...}
+
     @staticmethod
     def initialize(entities: List[str]) -> None:
         """Initialize the metadata service with entity list."""
         MetadataService._metadata = {}
         MetadataService._entity_services = {}  # Reset on each initialization
+        MetadataService._entity_names = {}
+        MetadataService._field_names = {}
+        MetadataService._descriptors = {}
 
         for entity in entities:
             md = MetadataService._get_raw_metadata(entity)
@@ -21,6 +29,8 @@ class MetadataService:
             merged_md = merge_overrides(entity, md.copy()) # type: ignore
             merged_md['fields']['id'] = {'type': 'ObjectId', 'required': True}
             MetadataService._metadata[entity] = merged_md
+            MetadataService._entity_names[entity.lower()] = entity
+            MetadataService._field_names[entity.lower()] = {f.lower(): f for f in merged_md.get('fields', {})}
 
             # Process services for this entity
             for svc_name, svc_info in md.get('services', {}).items():
@@ -43,7 +53,45 @@ class MetadataService:
                     'delegates': svc_info.get('delegates', []),
                     'settings': svc_info  # Keep full settings for backward compat
                 }
+
+        # FK targets can only be resolved once every entity is known
+        for entity in MetadataService._metadata:
+            MetadataService._descriptors[entity.lower()] = MetadataService._compile_descriptors(entity)
+
+    @staticmethod
+    def _compile_descriptors(entity: str) -> Dict[str, Dict[str, Any]]:
+        """Flatten the per-field attributes hot paths need into one dict per field"""
+        descriptors = {}
+        for field, fd in MetadataService._metadata[entity].get('fields', {}).items():
+            field_type = fd.get('type', 'String')
+            fk_entity = None
+            if field_type == 'ObjectId' and len(field) > 2:
+                fk_entity = MetadataService._entity_names.get(field[:-2].lower())
+            descriptors[field] = {
+                'type': field_type,
+                'enum': fd.get('enum'),
+                'required': str(fd.get('required', False)).lower() == 'true',
+                'fk_entity': fk_entity,     # proper FK entity name for <fk>Id fields, else None
+                'searchable': field_type == 'String' and str(fd.get('searchable', False)).lower() == 'true',
+                'sortable': str(fd.get('sortable', False)).lower() == 'true',
+            }
+        return descriptors
+
+    @staticmethod
+    def descriptors(entity: str) -> Dict[str, Dict[str, Any]]:
+        """Get compiled field descriptors (type, enum, required, fk_entity, searchable, sortable) keyed by proper field name."""
+        return MetadataService._descriptors.get(entity.lower(), {})
      
+    @staticmethod
+    def searchable_fields(entity: str) -> List[str]:
+        """String fields flagged searchable - drivers give these a substring index."""
+        return [field for field, d in MetadataService.descriptors(entity).items() if d['searchable']]
+
+    @staticmethod
+    def sortable_fields(entity: str) -> List[str]:
+        """Fields flagged sortable - drivers give these an index matching their ORDER BY."""
+        return [field for field, d in MetadataService.descriptors(entity).items() if d['sortable']]
+
     @staticmethod
     def get_services() -> Dict[str, Any]:
         """Get service configuration by service name."""
@@ -65,34 +113,26 @@ class MetadataService:
     @staticmethod
     def get(entity: str, field: Optional[str] = None, attribute: Optional[str] = None) -> Any:
         """Get metadata with fail-fast error handling."""
-        # find metadata where lower key = entity.lower()
-        found = False
-        for e, metadata in MetadataService._metadata.items():
-            if e.lower() == entity.lower():
-                found = True
-                break
-        if not found:
+        key = entity.lower()
+        proper_entity = MetadataService._entity_names.get(key)
+        if proper_entity is None:
             return None
-        #     MetadataService._fail_fast(f"Entity metadata not found: {entity}")
-            
+        metadata = MetadataService._metadata[proper_entity]
+
         if field is None:
             return metadata
 
         # find field in metadata
-        fields = metadata.get('fields', {})
-        found = False
-        for f, fd in fields.items():
-            if f.lower() == field.lower():
-                found = True
-                break
-                
-        if not found:
+        proper_field = MetadataService._field_names[key].get(field.lower())
+        if proper_field is None:
             return None
-            # MetadataService._fail_fast(f"Field metadata not found: {entity}.{field}")
-            
+        fd = metadata['fields'][proper_field]
+
         if attribute is None:
             return fd
-        
+        if attribute in fd:     # plain attribute such as 'type' - the hot path
+            return fd[attribute]
+
         # Get nested attribute with dot notation
         attrs = attribute.split('.')
         ad: Dict[str, Any] = fd
@@ -116,16 +156,10 @@ class MetadataService:
         if field and field.lower() == 'id':
             return 'id'
 
-        # find metadata where lower key = entity.lower()
-        for e, md in MetadataService._metadata.items():
-            if e.lower() == entity.lower():
-                if field:
-                    for f in md.get('fields', {}):
-                        if f.lower() == field.lower():
-                            return f
-                else:
-                    return e
-        return ''
+        key = entity.lower()
+        if field:
+            return MetadataService._field_names.get(key, {}).get(field.lower(), '')
+        return MetadataService._entity_names.get(key, '')
 
     @staticmethod
     def _get_raw_metadata(entity: str) -> Optional[Dict[str, Any]]:
@@ -3,7 +3,7 @@ ModelService for managing entity model classes.
 Initialized at startup to avoid dynamic import issues.
 """
 
-from typing import Dict, Type, Any
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Type, Any
 import importlib
 import logging
 
@@ -16,6 +16,7 @@ class ModelService:
     _models: Dict[str, Type[Any]] = {}
     _create_models: Dict[str, Type[Any]] = {}
     _update_models: Dict[str, Type[Any]] = {}
+    _names: Dict[str, str] = {}     # lowercase entity name -> proper name, for case-insensitive lookups
     
     @classmethod
     def initialize(cls, entitys: list[str]) -> None:
@@ -35,6 +36,7 @@ class ModelService:
                 # Main model class
                 model_class = getattr(module, entity)
                 cls._models[entity] = model_class
+                cls._names[entity.lower()] = entity
                 
                 # Create class (e.g., UserCreate)
                 try:
@@ -75,9 +77,9 @@ class ModelService:
         from app.core.exceptions import ModelNotFound
 
         # Case-insensitive lookup
-        for name, model_class in cls._models.items():
-            if name.lower() == entity.lower():
-                return model_class
+        model_class = cls._models.get(cls._names.get(entity.lower(), ''))
+        if model_class:
+            return model_class
 
         raise ModelNotFound(entity)
     
@@ -95,10 +97,7 @@ class ModelService:
             RuntimeError: Only if ModelService not initialized
         """
         # Case-insensitive lookup
-        for name, create_class in cls._create_models.items():
-            if name.lower() == entity.lower():
-                return create_class
-        return None
+        return cls._create_models.get(cls._names.get(entity.lower(), ''))
     
     @classmethod
     def get_update_class(cls, entity: str) -> Type[Any] | None:
@@ -114,12 +113,34 @@ class ModelService:
             RuntimeError: Only if ModelService not initialized
         """
         # Case-insensitive lookup
-        for name, update_class in cls._update_models.items():
-            if name.lower() == entity.lower():
-                return update_class
-        return None
+        return cls._update_models.get(cls._names.get(entity.lower(), ''))
     
     @classmethod
     def get_available_models(cls) -> list[str]:
         """Get list of available model names."""
-        return list(cls._models.keys())
\ No newline at end of file
+        return list(cls._models.keys())
+
+    # Bulk operations live here rather than on the generated model classes, so regenerating
+    # app/models doesn't drop them
+
+    @classmethod
+    async def bulk_save(cls, entity: str, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create/update/delete a batch of entity documents; one status per item."""
+        from app.db import DatabaseFactory
+        return await DatabaseFactory.get_instance().documents.bulk_save(entity, items)
+
+    @classmethod
+    def export(cls,
+               entity: str,
+               sort: List[Tuple[str, str]],
+               filter: Optional[Dict[str, Any]],
+               substring_match: bool = True) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream every matching entity document in batches."""
+        from app.db import DatabaseFactory
+        return DatabaseFactory.get_instance().documents.export(entity, sort, filter, substring_match)
+
+    @classmethod
+    def import_rows(cls, entity: str, rows: AsyncIterator[Any]) -> AsyncIterator[Tuple[List[Any], List[Dict[str, Any]]]]:
+        """Create a stream of rows in batches, yielding each batch with its per-row status."""
+        from app.db import DatabaseFactory
+        return DatabaseFactory.get_instance().documents.import_rows(entity, rows)
@@ -1,17 +1,29 @@
 """
 Simple static notification system with 3 types: errors, request_warnings, warnings.
+
+Uses contextvars like RequestContext: each request collects into its own _Collector, and the
+suppress flags are per task, so concurrent requests on one event loop never see each other's
+notifications or suppression.
 """
 
 import logging
 from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Dict, List, Optional, Any
 from fastapi import HTTPException
 
 from app.core.exceptions import DuplicateConstraintError, StopWorkError
+from app.core.log_queue import LogLimiter
+
+logger = logging.getLogger(__name__)
 
 
 class HTTP:
-    """HTTP status codes for errors"""
+    """HTTP status codes for errors (and the success codes reported per item by bulk writes)"""
+    # 2xx Success
+    OK = 200
+    CREATED = 201
+
     # 4xx Client Errors
     BAD_REQUEST = 400
     UNAUTHORIZED = 401
@@ -45,54 +57,106 @@ class Warning:
     MISSING = 'missing'
 
 
+class _Collector:
+    """One request's notifications. Tasks the request spawns share it (contextvars copy the reference)."""
+    __slots__ = ('errors', 'warnings', 'request_warnings')
+
+    def __init__(self) -> None:
+        self.errors: Dict[str, Dict[str, List[Dict[str, str]]]] = {}     # Entity-grouped: {entity: {entity_id: [errors]}}
+        self.warnings: Dict[str, Dict[str, List[Dict[str, str]]]] = {}   # Entity-grouped: {entity: {entity_id: [warnings]}}
+        self.request_warnings: List[Dict[str, str]] = []
+
+
+# Context variables for request-scoped notifications (async-safe).
+# No collector until start() - code running outside a request gets one on first use.
+_collector: ContextVar[Optional[_Collector]] = ContextVar('notifications', default=None)
+# Suppression is scoped to the task (and the tasks it spawns) inside the with block
+_suppress_warnings: ContextVar[bool] = ContextVar('suppress_warnings', default=False)
+_suppress_errors: ContextVar[bool] = ContextVar('suppress_errors', default=False)
+
+
 class Notification:
     """Static notification collection system"""
 
-    _errors: Dict[str, Dict[str, List[Dict[str, str]]]] = {}  # Entity-grouped: {entity: {entity_id: [errors]}}
-    _warnings: Dict[str, Dict[str, List[Dict[str, str]]]] = {}  # Entity-grouped: {entity: {entity_id: [warnings]}}
-    _request_warnings: List[Dict[str, str]] = []
-    _suppress_warnings: bool = False
-    _suppress_errors: bool = False
-    
+    _log_limiter: LogLimiter = LogLimiter()     # log every notification until configure_logging()
+
+    @classmethod
+    def configure_logging(cls, settings: Optional[Dict[str, Dict[str, Any]]]) -> None:
+        """
+        Sample / rate limit the log line each notification writes (collection is unaffected).
+        Keyed by warning type ('validation', 'not_found', ...) or error category ('bad_request', ...)
+        from the config file:
+
+            "notification_logging": {
+                "default":    {"per_second": 50, "burst": 200},
+                "validation": {"sample": 10, "per_second": 5}
+            }
+        """
+        cls._log_limiter = LogLimiter(settings)
+
+    @classmethod
+    def _log(cls, level: int, key: str, message: str, *args: Any) -> None:
+        """Log if the limiter lets this one through - the message is only rendered for lines that are logged"""
+        if not logger.isEnabledFor(level):
+            return
+        allowed = cls._log_limiter.allow(key)
+        if allowed > 1:
+            logger.log(level, message + " (%d more %s not logged)", *args, allowed - 1, key)
+        elif allowed:
+            logger.log(level, message, *args)
+
+    @staticmethod
+    def _current() -> _Collector:
+        collector = _collector.get()
+        if collector is None:
+            collector = _Collector()
+            _collector.set(collector)
+        return collector
+
     @classmethod
     def start(cls) -> None:
         """Start notification collection"""
-        cls._errors.clear()
-        cls._warnings.clear()
-        cls._request_warnings.clear()
+        _collector.set(_Collector())
+        _suppress_warnings.set(False)
+        _suppress_errors.set(False)
     
     @classmethod
     @contextmanager
     def suppress_warnings(cls):
         """Context manager to suppress warning notifications during FK lookups"""
-        old_value = cls._suppress_warnings
-        cls._suppress_warnings = True
+        token = _suppress_warnings.set(True)
         try:
             yield
         finally:
-            cls._suppress_warnings = old_value
+            _suppress_warnings.reset(token)
 
     @classmethod
     @contextmanager
     def suppress(cls):
         """Context manager to suppress ALL notifications (errors and warnings) during FK lookups"""
-        old_suppress_warnings = cls._suppress_warnings
-        old_suppress_errors = cls._suppress_errors
-        cls._suppress_warnings = True
-        cls._suppress_errors = True
+        warnings_token = _suppress_warnings.set(True)
+        errors_token = _suppress_errors.set(True)
         try:
             yield
         finally:
-            cls._suppress_warnings = old_suppress_warnings
-            cls._suppress_errors = old_suppress_errors
+            _suppress_errors.reset(errors_token)
+            _suppress_warnings.reset(warnings_token)
+
+    @staticmethod
+    def errors_suppressed() -> bool:
+        """True inside a suppress() block"""
+        return _suppress_errors.get()
     
     @classmethod
     def get(cls) -> Dict[str, Any]:
         """Return formatted response in unified entity-grouped format"""
+        collector = cls._current()
+        errors, warnings, request_warnings = collector.errors, collector.warnings, collector.request_warnings
+
         # Build response
-        if cls._errors:
+        if errors:
             status = "error"
-        elif cls._warnings or cls._request_warnings:
+        elif warnings or request_warnings:
             status = "warning"
         else:
             status = "success"
@@ -100,18 +164,18 @@ class Notification:
         response: Dict[str, Any] = {"status": status}
 
         # Build unified entity-grouped notifications
-        if cls._errors or cls._warnings:
+        if errors or warnings:
             notifications: Dict[str, Any] = {}
 
             # Collect all unique entity/entity_id combinations
             all_entities = set()
-            if cls._errors:
-                for entity in cls._errors:
-                    for entity_id in cls._errors[entity]:
+            if errors:
+                for entity in errors:
+                    for entity_id in errors[entity]:
                         all_entities.add((entity, entity_id))
-            if cls._warnings:
-                for entity in cls._warnings:
-                    for entity_id in cls._warnings[entity]:
+            if warnings:
+                for entity in warnings:
+                    for entity_id in warnings[entity]:
                         all_entities.add((entity, entity_id))
 
             # Build unified structure: {entity_id: {errors: [], warnings: []}}
@@ -122,18 +186,18 @@ class Notification:
                     notifications[key] = {"errors": [], "warnings": []}
 
                 # Add errors for this entity_id
-                if entity in cls._errors and entity_id in cls._errors[entity]:
-                    notifications[key]["errors"] = cls._errors[entity][entity_id]
+                if entity in errors and entity_id in errors[entity]:
+                    notifications[key]["errors"] = errors[entity][entity_id]
 
                 # Add warnings for this entity_id
-                if entity in cls._warnings and entity_id in cls._warnings[entity]:
-                    notifications[key]["warnings"] = cls._warnings[entity][entity_id]
+                if entity in warnings and entity_id in warnings[entity]:
+                    notifications[key]["warnings"] = warnings[entity][entity_id]
 
             response["notifications"] = notifications
 
         # Add request-level warnings separately (no entity context)
-        if cls._request_warnings:
-            response["request_warnings"] = cls._request_warnings
+        if request_warnings:
+            response["request_warnings"] = request_warnings
 
         return response
     
@@ -168,17 +232,13 @@ class Notification:
         entity_id = entity_id or 'general'
 
         # Only add error and log if not suppressed
-        if not cls._suppress_errors:
-            if entity not in cls._errors:
-                cls._errors[entity] = {}
-            if entity_id not in cls._errors[entity]:
-                cls._errors[entity][entity_id] = []
-
-            cls._errors[entity][entity_id].append(error)
-            logging.error(f"[{status_code}] {message}")
+        suppressed = _suppress_errors.get()
+        if not suppressed:
+            cls._current().errors.setdefault(entity, {}).setdefault(entity_id, []).append(error)
+            cls._log(logging.ERROR, category, "[%s] %s", status_code, message)
 
         # Only raise exception if not suppressed and raise_exception=True
-        if raise_exception and not cls._suppress_errors:
+        if raise_exception and not suppressed:
             raise StopWorkError(message, status_code, category, entity=entity, field=field, value=value)
     
     @classmethod
@@ -189,7 +249,7 @@ class Notification:
     def warning(cls, warning_type: str, message: str = '', entity:str = '', entity_id:str = '', field:str = '', value = None, parameter:str = '') -> None:
         """Add warning"""
         # Skip warnings if suppressed (e.g., during FK lookups)
-        if cls._suppress_warnings:
+        if _suppress_warnings.get():
             return
             
         warning = {'type': warning_type}
@@ -204,7 +264,7 @@ class Notification:
                 warning['field'] = field
             if parameter:
                 warning['parameter'] = parameter
-            cls._request_warnings.append(warning)
+            cls._current().request_warnings.append(warning)
 
         else:
             # entity = entity or 'system'
@@ -220,16 +280,10 @@ class Notification:
             if parameter:
                 warning['parameter'] = parameter
             
-            # Initialize structure if needed
-            if entity not in cls._warnings:
-                cls._warnings[entity] = {}
-            if entity_id not in cls._warnings[entity]:
-                cls._warnings[entity][entity_id] = []
-            
-            cls._warnings[entity][entity_id].append(warning)
+            cls._current().warnings.setdefault(entity, {}).setdefault(entity_id, []).append(warning)
             
         # Log the warning
-        logging.warning(warning)
+        cls._log(logging.WARNING, warning_type, "%s", warning)
 
 
     @classmethod
@@ -11,6 +11,7 @@ import json
 import re
 from contextvars import ContextVar
 from typing import Optional, Dict, Any, List, Tuple, Union
+from app.core.cursor import decode_cursor
 from app.core.metadata import MetadataService
 from app.core.notify import Notification, HTTP
 from app.core.utils import parse_url_path
@@ -24,10 +25,27 @@ _filters: ContextVar[Dict[str, Any]] = ContextVar('filters', default={})
 _sort_fields: ContextVar[List[Tuple[str, str]]] = ContextVar('sort_fields', default=[])
 _page: ContextVar[int] = ContextVar('page', default=1)
 _pageSize: ContextVar[int] = ContextVar('pageSize', default=25)
+_cursor: ContextVar[Optional[Dict[str, Any]]] = ContextVar('cursor', default=None)         # decoded ?cursor=
+_count_mode: ContextVar[str] = ContextVar('count_mode', default='exact')                   # ?count=exact|estimate|none
+# What get_all reported about the page it returned: count kind, hasMore, nextCursor
+_page_info: ContextVar[Dict[str, Any]] = ContextVar('page_info', default={})
+
+COUNT_MODES = ('exact', 'estimate', 'none')
 _view_spec: ContextVar[Dict[str, Any]] = ContextVar('view_spec', default={})
 _substring_match: ContextVar[bool] = ContextVar('substring_match', default=True)
 _no_consistency: ContextVar[bool] = ContextVar('no_consistency', default=False)
 _session: ContextVar[Optional[Dict[str, Any]]] = ContextVar('session', default=None)
+# Identity map: (entity, id) -> document read during this request, plus hit/miss counters.
+# None outside of a request (startup, tools) which disables memoization.
+_identity_map: ContextVar[Optional[Dict[str, Any]]] = ContextVar('identity_map', default=None)
+
+# Identity map counters folded in per endpoint at the end of each request (process-wide)
+_identity_stats: Dict[str, Dict[str, int]] = {}
+
+# get_all query shapes (entity, equality filter fields, range filter fields, sort) with their
+# call counts and latencies (process-wide) - what the index advisor recommends from
+_query_shapes: Dict[Tuple[str, Tuple[str, ...], Tuple[str, ...], Tuple[Tuple[str, str], ...]], Dict[str, Any]] = {}
+QUERY_SHAPE_LIMIT = 1000    # distinct shapes kept; later new shapes are not recorded
 
 
 class RequestContext:
@@ -65,6 +83,24 @@ class RequestContext:
     def get_pageSize() -> int:
         return _pageSize.get()
 
+    @staticmethod
+    def get_cursor() -> Optional[Dict[str, Any]]:
+        """Decoded keyset cursor from the request, or None for offset (page) pagination"""
+        return _cursor.get()
+
+    @staticmethod
+    def get_count_mode() -> str:
+        return _count_mode.get()
+
+    @staticmethod
+    def get_page_info() -> Dict[str, Any]:
+        return _page_info.get()
+
+    @staticmethod
+    def set_page_info(count: str, hasMore: bool, nextCursor: Optional[str]) -> None:
+        """Record how the returned page was counted, whether more rows follow, and the cursor to them"""
+        _page_info.set({'count': count, 'hasMore': hasMore, 'nextCursor': nextCursor})
+
     @staticmethod
     def get_view_spec() -> Dict[str, Any]:
         return _view_spec.get()
@@ -101,6 +137,108 @@ class RequestContext:
         """Set session data in request context (cache from Redis)"""
         _session.set(session)
 
+    @staticmethod
+    def identity_get(entity: str, id: str) -> Optional[Dict[str, Any]]:
+        """Get a copy of a document already read in this request, or None"""
+        identity_map = _identity_map.get()
+        if identity_map is None:
+            return None
+        doc = identity_map['docs'].get((entity.lower(), id))
+        if doc is None:
+            identity_map['misses'] += 1
+            return None
+        identity_map['hits'] += 1
+        return dict(doc)
+
+    @staticmethod
+    def identity_put(entity: str, id: str, doc: Dict[str, Any]) -> None:
+        """Remember a document read in this request (stored as a copy - callers mutate their doc)"""
+        identity_map = _identity_map.get()
+        if identity_map is not None:
+            identity_map['docs'][(entity.lower(), id)] = dict(doc)
+
+    @staticmethod
+    def identity_evict(entity: str, id: str) -> None:
+        """Forget a document after it was created, updated or deleted in this request"""
+        identity_map = _identity_map.get()
+        if identity_map is not None:
+            identity_map['docs'].pop((entity.lower(), id), None)
+
+    @staticmethod
+    def identity_clear() -> None:
+        """Forget every document read so far (hit/miss counts are kept) - for long imports"""
+        identity_map = _identity_map.get()
+        if identity_map is not None:
+            identity_map['docs'].clear()
+
+    @staticmethod
+    def record_identity_stats(endpoint: str) -> None:
+        """Fold this request's identity map hits/misses into the per-endpoint totals"""
+        identity_map = _identity_map.get()
+        if identity_map is None:
+            return
+        stats = _identity_stats.setdefault(endpoint, {'requests': 0, 'hits': 0, 'misses': 0})
+        stats['requests'] += 1
+        stats['hits'] += identity_map['hits']
+        stats['misses'] += identity_map['misses']
+
+    @staticmethod
+    def get_identity_stats() -> Dict[str, Dict[str, Any]]:
+        """Per-endpoint identity map hit/miss totals with hit ratio"""
+        report = {}
+        for endpoint, stats in _identity_stats.items():
+            lookups = stats['hits'] + stats['misses']
+            report[endpoint] = {**stats, 'hit_ratio': round(stats['hits'] / lookups, 3) if lookups else 0.0}
+        return report
+
+    @staticmethod
+    def record_query_shape(entity: str, filter: Optional[Dict[str, Any]], sort: Optional[List[Tuple[str, str]]],
+                           substring_match: bool, seconds: float) -> None:
+        """
+        Count a get_all query by the fields it filters and sorts on. Substring matches on strings
+        can't use a b-tree and are left out, as is id (always indexed).
+        """
+        descriptors = MetadataService.descriptors(entity)
+        equality, ranges = set(), set()
+        for field, value in (filter or {}).items():
+            proper = MetadataService.get_proper_name(entity, field) or field
+            descriptor = descriptors.get(proper, {})
+            if proper == 'id':
+                continue
+            if isinstance(value, dict):
+                ranges.add(proper)
+            elif not (substring_match and descriptor.get('type', 'String') == 'String' and not descriptor.get('enum')):
+                equality.add(proper)
+        sort_key = tuple((MetadataService.get_proper_name(entity, field) or field, direction.lower())
+                         for field, direction in (sort or []) if field.lower() != 'id')
+
+        key = (MetadataService.get_proper_name(entity) or entity, tuple(sorted(equality)), tuple(sorted(ranges)), sort_key)
+        stats = _query_shapes.get(key)
+        if stats is None:
+            if len(_query_shapes) >= QUERY_SHAPE_LIMIT:
+                return
+            stats = _query_shapes[key] = {'requests': 0, 'seconds': 0.0, 'max_seconds': 0.0}
+        stats['requests'] += 1
+        stats['seconds'] += seconds
+        stats['max_seconds'] = max(stats['max_seconds'], seconds)
+
+    @staticmethod
+    def get_query_shapes() -> List[Dict[str, Any]]:
+        """Recorded get_all shapes, most total time first"""
+        shapes = []
+        for (entity, equality, ranges, sort), stats in _query_shapes.items():
+            shapes.append({
+                'entity': entity,
+                'filter': list(equality),
+                'range': list(ranges),
+                'sort': [list(pair) for pair in sort],
+                'requests': stats['requests'],
+                'avg_ms': round(stats['seconds'] * 1000 / stats['requests'], 2),
+                'max_ms': round(stats['max_seconds'] * 1000, 2),
+                'total_ms': round(stats['seconds'] * 1000, 2)
+            })
+        return sorted(shapes, key=lambda shape: shape['total_ms'], reverse=True)
+
     @staticmethod
     def parse_request(path: str, query_params: Dict[str, str]) -> None:
         """
@@ -132,10 +270,14 @@ class RequestContext:
         _sort_fields.set([])
         _page.set(1)
         _pageSize.set(25)
+        _cursor.set(None)
+        _count_mode.set('exact')
+        _page_info.set({})
         _view_spec.set({})
         _substring_match.set(True)
         _no_consistency.set(False)
         _session.set(None)
+        _identity_map.set({'docs': {}, 'hits': 0, 'misses': 0})
 
     
     @staticmethod
@@ -228,6 +370,18 @@ class RequestContext:
                         Notification.error(HTTP.BAD_REQUEST, f"Bad Page Size {value}")
                     _pageSize.set(size_val)
 
+                elif key == 'cursor':
+                    # Empty cursor= asks for the first page in cursor mode
+                    try:
+                        _cursor.set(decode_cursor(value) if value.strip() else {'s': '', 'v': []})
+                    except ValueError:
+                        Notification.error(HTTP.BAD_REQUEST, "Invalid cursor. Use the nextCursor value from a previous response")
+
+                elif key == 'count':
+                    if value not in COUNT_MODES:
+                        Notification.error(HTTP.BAD_REQUEST, f"Invalid count={value}. Use one of: {', '.join(COUNT_MODES)}")
+                    _count_mode.set(value)
+
                 elif key == 'sort':
                     _sort_fields.set(RequestContext._parse_sort_parameter(value, _entity.get()))
 
@@ -250,7 +404,7 @@ class RequestContext:
 
                 else:
                     # Unknown parameter - ignore and continue
-                    valid_params = ['page', 'pageSize', 'sort', 'filter', 'view', 'no_consistency', 'full_match']
+                    valid_params = ['page', 'pageSize', 'cursor', 'count', 'sort', 'filter', 'view', 'no_consistency', 'full_match']
                     Notification.error(HTTP.BAD_REQUEST, f"Unknown query parameter={key}. Valid parameters: {', '.join(valid_params)}")
                     
             except ValueError as e:
@@ -268,6 +422,8 @@ class RequestContext:
             'sort_fields': _sort_fields.get(),
             'page': _page.get(),
             'pageSize': _pageSize.get(),
+            'cursor': _cursor.get() is not None,
+            'count': _count_mode.get(),
             'view_spec': _view_spec.get(),
             'has_metadata': bool(_entity_metadata.get()),
             'session_id': session.get('_session_id') if session else None
@@ -3,25 +3,43 @@ Document CRUD operations with explicit parameters.
 No dependency on RequestContext - can be used standalone.
 """
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Tuple
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 import warnings as python_warnings
 from pydantic import ValidationError as PydanticValidationError
 from ulid import ULID
 
+from app.core.cursor import encode_cursor, matches_sort, sort_fingerprint
 from app.core.hook import HookService
 from app.core.notify import Notification, Warning, HTTP
 from app.db.core_manager import CoreManager
-from app.core.exceptions import DocumentNotFound, DuplicateConstraintError
+from app.core.exceptions import DocumentNotFound, DuplicateConstraintError, StopWorkError
 from app.core.metadata import MetadataService
 from app.core.model import ModelService
 from app.core.request_context import RequestContext
 from app.core.config import Config
 from app.core.gating import GatingService
+from app.db.entity_cache import EntityCache
 
 class DocumentManager(ABC):
     """Document CRUD operations with clean, focused interface"""
 
+    # count_mode='estimate' stops counting filtered rows here when there is no cheaper estimate
+    ESTIMATE_COUNT_CAP = 10000
+
+    # bulk_save operations and the largest batch accepted in one request
+    BULK_OPERATIONS = ('create', 'update', 'delete')
+    BULK_MAX_ITEMS = 5000
+
+    # documents per batch read from an export's server-side cursor
+    EXPORT_BATCH_SIZE = 1000
+
+    # rows per bulk_save batch in an import, and parsed batches allowed to wait for the writer
+    IMPORT_BATCH_SIZE = 1000
+    IMPORT_QUEUE_DEPTH = 4
+
     def __init__(self, database):
         """Initialize with database interface reference for cleaner access patterns"""
         self.database = database
@@ -45,7 +63,7 @@ class DocumentManager(ABC):
         # short-circut if the id is in the filter as there must be only one match
         id = inputs.get("Id") or inputs.get("id") if inputs else None
         if id:
-            doc, count = await self._get_impl(proper_name, str(id))
+            doc, count = await self._get_cached(proper_name, str(id))
         else:
             docs, count = await self._get_all_impl(proper_name, filter=inputs, page=1, pageSize=1, substring_match=False)
             doc = docs[0] if docs else None
@@ -76,8 +94,10 @@ class DocumentManager(ABC):
         page: int = 1,
         pageSize: int = 25,
         view_spec: Dict[str, Any] = {},
-        substring_match: bool = True
-    ) -> Tuple[List[Dict[str, Any]], int]:
+        substring_match: bool = True,
+        cursor: Optional[Dict[str, Any]] = None,
+        count_mode: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
         """
         Get paginated list of documents with explicit parameters.
 
@@ -89,21 +109,43 @@ class DocumentManager(ABC):
             pageSize: Number of items per page
             view_spec: View specification for field selection
             substring_match: True for substring matching (default), False for full string matching
+            cursor: Decoded keyset cursor - seek past the document it names instead of skipping to
+                    page (defaults to the request's ?cursor=)
+            count_mode: 'exact', 'estimate' (planner/metadata estimate or capped count) or 'none'
+                        (skip the count) - defaults to the request's ?count=
 
         Returns:
-            Tuple of (documents, total_count)
+            Tuple of (documents, total_count) - total_count is None when count_mode is 'none'.
+            Count kind, hasMore and the cursor for the following page are left in
+            RequestContext.get_page_info().
         """
         GatingService.permitted(entity, 'r')  # check for bypass, login and rbac
         if not await HookService.call_preflight(entity, 'get_all'):
             return [], 0
 
+        # ?cursor= and ?count= apply to the request's own entity only
+        own_entity = entity.lower() == RequestContext.get_entity().lower()
+        if cursor is None and own_entity:
+            cursor = RequestContext.get_cursor()
+        if count_mode is None:
+            count_mode = RequestContext.get_count_mode() if own_entity else 'exact'
+        keyset = self._keyset_sort(entity, sort)
+        if cursor and cursor['v'] and not matches_sort(cursor, keyset):
+            Notification.error(HTTP.BAD_REQUEST, "Cursor does not match the requested sort. Restart paging without a cursor")
+
         try:
             id = filter.get('id') or filter.get('Id') if filter else None
             if id:
-                doc, count = await self._get_impl(entity, str(id))
+                doc, count = await self._get_cached(entity, str(id))
                 docs = [doc]
+                RequestContext.set_page_info('exact', False, None)
             else:
-                docs, count = await self._get_all_impl(entity, sort, filter, page, pageSize, substring_match)
+                started = time.perf_counter()
+                docs, count = await self._get_all_impl(entity, sort, filter, page, pageSize, substring_match, cursor, count_mode)
+                RequestContext.record_query_shape(entity, filter, sort, substring_match, time.perf_counter() - started)
+                has_more = len(docs) > pageSize
+                docs = docs[:pageSize]  # drop the look-ahead row
+                RequestContext.set_page_info(count_mode, has_more, self._next_cursor(keyset, docs, has_more))
 
             if docs:
                 # Get the model class for validation
@@ -113,11 +155,20 @@ class DocumentManager(ABC):
                 metadata = MetadataService.get(entity)
                 unique_constraints = metadata.get('uniques', []) if metadata else []
 
+                # Check the whole page against unique constraints - one query per constraint
+                if validate and unique_constraints:
+                    await validate_uniques_bulk(entity, docs, unique_constraints)
+
+                # Resolve FK records for the whole page up front - one driver call per FK entity
+                fk_docs = await self._prefetch_fks(entity, docs, validate, view_spec)
+
                 # Process each document
                 for i in range(len(docs)):
-                    docs[i] = await self._normalize_document(entity, docs[i], model_class, view_spec, unique_constraints, validate)
+                    docs[i] = await self._normalize_document(entity, docs[i], model_class, view_spec, validate, fk_docs)
 
             return await HookService.call_postflight(entity, 'get_all', docs, count)
+        except StopWorkError:
+            raise  # already reported (e.g. expired cursor)
         except Exception as e:
             Notification.error(HTTP.INTERNAL_ERROR, f"Database get_all error: {str(e)}")
             raise  # Unreachable but satisfies type checker
@@ -130,10 +181,84 @@ class DocumentManager(ABC):
         filter: Optional[Dict[str, Any]] = None,
         page: int = 1,
         pageSize: int = 25,
+        substring_match: bool = True,
+        cursor: Optional[Dict[str, Any]] = None,
+        count_mode: str = 'exact'
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Database-specific implementation of get_all with substring matching flag
+
+        Results must be ordered by _keyset_sort(entity, sort). When cursor has values, seek past
+        them (ignoring page) instead of skipping rows. Return up to pageSize + 1 rows - the extra
+        look-ahead row tells get_all whether another page follows.
+
+        count_mode: 'exact' counts every matching row; 'estimate' may use planner statistics,
+        collection metadata or a capped count (ESTIMATE_COUNT_CAP); 'none' skips the count and
+        returns None as the total.
+        """
+        pass
+
+    async def export(
+        self,
+        entity: str,
+        sort: Optional[List[Tuple[str, str]]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        substring_match: bool = True
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream every document matching filter, in sort order, in batches of EXPORT_BATCH_SIZE.
+        Driven by a server-side cursor - no count, no OFFSET and no per-document validation,
+        so memory stays flat however large the entity is.
+
+        Args:
+            entity: Entity type (e.g., "user", "account")
+            sort: List of (field, direction) tuples - the id tiebreaker is added as for get_all
+            filter: Filter conditions in get_all syntax
+            substring_match: True for substring matching (default), False for full string matching
+
+        Yields:
+            Lists of documents with 'id' first and FK sub-objects removed
+        """
+        GatingService.permitted(entity, 'r')  # check for bypass, login and rbac
+        if not await HookService.call_preflight(entity, 'get_all'):
+            return
+
+        id_field = self._get_core_manager().id_field
+        async for batch in self._stream_impl(entity, sort, filter, substring_match):
+            docs = [{'id': doc.pop(id_field, None), **self._remove_sub_objects(entity, doc)} for doc in batch]
+            # same postflight as a get_all page, so hooks see exported documents too
+            docs, _ = await HookService.call_postflight(entity, 'get_all', docs, len(docs))
+            yield docs
+
+    @abstractmethod
+    def _stream_impl(
+        self,
+        entity: str,
+        sort: Optional[List[Tuple[str, str]]] = None,
+        filter: Optional[Dict[str, Any]] = None,
         substring_match: bool = True
-    ) -> Tuple[List[Dict[str, Any]], int]:
-        """Database-specific implementation of get_all with substring matching flag"""
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Database-specific export: an async generator of raw document batches (up to
+        EXPORT_BATCH_SIZE each) in _keyset_sort(entity, sort) order, read through a server-side
+        cursor (or page by page, seeking past the last row) so only one batch is held at a time"""
         pass
+
+    def _keyset_sort(self, entity: str, sort: Optional[List[Tuple[str, str]]]) -> List[Tuple[str, str]]:
+        """Proper-cased sort fields with an 'id' tiebreaker, so every row has a unique sort key"""
+        keyset = [(MetadataService.get_proper_name(entity, field) or field, direction.lower()) for field, direction in (sort or [])]
+        if not any(field == 'id' for field, _ in keyset):
+            keyset.append(('id', 'asc'))
+        return keyset
+
+    def _next_cursor(self, keyset: List[Tuple[str, str]], docs: List[Dict[str, Any]], has_more: bool) -> Optional[str]:
+        """Cursor token naming the last document of the page (None when there is no next page)"""
+        if not docs or not has_more:
+            return None
+        return encode_cursor({'s': sort_fingerprint(keyset), 'v': self._cursor_values(keyset, docs[-1])})
+
+    def _cursor_values(self, keyset: List[Tuple[str, str]], doc: Dict[str, Any]) -> List[Any]:
+        """Sort key of a raw document, in keyset order. Drivers override when the key isn't the raw value."""
+        id_field = self._get_core_manager().id_field
+        return [doc.get(id_field if field == 'id' else field) for field, _ in keyset]
     
     async def get(
         self,
@@ -157,14 +282,17 @@ class DocumentManager(ABC):
             return {}, 0
 
         try:
-            doc, count = await self._get_impl(entity, id)
+            doc, count = await self._get_cached(entity, id)
             if count > 0 and doc:
                 model_class = ModelService.get_model_class(entity)
                 validate = Config.validation(False)
                 metadata = MetadataService.get(entity)
                 unique_constraints = metadata.get('uniques', []) if metadata else []
 
-                doc = await self._normalize_document(entity, doc, model_class, view_spec, unique_constraints, validate)
+                if validate and unique_constraints:
+                    await validate_uniques_bulk(entity, [doc], unique_constraints)
+
+                doc = await self._normalize_document(entity, doc, model_class, view_spec, validate)
 
             doc, count = await HookService.call_postflight(entity, 'get', doc, count)
             return (doc, count) if doc else ({}, count)
@@ -173,19 +301,19 @@ class DocumentManager(ABC):
             Notification.warning(Warning.NOT_FOUND, message=msg, entity=entity, entity_id=id)
             Notification.error(HTTP.NOT_FOUND, msg, entity=entity, entity_id=id)
             # Only re-raise if not suppressed (during FK lookups, we suppress and handle count=0 separately)
-            if not Notification._suppress_errors:
+            if not Notification.errors_suppressed():
                 raise
             # If suppressed, return empty result - caller will check count
             return {}, 0
         except Exception as e:
             # Only raise general exceptions if not suppressed
-            if not Notification._suppress_errors:
+            if not Notification.errors_suppressed():
                 Notification.error(HTTP.INTERNAL_ERROR, f"Database get error: {str(e)}", entity=entity, entity_id=id)
             # If suppressed, return empty result
             return {}, 0
 
     async def _normalize_document(self, entity: str, doc: Dict[str, Any], model_class: Any, view_spec: Dict[str, Any], 
-                                  unique_constraints : List[Any], validate: bool) -> Dict[str, Any]:
+                                  validate: bool, fk_docs: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None) -> Dict[str, Any]:
         """Normalize document by extracting internal id field and renaming to 'id'"""
         try:
             # make sure the id is in the right plae
@@ -198,31 +326,86 @@ class DocumentManager(ABC):
             # Always run Pydantic validation (required fields, types, ranges)
             validate_model(model_class, the_doc, entity)
 
-            if validate:
-                await validate_uniques(entity, the_doc, unique_constraints, None)
-
             # Populate view data if requested and validate fks
             # if view_spec is None:
             #     view_spec = {}
-            await process_fks(entity, the_doc, validate, view_spec)
+            await process_fks(entity, the_doc, validate, view_spec, fk_docs)
 
         except DocumentNotFound as e:
             msg = str(e.message) if e.message else str(e.error)
             Notification.warning(Warning.NOT_FOUND, message=msg, entity=entity, entity_id=id)
             Notification.error(HTTP.NOT_FOUND, msg, entity=entity, entity_id=id)
             # Only re-raise if not suppressed (during FK lookups, we suppress and handle count=0 separately)
-            if not Notification._suppress_errors:
+            if not Notification.errors_suppressed():
                 raise
             # If suppressed, continue with empty doc (will be handled by caller)
         except Exception as e:
             # Only raise general exceptions if not suppressed
-            if not Notification._suppress_errors:
+            if not Notification.errors_suppressed():
                 Notification.error(HTTP.INTERNAL_ERROR, f"Database retrieve error: {str(e)}", entity=entity, entity_id=id)
             # If suppressed, continue with the_doc as is
 
         return the_doc or {}
 
-                                    
+    async def _prefetch_fks(self, entity: str, docs: List[Dict[str, Any]], validate: bool,
+                            view_spec: Dict[str, Any]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Fetch every FK record referenced by a page of raw documents.
+        Distinct ids are collected per FK entity and fetched with a single driver call each.
+
+        Returns:
+            Dict of FK entity -> {id: normalized FK document}; missing ids are simply absent
+        """
+        wanted: Dict[str, set] = {}
+        for field, descriptor in MetadataService.descriptors(entity).items():
+            # same selection as process_fks - only FKs that will actually be looked up
+            fk_entity = descriptor['fk_entity']
+            if fk_entity and (validate or field[:-2].lower() in view_spec.keys()):
+                ids = wanted.setdefault(fk_entity, set())
+                ids.update(doc[field] for doc in docs if doc.get(field))
+
+        core = self._get_core_manager()
+        fk_docs: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for fk_entity, ids in wanted.items():
+            found: Dict[str, Dict[str, Any]] = {}
+            missing = []
+            for id in ids:
+                doc = self._get_from_caches(fk_entity, id)
+                if doc is None:
+                    missing.append(id)
+                else:
+                    found[id] = {'id': id, **{k: v for k, v in doc.items() if k != core.id_field}}
+            if missing:
+                for doc in await self._get_many_impl(fk_entity, missing):
+                    self._put_in_caches(fk_entity, doc[core.id_field], doc)
+                    id = doc.pop(core.id_field, None)
+                    found[id] = {'id': id, **doc}
+            fk_docs[fk_entity] = found
+        return fk_docs
+
+    async def _get_cached(self, entity: str, id: str) -> Tuple[Dict[str, Any], int]:
+        """_get_impl behind the request identity map and the process-wide entity cache"""
+        doc = self._get_from_caches(entity, id)
+        if doc is not None:
+            return doc, 1
+        doc, count = await self._get_impl(entity, id)
+        if count == 1 and doc:
+            self._put_in_caches(entity, id, doc)
+        return doc, count
+
+    def _get_from_caches(self, entity: str, id: str) -> Optional[Dict[str, Any]]:
+        """Raw document from the request identity map, else the entity cache (promoted to the map)"""
+        doc = RequestContext.identity_get(entity, id)
+        if doc is None:
+            doc = EntityCache.get(entity, id)
+            if doc is not None:
+                RequestContext.identity_put(entity, id, doc)
+        return doc
+
+    def _put_in_caches(self, entity: str, id: str, doc: Dict[str, Any]) -> None:
+        RequestContext.identity_put(entity, id, doc)
+        EntityCache.put(entity, id, doc)
+
     @abstractmethod
     async def _get_impl(
         self,
@@ -231,6 +414,12 @@ class DocumentManager(ABC):
     ) -> Tuple[Dict[str, Any], int]:
         """Database-specific implementation of get by ID"""
         pass
+
+    @abstractmethod
+    async def _get_many_impl(self, entity: str, ids: List[str]) -> List[Dict[str, Any]]:
+        """Database-specific implementation of get for a set of IDs in one round trip.
+        IDs that do not exist are omitted from the result."""
+        pass
     
     async def _save_document(
         self,
@@ -269,7 +458,7 @@ class DocumentManager(ABC):
                 Notification.error(HTTP.BAD_REQUEST, "Missing 'id' field or value for update operation", entity=entity, field="id")
                 raise  # Unreachable
             try:
-                doc, count = await self._get_impl(entity, id)  # only check for existance - no validation
+                doc, count = await self._get_cached(entity, id)  # only check for existance - no validation
                 if count == 0:
                     Notification.error(HTTP.NOT_FOUND, f"Document to update not found: {id}", entity=entity, entity_id=id)
             except DocumentNotFound:
@@ -304,7 +493,8 @@ class DocumentManager(ABC):
                     doc = await self._update_impl(entity, id, prepared_data)
                 else:
                     doc = await self._create_impl(entity, id, prepared_data)
-                doc, count = await HookService.call_postflight(entity, operation, doc, 1)
+                RequestContext.identity_evict(entity, id)
+                doc, count = await HookService.call_postflight(entity, operation, doc, 1, id=id)
                 return (doc, count) if doc else ({}, count)
             except DuplicateConstraintError as e:
                 # Use handle_duplicate_constraint which includes field info
@@ -362,18 +552,246 @@ class DocumentManager(ABC):
 
         try:
             doc, count = await self._delete_impl(entity, id)
-            doc, count = await HookService.call_postflight(entity, 'delete', doc if doc else {}, count)
+            RequestContext.identity_evict(entity, id)
+            doc, count = await HookService.call_postflight(entity, 'delete', doc if doc else {}, count, id=id)
             return (doc, count) if doc else ({}, count)
         except DocumentNotFound:
             # Idempotent DELETE: already gone = success
-            _, count = await HookService.call_postflight(entity, 'delete', {}, 0)
+            RequestContext.identity_evict(entity, id)
+            _, count = await HookService.call_postflight(entity, 'delete', {}, 0, id=id)
             return {}, 0
 
     @abstractmethod
     async def _delete_impl(self, entity: str, id: str) -> Tuple[Dict[str, Any], int]:
         """Database-specific implementation of delete"""
         pass
-    
+
+    async def bulk_save(self, entity: str, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create, update and delete a batch of documents with a single driver batch write.
+
+        Each item is {"op": "create"|"update"|"delete", "id": ..., "data": {...}}; an item without
+        "op" or "data" is a bare document to create. The batch is validated up front (Pydantic,
+        one existence lookup, one FK lookup per FK entity) and a failing item does not stop the rest.
+
+        Args:
+            entity: Entity type (e.g., "user", "account")
+            items: Batch items in request order
+
+        Returns:
+            Per-item status in request order: {"index", "op", "id", "status"}, plus "error" (and
+            "field" when known) for items that were not written
+        """
+        if len(items) > self.BULK_MAX_ITEMS:
+            Notification.error(HTTP.BAD_REQUEST, f"Bulk request has {len(items)} items - the limit is {self.BULK_MAX_ITEMS}", entity=entity)
+
+        results: List[Dict[str, Any]] = []
+        pending: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []     # (result, data) still in play
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                result = {'index': index, 'op': None, 'id': None, 'status': None}
+                results.append(result)
+                # a ValueError stands in for an import row that could not be parsed
+                message = str(item) if isinstance(item, ValueError) else "Bulk item must be an object"
+                self._bulk_fail(entity, result, HTTP.BAD_REQUEST, message)
+                continue
+
+            if 'op' in item or 'data' in item:
+                op = str(item.get('op') or 'create').lower()
+                data = dict(item.get('data') or {})
+                id = item.get('id') or data.get('id')
+            else:
+                op, data, id = 'create', dict(item), item.get('id')
+            data.pop('id', None)
+            result = {'index': index, 'op': op, 'id': str(id or '').strip().lower() or None, 'status': None}
+            results.append(result)
+
+            if op not in self.BULK_OPERATIONS:
+                self._bulk_fail(entity, result, HTTP.BAD_REQUEST, f"Unknown bulk op '{op}'")
+            elif op != 'create' and not result['id']:
+                self._bulk_fail(entity, result, HTTP.BAD_REQUEST, f"Missing 'id' for {op} operation", field='id')
+            else:
+                pending.append((result, data))
+
+        # One permission check per operation type - a denied operation stops the whole batch
+        for op in {result['op'] for result, _ in pending}:
+            GatingService.permitted(entity, op)
+
+        checked = []
+        for result, data in pending:
+            op = result['op']
+            context = {'id': result['id']} if op == 'delete' else {}
+            if not await HookService.call_preflight(entity, op, **context):
+                result['status'] = HTTP.OK
+                continue
+            if op != 'delete':
+                model_class = ModelService.get_create_class(entity) if op == 'create' else ModelService.get_update_class(entity)
+                try:
+                    data = model_class.model_validate(data).model_dump()
+                except PydanticValidationError as e:
+                    error = e.errors()[0]
+                    field = str(error['loc'][-1]) if error.get('loc') else None
+                    self._bulk_fail(entity, result, HTTP.UNPROCESSABLE, error.get('msg', 'Validation error'), field=field)
+                    continue
+                data.pop('id', None)
+                if not result['id']:
+                    result['id'] = str(ULID()).lower()
+            checked.append((result, data))
+
+        # Updates and deletes need an existing document - one lookup for the whole batch
+        wanted = [result['id'] for result, _ in checked if result['op'] != 'create']
+        id_field = self._get_core_manager().id_field
+        existing = {doc[id_field] for doc in await self._get_many_impl(entity, wanted)} if wanted else set()
+
+        # FK targets are fetched once per FK entity for the whole batch
+        written_data = [data for result, data in checked if result['op'] != 'delete']
+        fk_docs = await self._prefetch_fks(entity, written_data, True, {}) if written_data else {}
+        fk_fields = [(field, descriptor['fk_entity']) for field, descriptor in MetadataService.descriptors(entity).items()
+                     if descriptor['fk_entity']]
+
+        ops: List[Tuple[str, str, Dict[str, Any]]] = []
+        staged: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+        for result, data in checked:
+            op, id = result['op'], result['id']
+            if op != 'create' and id not in existing:
+                if op == 'update':
+                    self._bulk_fail(entity, result, HTTP.NOT_FOUND, f"Document to update not found: {id}")
+                else:
+                    # Idempotent delete: already gone = success
+                    RequestContext.identity_evict(entity, id)
+                    await HookService.call_postflight(entity, op, {}, 0, id=id)
+                    result['status'] = HTTP.OK
+                continue
+            if op != 'delete':
+                missing = next(((field, data[field]) for field, fk_entity in fk_fields
+                                if data.get(field) and data[field] not in fk_docs.get(fk_entity, {})), None)
+                if missing:
+                    self._bulk_fail(entity, result, HTTP.UNPROCESSABLE, f"Id {missing[1]} does not exist", field=missing[0])
+                    continue
+                prepared = self._remove_sub_objects(entity, self._prepare_datetime_fields(entity, data))
+            else:
+                prepared = {}
+            ops.append((op, id, prepared))
+            staged.append((result, data))
+
+        outcomes = await self._bulk_write_impl(entity, ops) if ops else []
+        for (result, data), error in zip(staged, outcomes):
+            op, id = result['op'], result['id']
+            if error is None:
+                result['status'] = HTTP.CREATED if op == 'create' else HTTP.OK
+                RequestContext.identity_evict(entity, id)
+                doc = {} if op == 'delete' else {'id': id, **data}
+                await HookService.call_postflight(entity, op, doc, 1, id=id)
+            elif isinstance(error, DuplicateConstraintError):
+                self._bulk_fail(entity, result, HTTP.CONFLICT, error.message, field=error.field)
+            elif isinstance(error, DocumentNotFound):
+                self._bulk_fail(entity, result, HTTP.NOT_FOUND, f"Document to {op} not found: {id}")
+            else:
+                self._bulk_fail(entity, result, getattr(error, 'status_code', HTTP.INTERNAL_ERROR), f"{op} error: {str(error)}")
+        return results
+
+    def _bulk_fail(self, entity: str, result: Dict[str, Any], status: int, message: str, field: Optional[str] = None) -> None:
+        """Mark a bulk item as failed and add the matching warning (the batch itself carries on)"""
+        result['status'] = status
+        result['error'] = message
+        if field:
+            result['field'] = field
+        warning_type = {HTTP.NOT_FOUND: Warning.NOT_FOUND, HTTP.CONFLICT: Warning.UNIQUE_VIOLATION}.get(status, Warning.DATA_VALIDATION)
+        Notification.warning(warning_type, message, entity=entity, entity_id=result['id'] or f"#{result['index']}", field=field or '')
+
+    async def _bulk_write_impl(self, entity: str, ops: List[Tuple[str, str, Dict[str, Any]]]) -> List[Optional[Exception]]:
+        """
+        Database-specific batch write. Drivers override this with their native batch API;
+        the default writes one document at a time.
+
+        Args:
+            entity: Entity type
+            ops: (operation, id, prepared data) in request order - data is empty for deletes
+
+        Returns:
+            Outcome per op, aligned with ops: None when written, else the exception for that op
+            (DuplicateConstraintError, DocumentNotFound, DatabaseError)
+        """
+        outcomes: List[Optional[Exception]] = []
+        for op, id, data in ops:
+            try:
+                if op == 'create':
+                    await self._create_impl(entity, id, data)
+                elif op == 'update':
+                    await self._update_impl(entity, id, data)
+                else:
+                    await self._delete_impl(entity, id)
+                outcomes.append(None)
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
+    async def import_rows(self, entity: str, rows: AsyncIterator[Any]) -> AsyncIterator[Tuple[List[Any], List[Dict[str, Any]]]]:
+        """
+        Create every row of a stream of any size through bulk_save, IMPORT_BATCH_SIZE rows at a time.
+
+        Rows are read and batched by a separate task feeding a queue of at most IMPORT_QUEUE_DEPTH
+        batches: the next batch is parsed while the current one is written, and a database that falls
+        behind holds up the reader instead of letting rows pile up in memory.
+
+        Args:
+            entity: Entity type (e.g., "event", "url")
+            rows: Documents to create, in order - a ValueError in place of a row is a row that could
+                  not be parsed; it is reported as failed and the import carries on
+
+        Yields:
+            (rows, results) per batch - results as bulk_save returns them, with 'index' counted
+            from the start of the stream
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.IMPORT_QUEUE_DEPTH)
+
+        async def read_batches() -> None:
+            batch: List[Any] = []
+            try:
+                async for row in rows:
+                    batch.append(row)
+                    if len(batch) == self.IMPORT_BATCH_SIZE:
+                        await queue.put(batch)
+                        batch = []
+                if batch:
+                    await queue.put(batch)
+                await queue.put(None)
+            except Exception as e:
+                await queue.put(e)  # e.g. the client went away - surfaces in the writer
+
+        reader = asyncio.create_task(read_batches())
+        offset = 0
+        try:
+            await self._begin_ingest(entity)
+            while (batch := await queue.get()) is not None:
+                if isinstance(batch, Exception):
+                    raise batch
+                items = [{'op': 'create', 'data': row} if isinstance(row, dict) else row for row in batch]
+                # failures come back per row - don't also collect a warning for each one
+                with Notification.suppress_warnings():
+                    results = await self.bulk_save(entity, items)
+                for result in results:
+                    result['index'] += offset
+                offset += len(batch)
+                # FK targets looked up for this batch needn't stay in the identity map for the rest
+                RequestContext.identity_clear()
+                yield batch, results
+        finally:
+            reader.cancel()
+            await self._end_ingest(entity)
+
+    async def _begin_ingest(self, entity: str) -> None:
+        """
+        Called before an import writes its first batch. Drivers whose write path is held back
+        by per-write bookkeeping (e.g. an index refresh) can switch to a load-friendly mode here.
+        Concurrent imports into one entity each call this; the default does nothing.
+        """
+        return None
+
+    async def _end_ingest(self, entity: str) -> None:
+        """Called once an import ends, however it ends (a _begin_ingest that raised included) - undoes _begin_ingest"""
+        return None
+
     @abstractmethod
     def _get_core_manager(self) -> CoreManager:
         """Get the core manager instance from the concrete implementation"""
@@ -406,6 +824,26 @@ class DocumentManager(ABC):
         """
         pass
 
+    @abstractmethod
+    async def _find_duplicate_uniques(
+        self,
+        entity: str,
+        constraint_fields: List[str],
+        docs: List[Dict[str, Any]]
+    ) -> set:
+        """Find which of the docs' values for one unique constraint are stored more than once
+        (database-specific, one query per call)
+
+        Args:
+            entity: Entity type
+            constraint_fields: Fields of one unique constraint
+            docs: Raw documents (a page) whose values are checked
+
+        Returns:
+            Set of value tuples, as they appear in docs, held by more than one stored document
+        """
+        pass
+
     def _remove_sub_objects(self, entity: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Remove any sub-objects from the data before storing in the database"""
         # look for any <field>id that are ObjectId types and remove the corresponding <field> sub-object
@@ -501,6 +939,39 @@ async def validate_uniques(entity: str, data: Dict[str, Any], unique_constraints
         # Note: MongoDB will throw DuplicateKeyError, Elasticsearch handles in _validate_unique_constraints
 
 
+async def validate_uniques_bulk(entity: str, docs: List[Dict[str, Any]], unique_constraints: List[List[str]]) -> None:
+    """
+    Worker function: Set-based unique constraint validation for documents read from the database.
+    Runs one duplicate query per constraint for the whole page instead of one query per document,
+    and adds a unique_violation warning to every document holding a duplicated value.
+
+    Args:
+        entity: Entity type to validate
+        docs: Raw documents as returned by the driver
+        unique_constraints: List of unique constraint field groups
+    """
+    from app.db.factory import DatabaseFactory
+
+    db = DatabaseFactory.get_instance()
+    id_field = db.core.id_field
+    for constraint_fields in unique_constraints:
+        duplicates = await db.documents._find_duplicate_uniques(entity, constraint_fields, docs)
+        if not duplicates:
+            continue
+
+        # Use first field in constraint (matches create/update reporting)
+        duplicate_field = constraint_fields[0]
+        for doc in docs:
+            if tuple(doc.get(field) for field in constraint_fields) in duplicates:
+                error = DuplicateConstraintError(
+                    message=f"{duplicate_field.capitalize()} is not unique",
+                    entity=entity,
+                    field=duplicate_field,
+                    entity_id=doc.get(id_field)
+                )
+                Notification.handle_duplicate_constraint(error, is_validation=True)
+
+
 def validate_model(cls, data: Dict[str, Any], entity_name: str):
     """
     Worker function: Validate data with Pydantic and convert errors to notifications.
@@ -526,10 +997,12 @@ def validate_model(cls, data: Dict[str, Any], entity_name: str):
         return cls.model_construct(**data)
 
 
-async def process_fks(entity: str, data: Dict[str, Any], validate: bool, view_spec: Dict[str, Any] = {}) -> Any:
+async def process_fks(entity: str, data: Dict[str, Any], validate: bool, view_spec: Dict[str, Any] = {},
+                      fk_docs: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None) -> Any:
     """
     Unified FK processing: validation + view population in single pass.
     Only makes DB calls when data is actually needed.
+    FK entities present in fk_docs (see DocumentManager._prefetch_fks) are resolved from it instead.
     return bad FK name if validate mode or True
     """
     
@@ -549,10 +1022,15 @@ async def process_fks(entity: str, data: Dict[str, Any], validate: bool, view_sp
                     fk_cls = ModelService.get_model_class(fk_entity)
                     
                     if fk_cls:
-                        # Fetch FK record - suppress all notifications during lookup
-                        # We'll add appropriate error/warning based on validate flag below
-                        with Notification.suppress():
-                            related_data, count = await fk_cls.get(fk_field_id, None)
+                        if fk_docs is not None and fk_entity in fk_docs:
+                            # Already fetched with the rest of the page
+                            related_data = fk_docs[fk_entity].get(fk_field_id, {})
+                            count = 1 if related_data else 0
+                        else:
+                            # Fetch FK record - suppress all notifications during lookup
+                            # We'll add appropriate error/warning based on validate flag below
+                            with Notification.suppress():
+                                related_data, count = await fk_cls.get(fk_field_id, None)
 
                         if count == 0:
                             # FK record not found - handle based on validate flag
@@ -3,9 +3,11 @@ Elasticsearch core, entity, and index operations implementation.
 Contains ElasticsearchCore, ElasticsearchEntities, ElasticsearchIndexes and ElasticsearchDatabase classes.
 """
 
+import copy
 import logging
+import re
 import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 from elasticsearch import AsyncElasticsearch
 
 from ..base import DatabaseInterface
@@ -56,10 +58,18 @@ class ElasticsearchCore(CoreManager):
         }
     }
 
+    # Subfield of a searchable String field that substring filters run against. A wildcard field
+    # indexes n-grams of the value, so '*value*' doesn't walk the whole term dictionary.
+    SEARCH_SUBFIELD = "search"
+
     def __init__(self, database):
         super().__init__(database)
         self._client: Optional[AsyncElasticsearch] = None
         self._database_name: str = ""
+        # Indices known to exist - saves an indices.exists round trip before every operation
+        self._indices: Set[str] = set()
+        # index -> searchable fields mapped before they had the search subfield (until /api/db/init)
+        self._unsearchable: Dict[str, Set[str]] = {}
     
     @property
     def id_field(self) -> str:
@@ -81,6 +91,7 @@ class ElasticsearchCore(CoreManager):
 
         # Create index template for simplified keyword approach
         await self._ensure_index_template()
+        await self._load_indices()
 
         # Validate existing mappings and set health state
         await self._validate_mappings_and_set_health()
@@ -133,15 +144,64 @@ class ElasticsearchCore(CoreManager):
 
             template_name = "app-keyword-template"
 
-            # Use the EXPECTED_TEMPLATE with dynamic index patterns
+            # Use the expected template with dynamic index patterns
             template_body = {
                 "index_patterns": index_patterns,
-                **self.EXPECTED_TEMPLATE
+                **self._expected_template()
             }
 
             await self._client.indices.put_index_template(name=template_name, body=template_body) # type: ignore
             logging.info(f"Created index template: {template_name}")
 
+    def _expected_template(self) -> Dict[str, Any]:
+        """EXPECTED_TEMPLATE plus a dynamic template, ahead of the catch-all, that gives every
+        searchable String field (per metadata) the search subfield"""
+        template = copy.deepcopy(self.EXPECTED_TEMPLATE)
+        names = sorted({field for entity in MetadataService.list_entities()
+                        for field in MetadataService.searchable_fields(entity)})
+        if names:
+            template["template"]["mappings"]["dynamic_templates"].insert(0, {
+                "searchable_strings": {
+                    "match_pattern": "regex",
+                    "match": f"^({'|'.join(re.escape(name) for name in names)})$",
+                    "match_mapping_type": "string",
+                    "mapping": {
+                        "type": "keyword",
+                        "normalizer": "lc",
+                        "fields": {self.SEARCH_SUBFIELD: {"type": "wildcard"}}
+                    }
+                }
+            })
+        return template
+
+    def has_search_subfield(self, index: str, field: str) -> bool:
+        """False for a searchable field of an index mapped before the subfield existed"""
+        return field not in self._unsearchable.get(index, ())
+
+    async def _load_indices(self) -> None:
+        """Fill the registry of known indices with every user index that exists now"""
+        response = await self.get_connection().indices.get_alias(index="*")
+        self._indices = {name for name in response.keys() if not name.startswith(".")}
+
+    async def index_exists(self, index: str) -> bool:
+        """Whether an index exists. Known indices are answered from the registry; an unknown one is
+        looked up once and remembered if it turns up (e.g. created by another worker)."""
+        if index in self._indices:
+            return True
+        if await self.get_connection().indices.exists(index=index):
+            self._indices.add(index)
+            return True
+        return False
+
+    def index_created(self, index: str) -> None:
+        """Record an index created (explicitly, or by writing to it)"""
+        self._indices.add(index)
+
+    def index_missing(self, index: str) -> None:
+        """Forget an index that turned out not to exist, e.g. after index_not_found_exception"""
+        self._indices.discard(index)
+        self._unsearchable.pop(index, None)
+
     async def _validate_mappings_and_set_health(self) -> None:
         """Validate mappings and template state, set health accordingly without terminating."""
         if self._client is not None and self._client.indices is not None:
@@ -181,6 +241,16 @@ class ElasticsearchCore(CoreManager):
                         response = await self._client.indices.get_mapping(index=index_name)
                         properties = response.get(index_name, {}).get("mappings", {}).get("properties", {})
 
+                        # Searchable fields mapped before the template had the search subfield
+                        entity = MetadataService.get_proper_name(index_name)
+                        missing = {field for field in (MetadataService.searchable_fields(entity) if entity else [])
+                                   if field in properties
+                                   and self.SEARCH_SUBFIELD not in properties[field].get("fields", {})}
+                        if missing:
+                            self._unsearchable[index_name] = missing
+                            violations.extend(f"{index_name}.{field}: searchable field missing '{self.SEARCH_SUBFIELD}' subfield"
+                                              for field in sorted(missing))
+
                         # Check each field follows our template rules
                         for field, field_mapping in properties.items():
                             # Skip ID fields (not covered by our template)
@@ -235,6 +305,8 @@ class ElasticsearchCore(CoreManager):
                 user_indices = []
 
             # Delete all user indices
+            self._indices.clear()
+            self._unsearchable.clear()
             for index_name in user_indices:
                 try:
                     await es.indices.delete(index=index_name)
@@ -406,7 +478,7 @@ class ElasticsearchCore(CoreManager):
                 if len(template_response.get("index_templates", [])) > 0:
                     # Template exists, check core structure (ignore index_patterns)
                     actual = template_response["index_templates"][0]["index_template"]["template"]
-                    expected = self.EXPECTED_TEMPLATE["template"]
+                    expected = self._expected_template()["template"]
                     template_ok = actual == expected
                 else:
                     template_ok = False
@@ -462,6 +534,9 @@ class ElasticsearchCore(CoreManager):
 class ElasticsearchIndexes(IndexManager):
     """Elasticsearch implementation of index operations (limited functionality)"""
 
+    # every field is already indexed (keyword+lc template) - nothing for the index advisor to add
+    secondary_indexes = False
+
     def __init__(self, database):
         super().__init__(database)
     
@@ -486,8 +561,9 @@ class ElasticsearchIndexes(IndexManager):
         es = self.database.core.get_connection()
 
         # Ensure index exists - template will apply keyword+lc normalizer automatically
-        if not await es.indices.exists(index=entity.lower()):
+        if not await self.database.core.index_exists(entity.lower()):
             await es.indices.create(index=entity.lower())
+            self.database.core.index_created(entity.lower())
 
         # For multi-field unique constraints, create hash field with lc normalizer
         if len(fields) > 1:
@@ -519,7 +595,7 @@ class ElasticsearchIndexes(IndexManager):
         metadata = MetadataService.get(entity)
         expected_uniques = metadata.get('uniques', [])
 
-        if not await es.indices.exists(index=entity.lower()):
+        if not await self.database.core.index_exists(entity.lower()):
             # Index doesn't exist yet - return empty list
             # (create() will create the index when called)
             return []
@@ -5,34 +5,90 @@ Contains the ElasticsearchDocuments class with CRUD operations.
 
 import logging
 import uuid
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from elasticsearch.exceptions import NotFoundError
 
 from ..document_manager import DocumentManager
 from ..core_manager import CoreManager
+from app.core.cursor import encode_cursor, sort_fingerprint
 from app.core.exceptions import DocumentNotFound, DatabaseError, DuplicateConstraintError
 from app.core.metadata import MetadataService
-from app.core.notify import Notification
+from app.core.notify import Notification, HTTP
 from app.core.request_context import RequestContext
 from app.core.config import Config
 
 
 class ElasticsearchDocuments(DocumentManager):
     """Elasticsearch implementation of document operations"""
-    
+
+    # How long a cursor's point-in-time stays open between page requests
+    PIT_KEEP_ALIVE = "2m"
+
+    # Index settings relaxed while an import runs; the originals come back when it ends
+    INGEST_SETTINGS = {"index.refresh_interval": "-1", "index.number_of_replicas": 0}
+
     def __init__(self, database):
         super().__init__(database)
+        # index -> {'imports': running imports, 'settings': values to restore,
+        #           'seen': {constraint fields: {normalized value: id}} written so far}
+        self._ingesting: Dict[str, Dict[str, Any]] = {}
+
+    def _refresh_mode(self, index: str) -> Any:
+        """Refresh for a single write: 'wait_for' under strict consistency, False when off.
+        While an import has refreshes disabled, 'wait_for' would block until it ends, so force one."""
+        if not Config.elasticsearch_strict_consistency() or RequestContext.get_no_consistency():
+            return False
+        return True if index in self._ingesting else 'wait_for'
+
+    def _index_gone(self, index: str, error: Exception) -> bool:
+        """True when an error says the index doesn't exist - it is dropped from the known indices"""
+        if 'index_not_found_exception' not in str(error):
+            return False
+        self.database.core.index_missing(index)
+        return True
+
+    async def _begin_ingest(self, entity: str) -> None:
+        """Stop periodic refreshes and drop replicas for the import; the first import into an index
+        records the current settings so the last one to finish can put them back. The import is
+        counted before any call is made, so _end_ingest unregisters it even if one of them fails."""
+        es = self.database.core.get_connection()
+        index = entity.lower()
 
-    def _get_proper_sort_fields(self, sort_fields: Optional[List[Tuple[str, str]]], entity: str) -> Optional[List[Tuple[str, str]]]:
-        """Get sort fields with proper case names"""
-        if not sort_fields:
-            return sort_fields
+        state = self._ingesting.get(index)
+        if state:
+            state['imports'] += 1
+            return
+        state = {'imports': 1, 'settings': {}, 'seen': {}}
+        self._ingesting[index] = state
+
+        if not await self.database.core.index_exists(index):
+            await es.indices.create(index=index)  # template applies keyword+lc mappings
+            self.database.core.index_created(index)
+        response = await es.indices.get_settings(index=index, name=list(self.INGEST_SETTINGS), flat_settings=True)
+        current = response.get(index, {}).get("settings", {})
+        # a setting that was never set explicitly is restored as None, i.e. back to the default
+        originals = {name: current.get(name) for name in self.INGEST_SETTINGS}
+        await es.indices.put_settings(index=index, settings=self.INGEST_SETTINGS)
+        state['settings'] = originals     # only once applied - otherwise there is nothing to restore
+
+    async def _end_ingest(self, entity: str) -> None:
+        """Restore the index settings and make everything written visible with one refresh"""
+        index = entity.lower()
+        state = self._ingesting.get(index)
+        if not state:
+            return
+        state['imports'] -= 1
+        if state['imports'] > 0:
+            return
+        del self._ingesting[index]
 
-        proper_sort = []
-        for field, direction in sort_fields:
-            proper_field = MetadataService.get_proper_name(entity, field)
-            proper_sort.append((proper_field, direction))
-        return proper_sort
+        es = self.database.core.get_connection()
+        try:
+            if state['settings']:
+                await es.indices.put_settings(index=index, settings=state['settings'])
+            await es.indices.refresh(index=index)
+        except Exception as e:
+            logging.error(f"Elasticsearch: failed to restore settings of {index} after import: {str(e)}")
 
     def _get_proper_filter_fields(self, filters: Optional[Dict[str, Any]], entity: str) -> Optional[Dict[str, Any]]:
         """Get filter dict with proper case field names"""
@@ -73,36 +129,60 @@ class ElasticsearchDocuments(DocumentManager):
         filter: Optional[Dict[str, Any]] = None,
         page: int = 1,
         pageSize: int = 25,
-        substring_match: bool = True
-    ) -> Tuple[List[Dict[str, Any]], int]:
-        """Get paginated list of documents"""
+        substring_match: bool = True,
+        cursor: Optional[Dict[str, Any]] = None,
+        count_mode: str = 'exact'
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Get paginated list of documents
+
+        Offset pages use from/size (limited by index.max_result_window). Cursor pages use
+        search_after against a point-in-time opened when the client first follows a cursor,
+        so the rest of the walk sees one snapshot at constant cost per page.
+        """
         self.database._ensure_initialized()
         es = self.database.core.get_connection()
 
         # Convert entity to lowercase for ES index names
         index_name = entity.lower()
 
-        if not await es.indices.exists(index=index_name):
+        if not await self.database.core.index_exists(index_name):
             return [], 0
 
         # Convert field names to proper case using metadata
-        proper_sort = self._get_proper_sort_fields(sort, entity)
         proper_filter = self._get_proper_filter_fields(filter, entity)
 
-        # Build query
+        # Build query - sort fields plus the id tiebreaker (keyset order)
         query_body = {
-            "from": self._calculate_pagination_offset(page, pageSize),
-            "size": pageSize,
-            "query": self._build_query_filter(proper_filter, entity, substring_match)
+            "size": pageSize + 1,  # one look-ahead hit for hasMore
+            "query": self._build_query_filter(proper_filter, entity, substring_match),
+            "sort": self._build_sort_spec(self._keyset_sort(entity, sort), entity),
+            # exact: count every hit; estimate: ES counts up to the cap then reports a lower bound
+            "track_total_hits": {'exact': True, 'estimate': self.ESTIMATE_COUNT_CAP, 'none': False}[count_mode]
         }
 
-        # Add sorting (only if sort spec is not empty)
-        sort_spec = self._build_sort_spec(proper_sort, entity)
-        if sort_spec:
-            query_body["sort"] = sort_spec
-
         # Execute query
-        response = await es.search(index=index_name, body=query_body)
+        pit_id = None
+        if cursor and cursor['v']:
+            pit_id = cursor.get('p')
+            query_body["search_after"] = cursor['v']
+            try:
+                if not cursor.get('p'):
+                    pit_id = (await es.open_point_in_time(index=index_name, keep_alive=self.PIT_KEEP_ALIVE))['id']
+                query_body["pit"] = {"id": pit_id, "keep_alive": self.PIT_KEEP_ALIVE}
+                response = await es.search(body=query_body)
+            except NotFoundError as e:
+                if self._index_gone(index_name, e):
+                    return [], 0
+                Notification.error(HTTP.BAD_REQUEST, "Cursor expired. Restart paging without a cursor", entity=entity)
+            pit_id = response.get("pit_id", pit_id)
+        else:
+            query_body["from"] = self._calculate_pagination_offset(page, pageSize)
+            try:
+                response = await es.search(index=index_name, body=query_body)
+            except NotFoundError as e:
+                if self._index_gone(index_name, e):
+                    return [], 0
+                raise
         hits = response.get("hits", {}).get("hits", [])
 
         documents = []
@@ -112,9 +192,78 @@ class ElasticsearchDocuments(DocumentManager):
             doc['id'] = hit['_id']
             documents.append(doc)
 
-        total_count = response.get("hits", {}).get("total", {}).get("value", 0)
+        if documents:
+            # search_after needs the hit's sort values, not _source values (normalized keywords).
+            # Attach them to the last document of the page (not the look-ahead hit).
+            last = min(len(hits), pageSize) - 1
+            documents[last]['_sort'] = hits[last].get('sort')
+            documents[last]['_pit'] = pit_id
+        if pit_id and len(hits) <= pageSize:
+            # Last page - release the point-in-time instead of waiting for keep_alive
+            await es.close_point_in_time(id=pit_id)
+
+        if count_mode == 'none':
+            total_count = None
+        else:
+            total_count = response.get("hits", {}).get("total", {}).get("value", 0)
 
         return documents, total_count
+
+    async def _stream_impl(
+        self,
+        entity: str,
+        sort: Optional[List[Tuple[str, str]]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        substring_match: bool = True
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream matching documents in keyset order - search_after batches against one
+        point-in-time, so the whole export sees a single snapshot. The PIT is closed when done."""
+        self.database._ensure_initialized()
+        es = self.database.core.get_connection()
+
+        index_name = entity.lower()
+        if not await self.database.core.index_exists(index_name):
+            return
+
+        proper_filter = self._get_proper_filter_fields(filter, entity)
+        query_body: Dict[str, Any] = {
+            "size": self.EXPORT_BATCH_SIZE,
+            "query": self._build_query_filter(proper_filter, entity, substring_match),
+            "sort": self._build_sort_spec(self._keyset_sort(entity, sort), entity),
+            "track_total_hits": False
+        }
+
+        try:
+            pit_id = (await es.open_point_in_time(index=index_name, keep_alive=self.PIT_KEEP_ALIVE))['id']
+        except NotFoundError as e:
+            if self._index_gone(index_name, e):
+                return
+            raise
+        try:
+            while True:
+                query_body["pit"] = {"id": pit_id, "keep_alive": self.PIT_KEEP_ALIVE}
+                response = await es.search(body=query_body)
+                pit_id = response.get("pit_id", pit_id)
+                hits = response.get("hits", {}).get("hits", [])
+                if not hits:
+                    break
+                yield [{**hit["_source"], 'id': hit['_id']} for hit in hits]
+                if len(hits) < self.EXPORT_BATCH_SIZE:
+                    break
+                query_body["search_after"] = hits[-1]["sort"]
+        finally:
+            await es.close_point_in_time(id=pit_id)
+
+    def _next_cursor(self, keyset: List[Tuple[str, str]], docs: List[Dict[str, Any]], has_more: bool) -> Optional[str]:
+        """search_after key of the last hit, plus the point-in-time id once one is open"""
+        last = docs[-1] if docs else {}
+        sort_values, pit_id = last.pop('_sort', None), last.pop('_pit', None)
+        if not has_more or sort_values is None:
+            return None
+        state: Dict[str, Any] = {'s': sort_fingerprint(keyset), 'v': sort_values}
+        if pit_id:
+            state['p'] = pit_id
+        return encode_cursor(state)
     
     async def _get_impl(
         self,
@@ -127,7 +276,7 @@ class ElasticsearchDocuments(DocumentManager):
 
         index = entity.lower()
 
-        if not await es.indices.exists(index=index):
+        if not await self.database.core.index_exists(index):
             raise DocumentNotFound(None, f"Index {index} does not exist")
 
         try:
@@ -137,8 +286,34 @@ class ElasticsearchDocuments(DocumentManager):
             doc['id'] = response['_id']
             return doc, 1
         except NotFoundError as e:
+            if self._index_gone(index, e):
+                raise DocumentNotFound(None, f"Index {index} does not exist")
             raise DocumentNotFound(e)
     
+    async def _get_many_impl(self, entity: str, ids: List[str]) -> List[Dict[str, Any]]:
+        """Get documents for a set of IDs with a single mget request"""
+        self.database._ensure_initialized()
+        es = self.database.core.get_connection()
+
+        index = entity.lower()
+
+        if not await self.database.core.index_exists(index):
+            return []
+
+        try:
+            response = await es.mget(index=index, ids=ids)
+        except NotFoundError as e:
+            if self._index_gone(index, e):
+                return []
+            raise
+        documents = []
+        for hit in response.get("docs", []):
+            if hit.get("found"):
+                doc = hit["_source"]
+                doc['id'] = hit['_id']
+                documents.append(doc)
+        return documents
+
     async def _delete_impl(self, entity: str, id: str) -> Tuple[Dict[str, Any], int]:
         """Delete document by ID"""
         self.database._ensure_initialized()
@@ -146,7 +321,7 @@ class ElasticsearchDocuments(DocumentManager):
 
         index = entity.lower()
 
-        if not await es.indices.exists(index=index):
+        if not await self.database.core.index_exists(index):
             return {}, 0
 
         # Elasticsearch doesn't return deleted doc automatically, so fetch it first
@@ -159,14 +334,15 @@ class ElasticsearchDocuments(DocumentManager):
             # Delete with optional refresh for consistency
             # This ensures deleted documents are immediately removed from search results,
             # preventing false duplicate errors when re-creating with same unique values
-            refresh_mode = 'wait_for' if (Config.elasticsearch_strict_consistency() and not RequestContext.get_no_consistency()) else False
-            delete_response = await es.delete(index=index, id=id, refresh=refresh_mode)
+            delete_response = await es.delete(index=index, id=id, refresh=self._refresh_mode(index))
             if delete_response.get("result") == "deleted":
                 return doc, 1
             else:
                 raise DatabaseError(f"Elasticsearch delete returned unexpected result: {delete_response.get('result')}")
 
-        except NotFoundError:
+        except NotFoundError as e:
+            if self._index_gone(index, e):
+                return {}, 0
             # ES driver exception → translate to our app exception
             raise DocumentNotFound(entity, id)
         except Exception as e:
@@ -189,8 +365,8 @@ class ElasticsearchDocuments(DocumentManager):
         # Can be disabled via:
         #   1. elasticsearch_strict_consistency=false config (global)
         #   2. ?no_consistency=true query param (per-request, for bulk loads)
-        refresh_mode = 'wait_for' if (Config.elasticsearch_strict_consistency() and not RequestContext.get_no_consistency()) else False
-        await es.index(index=index, id=id, body=data, refresh=refresh_mode)
+        await es.index(index=index, id=id, body=data, refresh=self._refresh_mode(index))
+        self.database.core.index_created(index)  # a first write creates the index
 
         # Return with 'id' for API response
         return {'id': id, **data}
@@ -198,7 +374,128 @@ class ElasticsearchDocuments(DocumentManager):
     async def _update_impl(self, entity: str, id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         # update is the same as create in ES - it will upsert
         return await self._create_impl(entity, id, data)
-    
+
+    async def _bulk_write_impl(self, entity: str, ops: List[Tuple[str, str, Dict[str, Any]]]) -> List[Optional[Exception]]:
+        """Write a batch with one _bulk request and a single refresh - no refresh at all during an
+        import, which refreshes once at the end.
+        Uniques are synthetic here, so the batch is checked against itself and the index first;
+        creates use op_type create so an existing id is a conflict rather than an overwrite."""
+        es = self.database.core.get_connection()
+        index = entity.lower()
+
+        outcomes: List[Optional[Exception]] = await self._find_bulk_unique_conflicts(entity, ops)
+        operations: List[Dict[str, Any]] = []
+        positions = []
+        for position, (op, id, data) in enumerate(ops):
+            if outcomes[position] is not None:
+                continue
+            if op == 'delete':
+                operations.append({"delete": {"_index": index, "_id": id}})
+            else:
+                action = "create" if op == 'create' else "index"
+                operations.append({action: {"_index": index, "_id": id}})
+                operations.append({**data, 'id': id})  # 'id' kept in _source for sorting
+            positions.append(position)
+
+        if not positions:
+            return outcomes
+
+        ingest = self._ingesting.get(index)
+        refresh_mode = False if ingest else self._refresh_mode(index)
+        response = await es.bulk(operations=operations, refresh=refresh_mode)
+        if any(op != 'delete' for op, _, _ in ops):
+            self.database.core.index_created(index)
+        for position, item in zip(positions, response.get("items", [])):
+            action, result = next(iter(item.items()))
+            error = result.get("error")
+            if not error or (action == "delete" and result.get("status") == 404):
+                continue
+            op, id, _ = ops[position]
+            if result.get("status") == 409:
+                outcomes[position] = DuplicateConstraintError(message="Id already exists", entity=entity, field='id', entity_id=id)
+            else:
+                outcomes[position] = DatabaseError(message=f"Elasticsearch bulk {op} error: {error.get('reason', error)}")
+
+        if ingest:
+            # not searchable until the import's final refresh - remember the unique values written
+            for constraint_fields, seen in ingest['seen'].items():
+                for position in positions:
+                    op, id, data = ops[position]
+                    values = [data.get(field) for field in constraint_fields]
+                    if op != 'delete' and outcomes[position] is None and None not in values:
+                        seen[self._unique_key(values)] = id
+        return outcomes
+
+    async def _find_bulk_unique_conflicts(self, entity: str, ops: List[Tuple[str, str, Dict[str, Any]]]) -> List[Optional[Exception]]:
+        """Synthetic unique check for a batch - one terms aggregation per constraint covers the whole batch.
+        A value conflicts if an earlier item in the batch or another stored document already holds it
+        (compared case-insensitively, as the lc normalizer does). During an import, values written by
+        earlier batches aren't searchable yet, so they are checked against the import's own record."""
+        outcomes: List[Optional[Exception]] = [None] * len(ops)
+        metadata = MetadataService.get(entity)
+        unique_constraints = metadata.get('uniques', []) if metadata else []
+        if not unique_constraints:
+            return outcomes
+
+        es = self.database.core.get_connection()
+        index = entity.lower()
+        index_exists = await self.database.core.index_exists(index)
+        ingest = self._ingesting.get(index)
+
+        for constraint_fields in unique_constraints:
+            seen = ingest['seen'].setdefault(tuple(constraint_fields), {}) if ingest else {}
+            wanted = {}    # normalized value -> first position holding it
+            for position, (op, id, data) in enumerate(ops):
+                values = [data.get(field) for field in constraint_fields]
+                if op == 'delete' or outcomes[position] is not None or None in values:
+                    continue
+                key = self._unique_key(values)
+                if key in wanted or seen.get(key, id) != id:
+                    outcomes[position] = self._bulk_duplicate(entity, constraint_fields, id)
+                else:
+                    wanted[key] = position
+            if not wanted or not index_exists:
+                continue
+
+            # bucket per value already stored, with up to two of the ids holding it
+            ids_agg = {"terms": {"field": "id", "size": 2}}
+            if len(constraint_fields) == 1:
+                field = constraint_fields[0]
+                query: Dict[str, Any] = {"terms": {field: [ops[position][2][field] for position in wanted.values()]}}
+                agg: Dict[str, Any] = {"terms": {"field": field, "size": len(wanted)}, "aggs": {"ids": ids_agg}}
+            else:
+                query = {"bool": {"should": [
+                    {"bool": {"filter": [{"term": {field: ops[position][2][field]}} for field in constraint_fields]}}
+                    for position in wanted.values()
+                ], "minimum_should_match": 1}}
+                agg = {"multi_terms": {"terms": [{"field": field} for field in constraint_fields], "size": len(wanted)},
+                       "aggs": {"ids": ids_agg}}
+
+            try:
+                response = await es.search(index=index, body={"query": query, "size": 0, "aggs": {"values": agg}})
+            except NotFoundError as e:
+                if self._index_gone(index, e):
+                    return outcomes
+                raise
+            for bucket in response.get("aggregations", {}).get("values", {}).get("buckets", []):
+                key = bucket["key"]
+                position = wanted.get(self._unique_key(key if isinstance(key, list) else [key]))
+                if position is None:
+                    continue
+                holders = [holder["key"] for holder in bucket.get("ids", {}).get("buckets", [])]
+                if any(holder != ops[position][1] for holder in holders):
+                    outcomes[position] = self._bulk_duplicate(entity, constraint_fields, ops[position][1])
+        return outcomes
+
+    @staticmethod
+    def _unique_key(values: List[Any]) -> Tuple[str, ...]:
+        return tuple(str(v).lower() for v in values)
+
+    def _bulk_duplicate(self, entity: str, constraint_fields: List[str], id: str) -> DuplicateConstraintError:
+        # Use first field in constraint (matches _validate_unique_constraints)
+        field = constraint_fields[0]
+        return DuplicateConstraintError(message=f"{field.capitalize()} already exists", entity=entity, field=field, entity_id=id)
+
     def _get_core_manager(self) -> CoreManager:
         """Get the core manager instance"""
         return self.database.core
@@ -229,7 +526,12 @@ class ElasticsearchDocuments(DocumentManager):
                     # Handle all 4 combinations of case_sensitive and substring_match
                     case_sensitive = Config.get("case_sensitive", False)
 
-                    if substring_match:
+                    if substring_match and self._use_search_subfield(entity, field):
+                        # Searchable field: wildcard on the n-gram backed subfield, which keeps the original case
+                        subfield = f"{field}.{self.database.core.SEARCH_SUBFIELD}"
+                        must_clauses.append({"wildcard": {subfield: {"value": f"*{str(value)}*",
+                                                                     "case_insensitive": not case_sensitive}}})
+                    elif substring_match:
                         # Substring matching: wildcard match (anywhere in string)
                         if case_sensitive:
                             # Case-sensitive: use value as-is
@@ -252,6 +554,12 @@ class ElasticsearchDocuments(DocumentManager):
 
         return {"bool": {"must": must_clauses}} if must_clauses else {"match_all": {}}
     
+    def _use_search_subfield(self, entity: str, field: str) -> bool:
+        """Whether substring filters on a field can target its search subfield"""
+        descriptor = MetadataService.descriptors(entity).get(field)
+        return bool(descriptor and descriptor['searchable']
+                    and self.database.core.has_search_subfield(entity.lower(), field))
+
     def _build_sort_spec(self, sort_fields: Optional[List[Tuple[str, str]]], entity: str) -> List[Dict[str, Any]]:
         """Build Elasticsearch sort specification
 
@@ -326,7 +634,7 @@ class ElasticsearchDocuments(DocumentManager):
         es = self.database.core.get_connection()
         index = entity.lower()
 
-        if not await es.indices.exists(index=index):
+        if not await self.database.core.index_exists(index):
             return True  # No existing docs to check against
 
         for constraint_fields in unique_constraints:
@@ -347,10 +655,15 @@ class ElasticsearchDocuments(DocumentManager):
             if exclude_id:
                 query["bool"]["must_not"] = [{"term": {"_id": exclude_id}}]
 
-            response = await es.search(
-                index=index,
-                body={"query": query, "size": 1}
-            )
+            try:
+                response = await es.search(
+                    index=index,
+                    body={"query": query, "size": 1}
+                )
+            except NotFoundError as e:
+                if self._index_gone(index, e):
+                    return True
+                raise
 
             if response.get("hits", {}).get("total", {}).get("value", 0) > 0:
                 # Use first field in constraint (matches MongoDB pattern)
@@ -369,4 +682,55 @@ class ElasticsearchDocuments(DocumentManager):
                 Notification.handle_duplicate_constraint(error)
                 # Execution never reaches here - StopWorkError raised above
 
-        return True
\ No newline at end of file
+        return True
+
+    async def _find_duplicate_uniques(
+        self,
+        entity: str,
+        constraint_fields: List[str],
+        docs: List[Dict[str, Any]]
+    ) -> set:
+        """Find duplicated unique values with a single terms (or multi_terms) aggregation
+
+        Only the page's values are aggregated; buckets with doc_count >= 2 are duplicates.
+        Bucket keys come back lc-normalized, so they are matched case-insensitively.
+        """
+        values = {tuple(doc.get(field) for field in constraint_fields) for doc in docs}
+        values = {value for value in values if None not in value}
+        if not values:
+            return set()
+
+        es = self.database.core.get_connection()
+        index = entity.lower()
+
+        if not await self.database.core.index_exists(index):
+            return set()
+
+        if len(constraint_fields) == 1:
+            field = constraint_fields[0]
+            query: Dict[str, Any] = {"terms": {field: [value[0] for value in values]}}
+            agg: Dict[str, Any] = {"terms": {"field": field, "size": len(values), "min_doc_count": 2}}
+        else:
+            query = {"bool": {"should": [
+                {"bool": {"filter": [{"term": {field: v}} for field, v in zip(constraint_fields, value)]}}
+                for value in values
+            ], "minimum_should_match": 1}}
+            agg = {"multi_terms": {"terms": [{"field": field} for field in constraint_fields],
+                                   "size": len(values), "min_doc_count": 2}}
+
+        try:
+            response = await es.search(index=index, body={"query": query, "size": 0, "aggs": {"duplicates": agg}})
+        except NotFoundError as e:
+            if self._index_gone(index, e):
+                return set()
+            raise
+
+        def normalize(value: Tuple[Any, ...]) -> Tuple[str, ...]:
+            return tuple(str(v).lower() for v in value)
+
+        duplicated = set()
+        for bucket in response.get("aggregations", {}).get("duplicates", {}).get("buckets", []):
+            key = bucket["key"]
+            duplicated.add(normalize(tuple(key) if isinstance(key, list) else (key,)))
+
+        return {value for value in values if normalize(value) in duplicated}
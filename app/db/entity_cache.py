@@ -0,0 +1,88 @@
+"""
+Process-wide read-through cache for rarely written reference entities (Role, Account, ...).
+
+Sits behind the request identity map and in front of DocumentManager._get_impl.
+Enabled per entity in the config file:
+
+    "entity_cache": {
+        "Role":    {"ttl": 300, "max_entries": 100},
+        "Account": {"ttl": 60,  "max_entries": 5000}
+    }
+
+Entries are dropped by postflight update/delete hooks, so a single worker never serves a stale
+document. Other workers pick up the change when their entry expires (ttl seconds).
+"""
+
+import logging
+from functools import partial
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.cache import TTLCache
+from app.core.hook import HookService
+from app.core.metadata import MetadataService
+
+logger = logging.getLogger(__name__)
+
+
+class EntityCache:
+    """Static per-entity TTL/LRU document cache"""
+
+    _caches: Dict[str, TTLCache] = {}     # lowercase entity name -> cache
+    _hooked: set = set()                  # entities whose invalidation hooks are registered
+
+    @classmethod
+    def initialize(cls, cache_config: Dict[str, Dict[str, Any]]) -> None:
+        """Create the configured caches and register their invalidation hooks"""
+        cls._caches = {}
+        for entity, settings in (cache_config or {}).items():
+            proper_name = MetadataService.get_proper_name(entity)
+            if not proper_name:
+                raise ValueError(f"entity_cache: unknown entity {entity}")
+
+            ttl = float(settings.get('ttl', 60))
+            max_entries = int(settings.get('max_entries', 1000))
+            cls._caches[proper_name.lower()] = TTLCache(ttl, max_entries)
+
+            if proper_name not in cls._hooked:
+                HookService.register(proper_name, False, ['update', 'delete'], partial(cls._invalidate, proper_name))
+                cls._hooked.add(proper_name)
+            logger.info(f"Entity cache enabled for {proper_name}: ttl={ttl}s max_entries={max_entries}")
+
+    @classmethod
+    def get(cls, entity: str, id: str) -> Optional[Dict[str, Any]]:
+        """Get a copy of a cached document, or None if not cached (or entity not cached at all)"""
+        cache = cls._caches.get(entity.lower())
+        if cache is None:
+            return None
+        doc = cache.get(id)
+        return dict(doc) if doc is not None else None
+
+    @classmethod
+    def put(cls, entity: str, id: str, doc: Dict[str, Any]) -> None:
+        cache = cls._caches.get(entity.lower())
+        if cache is not None:
+            cache.put(id, dict(doc))
+
+    @classmethod
+    def evict(cls, entity: str, id: str) -> None:
+        cache = cls._caches.get(entity.lower())
+        if cache is not None:
+            cache.pop(id)
+
+    @classmethod
+    def clear(cls) -> None:
+        for cache in cls._caches.values():
+            cache.clear()
+
+    @classmethod
+    def stats(cls) -> Dict[str, Dict[str, Any]]:
+        """Per-entity entry counts and hit ratios"""
+        return {entity: cache.stats() for entity, cache in cls._caches.items()}
+
+    @classmethod
+    def _invalidate(cls, entity: str, doc: Any, count: int, **context) -> Tuple[Any, int]:
+        """Postflight update/delete hook - drop the changed document"""
+        id = context.get('id')
+        if id:
+            cls.evict(entity, id)
+        return doc, count
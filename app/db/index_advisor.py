@@ -0,0 +1,118 @@
+"""
+Secondary index advisor driven by the get_all query shapes RequestContext records.
+
+Each list request is counted by the fields it filters on with equality, the fields it filters
+on with a range and its sort (id and string substring matches are left out - id is always
+indexed, and a b-tree can't answer '%value%'). Shapes seen often enough are turned into a
+composite index in ESR order:
+
+    equality fields, then sort fields, then the first range field
+
+so the index narrows on the equalities, hands rows back already sorted, and bounds the range
+within that order. Each driver keys the index by the expressions its queries use (LOWER() /
+COLLATE NOCASE on Strings when case-insensitive - IndexManager.index_keys), and recommendations
+an existing index already starts with are dropped. Nothing is created unless asked:
+
+    GET  /api/db/indexes/advice                 recommendations
+    POST /api/db/indexes/advice {"create": true}  create them
+"""
+
+import logging
+from typing import Any, Dict, List
+
+from app.core.metadata import MetadataService
+from app.core.request_context import RequestContext
+
+logger = logging.getLogger(__name__)
+
+MIN_REQUESTS = 20       # a shape must be seen this often before an index is recommended
+MAX_INDEX_FIELDS = 4    # longer shapes are trimmed - wider indexes rarely pay for their writes
+
+
+class IndexAdvisor:
+    """Static recommendation and creation of secondary indexes"""
+
+    @staticmethod
+    def index_fields(shape: Dict[str, Any], case_sensitive: bool = False) -> List[str]:
+        """
+        ESR-ordered fields for one recorded shape. Case-insensitive String keys are indexed by
+        LOWER()/COLLATE NOCASE, which a range filter (compared on the plain column) can't use,
+        so such a range field is left out.
+        """
+        fields = list(shape['filter'])
+        for field, _direction in shape['sort']:
+            if field not in fields:
+                fields.append(field)
+        for field in shape['range'][:1]:
+            field_type = MetadataService.descriptors(shape['entity']).get(field, {}).get('type', 'String')
+            if field not in fields and (case_sensitive or field_type != 'String'):
+                fields.append(field)
+        return fields[:MAX_INDEX_FIELDS]
+
+    @staticmethod
+    async def recommend(db, min_requests: int = MIN_REQUESTS) -> List[Dict[str, Any]]:
+        """Indexes worth adding for the recorded shapes, most total query time first"""
+        if not db.indexes.secondary_indexes:
+            return []
+
+        candidates: Dict[tuple, Dict[str, Any]] = {}
+        for shape in RequestContext.get_query_shapes():
+            fields = IndexAdvisor.index_fields(shape, db.case_sensitive_sorting)
+            if not fields or not MetadataService.get_proper_name(shape['entity']):
+                continue
+            candidate = candidates.setdefault((shape['entity'], tuple(fields)), {
+                'entity': shape['entity'],
+                'fields': fields,
+                'requests': 0,
+                'total_ms': 0.0,
+                'max_ms': 0.0,
+                'shapes': []
+            })
+            candidate['requests'] += shape['requests']
+            candidate['total_ms'] = round(candidate['total_ms'] + shape['total_ms'], 2)
+            candidate['max_ms'] = max(candidate['max_ms'], shape['max_ms'])
+            candidate['shapes'].append({key: shape[key] for key in ('filter', 'range', 'sort', 'requests')})
+
+        existing_by_entity: Dict[str, List[List[str]]] = {}     # entity -> key lists of its indexes
+        recommendations = []
+        for candidate in sorted(candidates.values(), key=lambda c: c['total_ms'], reverse=True):
+            if candidate['requests'] < min_requests:
+                continue
+            entity = candidate['entity']
+            if entity not in existing_by_entity:
+                detailed = await db.indexes.get_all_detailed(entity)
+                existing_by_entity[entity] = [info['keys'] if 'keys' in info else info.get('fields', []) for info in detailed.values()]
+            keys = db.indexes.index_keys(entity, candidate['fields'])
+            if IndexAdvisor._covered(keys, existing_by_entity[entity]):
+                continue
+            # a narrower recommendation for the same entity is covered by this one too
+            existing_by_entity[entity].append(keys)
+            candidate['keys'] = keys
+            recommendations.append(candidate)
+        return recommendations
+
+    @staticmethod
+    async def apply(db, recommendations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create the recommended indexes; returns each with 'created' or 'error' set"""
+        results = []
+        for recommendation in recommendations:
+            result = {'entity': recommendation['entity'], 'fields': recommendation['fields']}
+            try:
+                await db.indexes.create(recommendation['entity'], recommendation['fields'], unique=False)
+                result['created'] = True
+                logger.info(f"Index advisor created index on {recommendation['entity']}: {recommendation['fields']}")
+            except Exception as e:
+                result['created'] = False
+                result['error'] = str(e)
+                logger.warning(f"Index advisor failed to create index on {recommendation['entity']}: {str(e)}")
+            results.append(result)
+        return results
+
+    @staticmethod
+    def _covered(keys: List[str], existing: List[List[str]]) -> bool:
+        """
+        True if an existing index starts with these keys (compared case-insensitively). Keys carry
+        their expression - lower(title) or title COLLATE NOCASE never matches a plain title index.
+        """
+        wanted = [key.lower() for key in keys]
+        return any([field.lower() for field in index[:len(wanted)]] == wanted for index in existing)
@@ -10,6 +10,9 @@ from app.core.metadata import MetadataService
 
 class IndexManager(ABC):
     """Template Method Pattern - concrete orchestration, abstract worker methods"""
+
+    # create(unique=False) builds a real secondary index (the index advisor's recommendations)
+    secondary_indexes = True
     
     def __init__(self, database):
         self.database = database
@@ -29,11 +32,19 @@ class IndexManager(ABC):
                     if needed not in existing_indexes:
                         await self.create(entity, needed, unique=True)
                         self.logger.info(f"Created missing index on {entity}: {needed}")
+            await self.initialize_search()
         except Exception as e:
             self.logger.error(f"Failed to initialize indexes: {str(e)}")
             return False
         return True
 
+    async def initialize_search(self) -> None:
+        """Create substring search support for every entity with searchable fields"""
+        for entity in MetadataService.list_entities():
+            searchable = MetadataService.searchable_fields(entity)
+            if searchable:
+                await self.create_search(entity, searchable)
+
     async def reset(self) -> bool:
         """Reset indexes for all entities by deleting all non-system indexes"""
         self.logger.info("Starting index reset...")
@@ -68,4 +79,17 @@ class IndexManager(ABC):
     @abstractmethod
     async def delete(self, entity: str, fields: List[str]) -> None:
         """Delete index by field names"""
+        pass
+
+    def index_keys(self, entity: str, fields: List[str]) -> List[str]:
+        """
+        Keys create(unique=False) builds for these fields, in the form get_all_detailed reports them
+        ('keys', else 'fields') - how the index advisor tells whether an index already exists.
+        Drivers that index String fields by an expression (LOWER(), COLLATE NOCASE) name it here.
+        """
+        return list(fields)
+
+    async def create_search(self, entity: str, fields: List[str]) -> None:
+        """Create (or bring up to date) an index for substring filters on searchable String fields.
+        Drivers without one, or that set it up elsewhere, keep this no-op."""
         pass 
\ No newline at end of file
@@ -6,6 +6,7 @@ Contains MongoCore, MongoEntities, MongoIndexes and MongoDatabase classes.
 import logging
 from typing import Any, Dict, List, Optional
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo.errors import OperationFailure
 
 from ..base import DatabaseInterface
 from ..core_manager import CoreManager
@@ -24,6 +25,17 @@ class MongoCore(CoreManager):
     @property
     def id_field(self) -> str:
         return "_id"
+
+    def collation(self) -> Dict[str, Any]:
+        """
+        Collation for finds, counts and indexes alike - MongoDB only uses an index for a sort or an
+        equality match when the index was built with the query's collation.
+        Case-insensitive is strength 2 (ignores case, not accents), matching the /i regexes it replaces.
+        """
+        if Config.get("case_sensitive", False):
+            # Case-sensitive: simple (binary) comparison, the default for collections and indexes
+            return {"locale": "simple", "strength": 3}
+        return {"locale": "en", "strength": 2}
     
     async def init(self, connection_str: str, database_name: str) -> None:
         """Initialize MongoDB connection"""
@@ -193,10 +205,35 @@ class MongoIndexes(IndexManager):
 
             index_spec = [(field, 1) for field in fields]
             kwargs: Dict[str, Any] = {"unique": unique}
-            if name:
-                kwargs["name"] = name
+            collation = self.database.core.collation()
+            if collation["locale"] != "simple":
+                kwargs["collation"] = collation
+
+            # Indexes on the same keys built with another collation (e.g. before case_sensitive
+            # changed) can't serve these queries. They are replaced, but only once the new index
+            # is built - until then they keep enforcing uniqueness
+            stale = [index_info async for index_info in db[entity].list_indexes()
+                     if index_info.get("name") != "_id_" and list(index_info.get("key", {}).keys()) == fields
+                     and not self._collation_matches(index_info)]
+            name = name or "_".join(f"{field}_1" for field in fields)
+            if any(index_info["name"] == name for index_info in stale):
+                # same key pattern with another collation is allowed, the same name is not
+                name = f"{name}_{collation['locale']}_{collation['strength']}"
+            kwargs["name"] = name
 
-            await db[entity].create_index(index_spec, **kwargs)
+            try:
+                await db[entity].create_index(index_spec, **kwargs)
+            except OperationFailure as e:
+                if not stale:
+                    raise
+                # e.g. values differing only in case under a case-insensitive unique index
+                self.logger.error(f"MongoDB: could not rebuild {entity} index on {fields} with collation "
+                                  f"{collation}, keeping {[i['name'] for i in stale]}: {str(e)}")
+                return
+
+            for index_info in stale:
+                await db[entity].drop_index(index_info["name"])
+                self.logger.info(f"Replaced {entity} index {index_info['name']} built with another collation by {name}")
         except Exception as e:
             raise DatabaseError(f"MongoDB create index error: {str(e)}")
     
@@ -216,6 +253,9 @@ class MongoIndexes(IndexManager):
                 if not index_info.get("unique", False):
                     continue
 
+                if not self._collation_matches(index_info):
+                    continue    # reported missing so initialize() rebuilds it with the query collation
+
                 fields = []
                 for field_spec in index_info.get("key", {}).items():
                     fields.append(field_spec[0])
@@ -246,6 +286,8 @@ class MongoIndexes(IndexManager):
                     "fields": fields,
                     "unique": index_info.get("unique", False),
                     "sparse": index_info.get("sparse", False),
+                    "collation": index_info.get("collation", {}).get("locale", "simple"),
+                    "collation_matches": self._collation_matches(index_info),
                     "type": "native"
                 }
 
@@ -264,6 +306,14 @@ class MongoIndexes(IndexManager):
         except Exception as e:
             raise DatabaseError(f"MongoDB delete index error: {str(e)}")
 
+    def _collation_matches(self, index_info: Dict[str, Any]) -> bool:
+        """True if the index was built with the collation queries run under"""
+        expected = self.database.core.collation()
+        actual = index_info.get("collation", {})
+        if expected["locale"] == "simple":
+            return actual.get("locale", "simple") == "simple"
+        return actual.get("locale") == expected["locale"] and actual.get("strength") == expected["strength"]
+
 
 class MongoDatabase(DatabaseInterface):
     """MongoDB implementation of DatabaseInterface"""
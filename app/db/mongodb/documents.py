@@ -3,12 +3,14 @@ MongoDB document operations implementation.
 Contains the MongoDocuments class with CRUD operations.
 """
 
+import asyncio
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 import uuid
 from bson import ObjectId
-from pymongo.errors import DuplicateKeyError, ConnectionFailure, ServerSelectionTimeoutError, OperationFailure
+from pymongo import DeleteOne, InsertOne, ReplaceOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, ConnectionFailure, ServerSelectionTimeoutError, OperationFailure
 
 from ..document_manager import DocumentManager
 from ..core_manager import CoreManager
@@ -30,8 +32,10 @@ class MongoDocuments(DocumentManager):
         filter: Optional[Dict[str, Any]] = None,
         page: int = 1,
         pageSize: int = 25,
-        substring_match: bool = True
-    ) -> Tuple[List[Dict[str, Any]], int]:
+        substring_match: bool = True,
+        cursor: Optional[Dict[str, Any]] = None,
+        count_mode: str = 'exact'
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
         """Get paginated list of documents"""
         self.database._ensure_initialized()
         db = self.database.core.get_connection()
@@ -44,41 +48,66 @@ class MongoDocuments(DocumentManager):
             case_key = MetadataService.get_proper_name(entity, key)  # Get correct case from metadata
             case_filter[case_key] = value
 
-        case_sort = []
-        for key, value in (sort if sort else []):
-            case_key = MetadataService.get_proper_name(entity, key)  # Get correct case from metadata
-            case_sort.append((case_key, value))
+        # Sort fields (proper case) plus the _id tiebreaker
+        keyset = self._keyset_sort(entity, sort)
 
         # Build query filter
         query = self._build_query_filter(case_filter, entity, substring_match) if filter else {}
 
-        # Get total count
-        total_count = await db[collection].count_documents(query)
-
         # Build sort specification
-        sort_spec = self._build_sort_spec(case_sort, entity)
-
-        # Execute paginated query
-        skip_count = self._calculate_pagination_offset(page, pageSize)
-        cursor = db[collection].find(query).sort(sort_spec).skip(skip_count).limit(pageSize)
-
-        # Apply collation for sorting
-        from app.core.config import Config
-        case_sensitive = Config.get("case_sensitive", False)
-        if case_sensitive:
-            # Case-sensitive: use simple locale with strength 3
-            cursor = cursor.collation({"locale": "simple", "strength": 3})
+        sort_spec = self._build_sort_spec(keyset, entity)
+
+        # Execute paginated query: seek past the cursor document, or skip to the page
+        if cursor and cursor['v']:
+            seek = self._build_seek_filter(keyset, cursor['v'])
+            page_query = {"$and": [query, seek]} if query else seek
+            skip_count = 0
         else:
-            # Case-insensitive: use en locale with strength 1
-            cursor = cursor.collation({"locale": "en", "strength": 1})
+            page_query = query
+            skip_count = self._calculate_pagination_offset(page, pageSize)
+        # One look-ahead document for hasMore
+        db_cursor = db[collection].find(page_query).sort(sort_spec).skip(skip_count).limit(pageSize + 1)
+
+        # Same collation as the indexes (and the count), so sorts and equality matches can use them
+        db_cursor = db_cursor.collation(self.database.core.collation())
 
-        raw_documents = await cursor.to_list(length=pageSize)
+        # Page and count run concurrently (motor checks out a pooled connection per operation)
+        if count_mode == 'none':
+            raw_documents, total_count = await db_cursor.to_list(length=pageSize + 1), None
+        else:
+            raw_documents, total_count = await asyncio.gather(db_cursor.to_list(length=pageSize + 1),
+                                                              self._count(db[collection], query, count_mode))
 
         # Normalize documents
         # documents = [self._normalize_document(doc) for doc in raw_documents]
 
         return raw_documents, total_count
     
+    async def _stream_impl(
+        self,
+        entity: str,
+        sort: Optional[List[Tuple[str, str]]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        substring_match: bool = True
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream matching documents in keyset order - one cursor, fetched EXPORT_BATCH_SIZE at a time"""
+        self.database._ensure_initialized()
+        db = self.database.core.get_connection()
+
+        case_filter = {MetadataService.get_proper_name(entity, key): value for key, value in (filter or {}).items()}
+        query = self._build_query_filter(case_filter, entity, substring_match) if filter else {}
+        sort_spec = self._build_sort_spec(self._keyset_sort(entity, sort), entity)
+
+        db_cursor = db[entity].find(query).sort(sort_spec).batch_size(self.EXPORT_BATCH_SIZE).collation(self.database.core.collation())
+        try:
+            while True:
+                documents = await db_cursor.to_list(length=self.EXPORT_BATCH_SIZE)
+                if not documents:
+                    break
+                yield documents
+        finally:
+            await db_cursor.close()
+
     async def _get_impl(self, entity: str, id: str) -> Tuple[Dict[str, Any], int]:
         """Get single document by ID"""
         self.database._ensure_initialized()
@@ -94,6 +123,14 @@ class MongoDocuments(DocumentManager):
         # normalized_doc = self._normalize_document(doc)
         return doc, 1
 
+    async def _get_many_impl(self, entity: str, ids: List[str]) -> List[Dict[str, Any]]:
+        """Get documents for a set of IDs with a single $in query"""
+        self.database._ensure_initialized()
+        db = self.database.core.get_connection()
+
+        cursor = db[entity].find({"_id": {"$in": ids}})
+        return await cursor.to_list(length=len(ids))
+
     async def _delete_impl(self, entity: str, id: str) -> Tuple[Dict[str, Any], int]:
         """Delete document by ID"""
         self.database._ensure_initialized()
@@ -192,7 +229,37 @@ class MongoDocuments(DocumentManager):
         except Exception as e:
             # Wrap all other errors as DatabaseError
             raise DatabaseError(f"MongoDB update error: {str(e)}", e)
-    
+
+    async def _bulk_write_impl(self, entity: str, ops: List[Tuple[str, str, Dict[str, Any]]]) -> List[Optional[Exception]]:
+        """Write a batch with one unordered bulk_write - a failing op does not stop the others,
+        and the server reports each failure with the op's index"""
+        db = self.database.core.get_connection()
+
+        requests: List[Any] = []
+        for op, id, data in ops:
+            if op == 'create':
+                requests.append(InsertOne({'_id': id, **data}))
+            elif op == 'update':
+                requests.append(ReplaceOne({'_id': id}, {k: v for k, v in data.items() if k != 'id'}, upsert=False))
+            else:
+                requests.append(DeleteOne({'_id': id}))
+
+        outcomes: List[Optional[Exception]] = [None] * len(ops)
+        try:
+            await db[entity].bulk_write(requests, ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get('writeErrors', []):
+                index = error['index']
+                if error.get('code') == 11000:
+                    key_pattern = error.get('keyPattern') or {}
+                    field = next(iter(key_pattern), None)
+                    field_display = field.capitalize() if field else "Field"
+                    outcomes[index] = DuplicateConstraintError(message=f"{field_display} already exists",
+                                                               entity=entity, field=field, entity_id=ops[index][1])
+                else:
+                    outcomes[index] = DatabaseError(message=f"MongoDB bulk write error: {error.get('errmsg')}")
+        return outcomes
+
 
     def _get_core_manager(self) -> CoreManager:
         """Get the core manager instance"""
@@ -248,6 +315,15 @@ class MongoDocuments(DocumentManager):
     ) -> bool:
         """Validate unique constraints for MongoDB"""
         return True  # MongoDB handles unique constraints natively
+
+    async def _find_duplicate_uniques(
+        self,
+        entity: str,
+        constraint_fields: List[str],
+        docs: List[Dict[str, Any]]
+    ) -> set:
+        """Find duplicated unique values for MongoDB"""
+        return set()  # MongoDB enforces unique constraints natively via indexes - duplicates cannot be stored
     
     def _build_query_filter(self, filters: Dict[str, Any], entity: str, substring_match: bool = True) -> Dict[str, Any]:
         """Build MongoDB query from filter conditions"""
@@ -285,13 +361,9 @@ class MongoDocuments(DocumentManager):
                         # Substring matching: partial match with regex
                         query[field] = {"$regex": f".*{self._escape_regex(str(value))}.*", "$options": regex_options}
                     else:
-                        # Exact matching: anchored regex for case control
-                        if case_sensitive:
-                            # Case-sensitive exact: simple equality is faster
-                            query[field] = value
-                        else:
-                            # Case-insensitive exact: use anchored regex
-                            query[field] = {"$regex": f"^{self._escape_regex(str(value))}$", "$options": "i"}
+                        # Exact matching: plain equality - case-insensitive through the query collation
+                        # (strength 2), which an index built with that collation can answer
+                        query[field] = value
                 else:
                     # Enum fields and non-text fields: always exact match
                     if isinstance(value, str) and ObjectId.is_valid(value):
@@ -310,6 +382,45 @@ class MongoDocuments(DocumentManager):
         else:
             return [(self.database.core.id_field, 1)]  # Default sort by _id ascending
     
+    async def _count(self, collection, query: Dict[str, Any], count_mode: str) -> int:
+        """
+        Total for a get_all page.
+        estimate: collection metadata when unfiltered, a count capped at ESTIMATE_COUNT_CAP filtered.
+        """
+        if count_mode == 'estimate' and not query:
+            return await collection.estimated_document_count()
+        # Counted under the find's collation - otherwise equality filters would count case-sensitively
+        collation = self.database.core.collation()
+        if count_mode == 'estimate':
+            return await collection.count_documents(query, limit=self.ESTIMATE_COUNT_CAP, collation=collation)
+        return await collection.count_documents(query, collation=collation)
+
+    def _build_seek_filter(self, keyset: List[Tuple[str, str]], values: List[Any]) -> Dict[str, Any]:
+        """
+        Filter selecting documents after the cursor document in keyset order:
+            {$or: [{a: {$gt: va}}, {a: va, b: {$gt: vb}}, {a: va, b: vb, _id: {$gt: vid}}]}
+        MongoDB sorts null/missing first ascending and last descending.
+        """
+        id_field = self.database.core.id_field
+        keys = [(id_field if field == 'id' else field, direction, value) for (field, direction), value in zip(keyset, values)]
+
+        clauses = []
+        for i, (field, direction, value) in enumerate(keys):
+            if value is None:
+                if direction == 'desc':
+                    continue  # only more nulls follow a null
+                after = {field: {"$ne": None}}
+            elif direction == 'asc':
+                after = {field: {"$gt": value}}
+            else:
+                after = {"$or": [{field: {"$lt": value}}, {field: None}]}
+
+            # Documents tied with the cursor on every earlier key, and after it on this one
+            tied = [{f: v} for f, _, v in keys[:i]]
+            clauses.append({"$and": tied + [after]} if tied else after)
+
+        return {"$or": clauses} if clauses else {id_field: {"$exists": False}}
+
     # def _parse_duplicate_key_error(self, error: DuplicateKeyError) -> Tuple[str, str]:
     #     """Parse MongoDB duplicate key error to extract field and value"""
     #     error_msg = str(error)
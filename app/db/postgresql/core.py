@@ -113,6 +113,7 @@ class PostgreSQLCore(CoreManager):
 
             # Recreate tables and indexes from schema
             await self.database.documents.initialize_schema()
+            await self.database.indexes.initialize_search()
 
             logging.info("PostgreSQL: Database wiped and reinitialized")
             return True
@@ -2,12 +2,15 @@
 PostgreSQL document operations - CRUD with JSONB storage.
 """
 
+import asyncio
 import asyncpg
 import json
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import groupby
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from ..document_manager import DocumentManager
 from ..core_manager import CoreManager
+from ..row_codec import RowCodec, Converter
 from app.core.exceptions import DocumentNotFound, DatabaseError, DuplicateConstraintError
 from app.core.metadata import MetadataService
 from app.core.config import Config
@@ -18,6 +21,7 @@ class PostgreSQLDocuments(DocumentManager):
 
     def __init__(self, database):
         super().__init__(database)
+        self._codecs: Dict[str, RowCodec] = {}
 
     def _get_postgres_type(self, field_meta: Dict[str, Any]) -> str:
         """Map schema field type to PostgreSQL column type"""
@@ -79,9 +83,34 @@ class PostgreSQLDocuments(DocumentManager):
             if field_meta.get('type') == 'ObjectId':
                 regular_indexes.append((f'CREATE INDEX IF NOT EXISTS "{entity.lower()}_{field_name}_idx" ON "{entity}" ("{field_name}")',))
 
+        regular_indexes.extend((sql,) for sql in self._sort_indexes(entity))
+
         create_sql = f'CREATE TABLE IF NOT EXISTS "{entity}" ({", ".join(columns)})'
         return create_sql, unique_indexes, regular_indexes
 
+    def _sort_indexes(self, entity: str) -> List[str]:
+        """
+        Indexes whose key is exactly what _build_order sorts by, so a sorted page is an index scan
+        that stops after LIMIT rows instead of a sort of every match:
+        - the default order (id alone) when it is LOWER(id) - case-sensitive sorting uses the primary key
+        - per sortable field, one index per direction: the field is NULLS LAST both ways while the
+          id tiebreaker stays ascending, so neither order is the other scanned backwards
+        The expressions depend on case_sensitive_sorting, which is part of the index name.
+        """
+        suffix = 'cs' if self.database.case_sensitive_sorting else 'ci'
+        id_expr = self._sort_expression(entity, 'id')
+        indexes = []
+        if id_expr != 'id':
+            indexes.append(f'CREATE INDEX IF NOT EXISTS "{entity.lower()}_id_sort_{suffix}" ON "{entity}" ({id_expr})')
+        for field in MetadataService.sortable_fields(entity):
+            expr = self._sort_expression(entity, field)
+            for direction in ('asc', 'desc'):
+                indexes.append(
+                    f'CREATE INDEX IF NOT EXISTS "{entity.lower()}_{field}_{direction}_sort_{suffix}" '
+                    f'ON "{entity}" ({expr} {direction.upper()} NULLS LAST, {id_expr} ASC)'
+                )
+        return indexes
+
     def _convert_datetime(self, value: str) -> Any:
         """Convert ISO datetime string to timezone-aware datetime object"""
         from datetime import datetime, timezone
@@ -97,24 +126,31 @@ class PostgreSQLDocuments(DocumentManager):
             return value
         return datetime.fromisoformat(value.replace('Z', '+00:00')).date()
 
+    def _encoder_for(self, field_type: str) -> Optional[Converter]:
+        """Row codec hook: convert Python values to PostgreSQL-compatible format"""
+        # Handle boolean types (Bool, Boolean) using first 4 chars for type safety
+        if len(field_type) >= 4 and field_type[:4].lower() == 'bool':
+            return bool
+        elif field_type == 'Date':
+            return self._convert_date
+        elif field_type == 'Datetime':
+            return self._convert_datetime
+        return None
+
+    def _decoder_for(self, field_type: str) -> Optional[Converter]:
+        """Row codec hook: asyncpg already returns native Python types"""
+        return None
+
+    def _codec(self, entity: str) -> RowCodec:
+        """Compiled row codec for an entity (built by initialize_schema, or on first use)"""
+        codec = self._codecs.get(entity)
+        if codec is None:
+            codec = self._codecs[entity] = RowCodec(entity, self._encoder_for, self._decoder_for)
+        return codec
+
     def _prepare_values_for_postgres(self, entity: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Convert Python values to PostgreSQL-compatible format"""
-        prepared = {}
-        for field_name, value in data.items():
-            if value is None:
-                prepared[field_name] = None
-            else:
-                field_type = MetadataService.get(entity, field_name, 'type')
-                # Handle boolean types (Bool, Boolean) using first 4 chars for type safety
-                if field_type and len(field_type) >= 4 and field_type[:4].lower() == 'bool':
-                    prepared[field_name] = bool(value)
-                elif field_type == 'Date':
-                    prepared[field_name] = self._convert_date(value)
-                elif field_type == 'Datetime':
-                    prepared[field_name] = self._convert_datetime(value)
-                else:
-                    prepared[field_name] = value
-        return prepared
+        return self._codec(entity).encode(data)
 
     async def _create_impl(self, entity: str, id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create document in PostgreSQL with proper columns"""
@@ -186,6 +222,15 @@ class PostgreSQLDocuments(DocumentManager):
             document = dict(row)
             return document, 1
 
+    async def _get_many_impl(self, entity: str, ids: List[str]) -> List[Dict[str, Any]]:
+        """Get documents for a set of IDs with a single ANY() query"""
+        async with self.database.core.pool.acquire() as conn:
+            rows = await conn.fetch(
+                f'SELECT * FROM "{entity}" WHERE id = ANY($1::text[])',
+                ids
+            )
+            return [dict(row) for row in rows]
+
     async def _get_all_impl(
         self,
         entity: str,
@@ -193,127 +238,222 @@ class PostgreSQLDocuments(DocumentManager):
         filter: Optional[Dict[str, Any]] = None,
         page: int = 1,
         pageSize: int = 25,
-        substring_match: bool = True
-    ) -> Tuple[List[Dict[str, Any]], int]:
+        substring_match: bool = True,
+        cursor: Optional[Dict[str, Any]] = None,
+        count_mode: str = 'exact'
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
         """Get paginated list of documents with filter/sort"""
-        async with self.database.core.pool.acquire() as conn:
-            # Build WHERE clause from filters
-            where_parts = []
-            params = []
-            param_idx = 1
+        where_parts, params = self._build_where(entity, filter, substring_match)
+        where_clause = f"WHERE {' AND '.join(where_parts)}" if where_parts else ""
+
+        # Build ORDER BY clause - sort fields plus the id tiebreaker (keyset order)
+        keyset, sort_exprs, order_clause = self._build_order(entity, sort)
+
+        # Pagination: seek past the cursor row, or skip to the page
+        page_where_parts, page_params = list(where_parts), list(params)
+        if cursor and cursor['v']:
+            seek_sql, seek_params = self._build_seek_clause(entity, keyset, sort_exprs, cursor['v'], len(params) + 1)
+            page_where_parts.append(seek_sql)
+            page_params.extend(seek_params)
+            offset = 0
+        else:
+            offset = self._calculate_pagination_offset(page, pageSize)
+        page_where_clause = f"WHERE {' AND '.join(page_where_parts)}" if page_where_parts else ""
+        limit_clause = f"LIMIT ${len(page_params) + 1} OFFSET ${len(page_params) + 2}"
+        page_params.extend([pageSize + 1, offset])  # one look-ahead row for hasMore
+
+        # Execute main query
+        query = f'''
+            SELECT * FROM "{entity}"
+            {page_where_clause}
+            {order_clause}
+            {limit_clause}
+        '''
+
+        async def fetch_page():
+            async with self.database.core.pool.acquire() as conn:
+                return await conn.fetch(query, *page_params)
+
+        async def fetch_total():
+            # Total count (filter only - no seek or pagination)
+            async with self.database.core.pool.acquire() as conn:
+                return await self._count(conn, entity, where_clause, params, count_mode)
+
+        # Page and count run concurrently on separate pooled connections
+        if count_mode == 'none':
+            rows, total = await fetch_page(), None
+        else:
+            rows, total = await asyncio.gather(fetch_page(), fetch_total())
+
+        # Convert rows to dicts
+        documents = [dict(row) for row in rows]
+
+        return documents, total
+
+    async def _stream_impl(
+        self,
+        entity: str,
+        sort: Optional[List[Tuple[str, str]]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        substring_match: bool = True
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream matching rows in keyset order through a server-side cursor (asyncpg prefetches
+        EXPORT_BATCH_SIZE rows per round trip) inside a read-only transaction"""
+        where_parts, params = self._build_where(entity, filter, substring_match)
+        where_clause = f"WHERE {' AND '.join(where_parts)}" if where_parts else ""
+        _, _, order_clause = self._build_order(entity, sort)
+        query = f'SELECT * FROM "{entity}" {where_clause} {order_clause}'
 
-            if filter:
-                for field, value in filter.items():
-                    # Get properly cased field name
-                    proper_field = MetadataService.get_proper_name(entity, field)
-                    field_type = MetadataService.get(entity, proper_field, 'type') or 'String'
-
-                    if isinstance(value, dict):
-                        # Range queries: {$gte: 21, $lt: 65} or date ranges
-                        for op, val in value.items():
-                            sql_op = self._map_operator(op)
-                            # Convert date/datetime values for filters
-                            if field_type == 'Date':
-                                val = self._convert_date(val)
-                            elif field_type == 'Datetime':
-                                val = self._convert_datetime(val)
-                            where_parts.append(f'"{proper_field}" {sql_op} ${param_idx}')
-                            params.append(val)
-                            param_idx += 1
-                    else:
-                        # Equality or substring match
-                        field_meta = MetadataService.get(entity, proper_field) or {}
-                        enum_values = field_meta.get('enum', None)
-                        has_enum_values = enum_values is not None
-
-                        if field_type == 'String' and not has_enum_values:
-                            # Handle all 4 combinations of case_sensitive and substring_match
-                            case_sensitive = Config.get("case_sensitive", False)
-
-                            if substring_match:
-                                # Substring matching: partial match with ILIKE/LIKE
-                                if case_sensitive:
-                                    where_parts.append(f'"{proper_field}" LIKE ${param_idx}')
-                                else:
-                                    where_parts.append(f'"{proper_field}" ILIKE ${param_idx}')
-                                params.append(f"%{value}%")
+        async with self.database.core.pool.acquire() as conn:
+            async with conn.transaction(readonly=True):  # server-side cursors live in a transaction
+                batch: List[Dict[str, Any]] = []
+                async for row in conn.cursor(query, *params, prefetch=self.EXPORT_BATCH_SIZE):
+                    batch.append(dict(row))
+                    if len(batch) == self.EXPORT_BATCH_SIZE:
+                        yield batch
+                        batch = []
+                if batch:
+                    yield batch
+
+    def _build_where(self, entity: str, filter: Optional[Dict[str, Any]], substring_match: bool) -> Tuple[List[str], List[Any]]:
+        """WHERE conditions ($1..$n) and their params for a get_all/export filter"""
+        where_parts = []
+        params = []
+        param_idx = 1
+
+        if filter:
+            for field, value in filter.items():
+                # Get properly cased field name
+                proper_field = MetadataService.get_proper_name(entity, field)
+                field_type = MetadataService.get(entity, proper_field, 'type') or 'String'
+
+                if isinstance(value, dict):
+                    # Range queries: {$gte: 21, $lt: 65} or date ranges
+                    for op, val in value.items():
+                        sql_op = self._map_operator(op)
+                        # Convert date/datetime values for filters
+                        if field_type == 'Date':
+                            val = self._convert_date(val)
+                        elif field_type == 'Datetime':
+                            val = self._convert_datetime(val)
+                        where_parts.append(f'"{proper_field}" {sql_op} ${param_idx}')
+                        params.append(val)
+                        param_idx += 1
+                else:
+                    # Equality or substring match
+                    field_meta = MetadataService.get(entity, proper_field) or {}
+                    enum_values = field_meta.get('enum', None)
+                    has_enum_values = enum_values is not None
+
+                    if field_type == 'String' and not has_enum_values:
+                        # Handle all 4 combinations of case_sensitive and substring_match
+                        case_sensitive = Config.get("case_sensitive", False)
+
+                        if substring_match:
+                            # Substring matching: partial match with ILIKE/LIKE
+                            # (an index scan on searchable fields - see PostgreSQLIndexes.create_search)
+                            if case_sensitive:
+                                where_parts.append(f'"{proper_field}" LIKE ${param_idx}')
                             else:
-                                # Exact matching: anchored comparison for case control
-                                if case_sensitive:
-                                    # Case-sensitive exact: simple equality is faster
-                                    where_parts.append(f'"{proper_field}" = ${param_idx}')
-                                    params.append(value)
-                                else:
-                                    # Case-insensitive exact: use ILIKE without wildcards
-                                    where_parts.append(f'"{proper_field}" ILIKE ${param_idx}')
-                                    params.append(value)
+                                where_parts.append(f'"{proper_field}" ILIKE ${param_idx}')
+                            params.append(f"%{value}%")
                         else:
-                            # Exact match for enums, numbers, booleans, dates
-                            # Convert date/datetime values for filters
-                            if field_type == 'Date':
-                                value = self._convert_date(value)
-                            elif field_type == 'Datetime':
-                                value = self._convert_datetime(value)
-                            where_parts.append(f'"{proper_field}" = ${param_idx}')
-                            params.append(value)
-
-                        param_idx += 1
-
-            where_clause = f"WHERE {' AND '.join(where_parts)}" if where_parts else ""
-
-            # Build ORDER BY clause
-            order_clause = ""
-            if sort:
-                order_parts = []
-                for field, direction in sort:
-                    # Convert field name to proper case (e.g., 'firstname' -> 'firstName')
-                    proper_field = MetadataService.get_proper_name(entity, field)
-                    field_type = MetadataService.get(entity, proper_field, 'type') or 'String'
-
-                    # Only apply LOWER() to String fields (not numeric, date, etc.)
-                    if self.database.case_sensitive_sorting:
-                        sort_expr = f'"{proper_field}" {direction.upper()}'
+                            # Exact matching: anchored comparison for case control
+                            if case_sensitive:
+                                # Case-sensitive exact: simple equality is faster
+                                where_parts.append(f'"{proper_field}" = ${param_idx}')
+                                params.append(value)
+                            else:
+                                # Case-insensitive exact: compare lowercased, which a LOWER() index can answer
+                                where_parts.append(f'LOWER("{proper_field}") = LOWER(${param_idx})')
+                                params.append(value)
                     else:
-                        if field_type == 'String':
-                            sort_expr = f'LOWER("{proper_field}") {direction.upper()}'
-                        else:
-                            sort_expr = f'"{proper_field}" {direction.upper()}'
-
-                    # Always put NULLs last for better UX - users want to see actual data first
-                    sort_expr += ' NULLS LAST'
-                    order_parts.append(sort_expr)
-                order_clause = f"ORDER BY {', '.join(order_parts)}"
-            else:
-                # Default sort by 'id' column for consistent pagination
-                if self.database.case_sensitive_sorting:
-                    order_clause = f"ORDER BY id ASC"
-                else:
-                    order_clause = f"ORDER BY LOWER(id) ASC"
-
-            # Pagination
-            offset = self._calculate_pagination_offset(page, pageSize)
-            limit_clause = f"LIMIT ${param_idx} OFFSET ${param_idx + 1}"
-            params.extend([pageSize, offset])
-
-            # Execute main query
-            query = f'''
-                SELECT * FROM "{entity}"
-                {where_clause}
-                {order_clause}
-                {limit_clause}
-            '''
-
-            rows = await conn.fetch(query, *params)
+                        # Exact match for enums, numbers, booleans, dates
+                        # Convert date/datetime values for filters
+                        if field_type == 'Date':
+                            value = self._convert_date(value)
+                        elif field_type == 'Datetime':
+                            value = self._convert_datetime(value)
+                        where_parts.append(f'"{proper_field}" = ${param_idx}')
+                        params.append(value)
+
+                    param_idx += 1
+
+        return where_parts, params
+
+    def _build_order(self, entity: str, sort: Optional[List[Tuple[str, str]]]) -> Tuple[List[Tuple[str, str]], List[str], str]:
+        """Keyset (sort fields plus the id tiebreaker), its column expressions and the ORDER BY clause"""
+        keyset = self._keyset_sort(entity, sort)
+        sort_exprs = [self._sort_expression(entity, field) for field, _ in keyset]
+        order_parts = []
+        for expr, (field, direction) in zip(sort_exprs, keyset):
+            # Always put NULLs last for better UX - users want to see actual data first
+            order_parts.append(f"{expr} {direction.upper()}" + ("" if field == 'id' else " NULLS LAST"))
+        return keyset, sort_exprs, f"ORDER BY {', '.join(order_parts)}"
+
+    async def _count(self, conn, entity: str, where_clause: str, params: List[Any], count_mode: str) -> Optional[int]:
+        """
+        Total for a get_all page.
+        estimate: pg_class.reltuples when unfiltered, the planner's row estimate (EXPLAIN) when
+        filtered. Falls back to an exact count for tables that have never been analyzed.
+        """
+        if count_mode == 'none':
+            return None
+        if count_mode == 'estimate':
+            if where_clause:
+                plan = await conn.fetchval(f'EXPLAIN (FORMAT JSON) SELECT 1 FROM "{entity}" {where_clause}', *params)
+                plan = json.loads(plan) if isinstance(plan, str) else plan
+                return int(plan[0]['Plan']['Plan Rows'])
+            estimate = await conn.fetchval('SELECT reltuples::bigint FROM pg_class WHERE oid = $1::regclass', f'"{entity}"')
+            if estimate is not None and estimate >= 0:
+                return estimate
+        count_query = f'SELECT COUNT(*) FROM "{entity}" {where_clause}'
+        return await conn.fetchval(count_query, *params) if params else await conn.fetchval(count_query)
+
+    def _sort_expression(self, entity: str, field: str) -> str:
+        """Column expression a keyset field is ordered (and compared) by"""
+        column = 'id' if field == 'id' else f'"{field}"'
+        if self.database.case_sensitive_sorting:
+            return column
+        field_type = 'String' if field == 'id' else MetadataService.get(entity, field, 'type') or 'String'
+
+        # Only apply LOWER() to String fields (not numeric, date, etc.)
+        return f'LOWER({column})' if field_type == 'String' else column
+
+    def _build_seek_clause(self, entity: str, keyset: List[Tuple[str, str]], sort_exprs: List[str],
+                           values: List[Any], param_idx: int) -> Tuple[str, List[Any]]:
+        """
+        WHERE clause selecting rows after the cursor row in keyset order:
+            (a > $1) OR (a = $2 AND b > $3) OR (a = $4 AND b = $5 AND id > $6)
+        Sort fields are ordered NULLS LAST in both directions; id is never NULL.
+        """
+        codec = self._codec(entity)
+        params: List[Any] = []
 
-            # Get total count (without pagination)
-            count_params = params[:-2]  # Exclude LIMIT/OFFSET params
-            count_query = f'SELECT COUNT(*) FROM "{entity}" {where_clause}'
-            total = await conn.fetchval(count_query, *count_params) if count_params else await conn.fetchval(count_query)
+        def bind(expr: str, value: Any) -> str:
+            params.append(value)
+            placeholder = f'${param_idx + len(params) - 1}'
+            return f'LOWER({placeholder})' if expr.startswith('LOWER(') else placeholder
 
-            # Convert rows to dicts
-            documents = [dict(row) for row in rows]
+        keys = []
+        for (field, direction), expr, value in zip(keyset, sort_exprs, values):
+            column = 'id' if field == 'id' else f'"{field}"'
+            keys.append((field, direction, expr, column, None if value is None else codec.encode({field: value})[field]))
 
-            return documents, total
+        clauses = []
+        for i, (field, direction, expr, column, value) in enumerate(keys):
+            if value is None:
+                continue  # only more NULLs follow a NULL
+            # Rows tied with the cursor on every earlier key...
+            parts = [f'{e} = {bind(e, v)}' if v is not None else f'{c} IS NULL' for _, _, e, c, v in keys[:i]]
+            # ...and after it on this one
+            after = f"{expr} {'>' if direction == 'asc' else '<'} {bind(expr, value)}"
+            parts.append(after if field == 'id' else f'({after} OR {column} IS NULL)')
+            clauses.append(' AND '.join(parts))
+
+        if not clauses:
+            return 'FALSE', []
+        return '(' + ' OR '.join(f'({clause})' for clause in clauses) + ')', params
 
     async def _update_impl(self, entity: str, id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update document with proper columns"""
@@ -404,6 +544,64 @@ class PostgreSQLDocuments(DocumentManager):
 
             return document, 1
 
+    async def _bulk_write_impl(self, entity: str, ops: List[Tuple[str, str, Dict[str, Any]]]) -> List[Optional[Exception]]:
+        """Write a batch in one transaction - COPY for runs of creates, executemany for the rest.
+        If the batch hits a constraint it is rolled back and replayed item by item under savepoints,
+        so only the offending items fail."""
+        statements = [self._bulk_statement(entity, op, id, data) for op, id, data in ops]
+
+        async with self.database.core.pool.acquire() as conn:
+            try:
+                async with conn.transaction():
+                    for (op, sql, columns), run in groupby(statements, key=lambda statement: statement[:3]):
+                        records = [params for *_, params in run]
+                        if op == 'create':
+                            await conn.copy_records_to_table(entity, records=records, columns=columns)
+                        else:
+                            await conn.executemany(sql, records)
+                return [None] * len(ops)
+            except (asyncpg.UniqueViolationError, asyncpg.NotNullViolationError):
+                pass  # rolled back - find the offending items below
+
+            outcomes: List[Optional[Exception]] = []
+            async with conn.transaction():
+                for (_, sql, _, params), (_, id, _) in zip(statements, ops):
+                    try:
+                        async with conn.transaction():  # savepoint
+                            await conn.execute(sql, *params)
+                        outcomes.append(None)
+                    except asyncpg.UniqueViolationError as e:
+                        outcomes.append(self._unique_violation(entity, id, e))
+                    except asyncpg.PostgresError as e:
+                        outcomes.append(DatabaseError(message=f"PostgreSQL error: {str(e)}"))
+            return outcomes
+
+    def _bulk_statement(self, entity: str, op: str, id: str, data: Dict[str, Any]) -> Tuple[str, str, Tuple[str, ...], List[Any]]:
+        """(op, SQL, columns, parameters) for one bulk op - same-shaped ops share op, SQL and columns"""
+        if op == 'delete':
+            return op, f'DELETE FROM "{entity}" WHERE id = $1', ('id',), [id]
+
+        prepared_data = self._prepare_values_for_postgres(entity, {k: v for k, v in data.items() if k != 'id'})
+        if op == 'create':
+            columns = ('id', *prepared_data)
+            field_list = ', '.join(f'"{f}"' for f in columns)
+            placeholders = ', '.join(f'${i + 1}' for i in range(len(columns)))
+            return op, f'INSERT INTO "{entity}" ({field_list}) VALUES ({placeholders})', columns, [id, *prepared_data.values()]
+
+        columns = tuple(prepared_data)
+        set_parts = ', '.join(f'"{f}" = ${i + 1}' for i, f in enumerate(columns))
+        return op, f'UPDATE "{entity}" SET {set_parts} WHERE id = ${len(columns) + 1}', columns, [*prepared_data.values(), id]
+
+    def _unique_violation(self, entity: str, id: str, e: asyncpg.UniqueViolationError) -> DuplicateConstraintError:
+        """Translate a unique violation for one bulk item (constraint entity_field1_field2_unique -> field1)"""
+        field = None
+        if getattr(e, 'constraint_name', None):
+            parts = e.constraint_name.split('_')
+            if parts[-1] == 'unique' and len(parts) > 2:
+                field = parts[1]
+        field_display = field.capitalize() if field else "Field"
+        return DuplicateConstraintError(message=f"{field_display} already exists", entity=entity, field=field, entity_id=id)
+
     async def initialize_schema(self) -> None:
         """Create all tables and indexes for all entities (called during wipe_and_reinit)"""
         from app.core.metadata import MetadataService
@@ -422,6 +620,8 @@ class PostgreSQLDocuments(DocumentManager):
                 for idx_sql in regular_indexes:
                     await conn.execute(idx_sql[0])
 
+                self._codecs[entity] = RowCodec(entity, self._encoder_for, self._decoder_for)
+
     def _get_core_manager(self) -> CoreManager:
         """Get core manager instance"""
         return self.database.core
@@ -439,3 +639,12 @@ class PostgreSQLDocuments(DocumentManager):
     ) -> bool:
         """Validate unique constraints for PostgreSQL"""
         return True  # PostgreSQL handles unique constraints natively via indexes
+
+    async def _find_duplicate_uniques(
+        self,
+        entity: str,
+        constraint_fields: List[str],
+        docs: List[Dict[str, Any]]
+    ) -> set:
+        """Find duplicated unique values for PostgreSQL"""
+        return set()  # PostgreSQL enforces unique constraints natively via indexes - duplicates cannot be stored
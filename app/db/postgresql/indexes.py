@@ -1,8 +1,9 @@
 """
-PostgreSQL index management - unique constraints.
+PostgreSQL index management - unique constraints and trigram search indexes.
 """
 
 import asyncpg
+import logging
 from typing import List, Optional
 import re
 
@@ -34,7 +35,37 @@ class PostgreSQLIndexes(IndexManager):
                 # Table doesn't exist - call initialize_schema to create all tables
                 await self.database.documents.initialize_schema()
 
-        # Index already created with table, nothing more to do
+            # Unique indexes are created with the table; secondary ones (index advisor) are added here,
+            # keyed by the expressions queries filter and sort by (LOWER() on case-insensitive Strings)
+            if not unique:
+                expressions = [self.database.documents._sort_expression(entity, field) for field in fields]
+                suffix = '_ci' if any(expr.startswith('LOWER(') for expr in expressions) else ''
+                name = name or f"{entity.lower()}_{'_'.join(field.lower() for field in fields)}_idx{suffix}"
+                columns = ', '.join(expressions)
+                try:
+                    await conn.execute(f'CREATE INDEX IF NOT EXISTS "{name}" ON "{entity}" ({columns})')
+                except asyncpg.PostgresError as e:
+                    raise DatabaseError(f"PostgreSQL create index error: {str(e)}")
+
+    async def create_search(self, entity: str, fields: List[str]) -> None:
+        """Create a pg_trgm GIN index per searchable field. The planner uses them for the
+        ILIKE/LIKE '%value%' filters _build_where already emits, so queries need no change.
+        Without the extension (or the rights to create it) substring filters stay sequential scans."""
+        async with self.database.core.pool.acquire() as conn:
+            try:
+                await conn.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            except asyncpg.PostgresError as e:
+                logging.warning(f"PostgreSQL: pg_trgm unavailable, no search indexes for {entity}: {str(e)}")
+                return
+
+            try:
+                for field in fields:
+                    await conn.execute(
+                        f'CREATE INDEX IF NOT EXISTS "{entity.lower()}_{field}_trgm" '
+                        f'ON "{entity}" USING gin ("{field}" gin_trgm_ops)'
+                    )
+            except asyncpg.PostgresError as e:
+                raise DatabaseError(f"PostgreSQL create search index error: {str(e)}")
 
     async def get_all(self, entity: str) -> List[List[str]]:
         """Get all unique indexes for entity as field lists"""
@@ -111,10 +142,14 @@ class PostgreSQLIndexes(IndexManager):
                     index_def = index_row['indexdef']
                     is_unique = 'UNIQUE' in index_def.upper()
 
-                    fields = self._parse_fields_from_sql(index_def)
+                    keys = self._parse_keys_from_sql(index_def)
+                    fields = self._parse_fields_from_sql(index_def) or [re.sub(r'^lower\((.*)\)$', r'\1', key) for key in keys]
+                    if not re.search(r'USING\s+btree', index_def, re.IGNORECASE):
+                        keys = []   # e.g. the pg_trgm GIN indexes - no use to equality, range or sort
 
                     indexes[index_name] = {
                         "fields": fields,
+                        "keys": keys,
                         "unique": is_unique,
                         "type": "native"
                     }
@@ -164,3 +199,24 @@ class PostgreSQLIndexes(IndexManager):
         matches = re.findall(pattern, sql)
 
         return matches
+
+    def index_keys(self, entity: str, fields: List[str]) -> List[str]:
+        """Keys of the index create(unique=False) builds, normalized like _parse_keys_from_sql"""
+        return [self._normalize_key(self.database.documents._sort_expression(entity, field)) for field in fields]
+
+    def _parse_keys_from_sql(self, sql: str) -> List[str]:
+        """Parse the key columns/expressions from a pg_indexes definition of a proper-column index"""
+        # Example: CREATE INDEX event_title_idx ON public."Event" USING btree (title, "dateTime")
+        # Example: CREATE INDEX event_title_asc_sort_ci ON public."Event" USING btree (lower(title) NULLS LAST, lower(id))
+        match = re.search(r'USING\s+\w+\s*\((.*)\)', sql, re.IGNORECASE)
+        if not match:
+            return []
+        return [key for key in (self._normalize_key(part) for part in match.group(1).split(',')) if key]
+
+    def _normalize_key(self, expr: str) -> str:
+        """'lower(<column>)' for a LOWER() expression, else the bare column name"""
+        name = re.search(r'"([^"]+)"|\b(?!lower\b)([A-Za-z_]\w*)', re.sub(r'::\w+', '', expr), re.IGNORECASE)
+        if not name:
+            return ''
+        column = name.group(1) or name.group(2)
+        return f"lower({column})" if re.search(r'\blower\s*\(', expr, re.IGNORECASE) else column
@@ -0,0 +1,78 @@
+"""
+Compiled per-entity row codecs shared by the SQL drivers (SQLite, PostgreSQL).
+
+A codec is built once per entity from its field descriptors and the driver's type converters:
+  - encode: field -> converter map applied to a document before it is written
+  - decode: column-index -> converter list per result column layout, so turning rows into
+    documents is a single loop with no metadata lookups
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.core.metadata import MetadataService
+
+Converter = Callable[[Any], Any]
+
+
+class RowCodec:
+    """Encoder/decoder for one entity's rows"""
+
+    def __init__(self, entity: str,
+                 encoder_for: Callable[[str], Optional[Converter]],
+                 decoder_for: Callable[[str], Optional[Converter]]):
+        """
+        Args:
+            entity: Entity name
+            encoder_for: Driver hook - field type -> converter applied on write (None = store as is)
+            decoder_for: Driver hook - field type -> converter applied on read (None = use as is)
+        """
+        self.entity = entity
+        self._encoders: Dict[str, Converter] = {}
+        self._decoders: Dict[str, Converter] = {}
+        for field, descriptor in MetadataService.descriptors(entity).items():
+            encoder = encoder_for(descriptor['type'])
+            if encoder:
+                self._encoders[field] = encoder
+            decoder = decoder_for(descriptor['type'])
+            if decoder:
+                self._decoders[field] = decoder
+        self._plans: Dict[Tuple[str, ...], List[Tuple[int, Converter]]] = {}
+
+    def encode(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert document values to their stored representation"""
+        encoders = self._encoders
+        prepared = {}
+        for field, value in data.items():
+            if value is not None and field in encoders:
+                value = encoders[field](value)
+            prepared[field] = value
+        return prepared
+
+    def decode(self, columns: Sequence[str], row: Sequence[Any]) -> Dict[str, Any]:
+        """Convert one result row to a document"""
+        return self.decode_rows(columns, [row])[0]
+
+    def decode_rows(self, columns: Sequence[str], rows: Sequence[Sequence[Any]]) -> List[Dict[str, Any]]:
+        """Convert result rows sharing one column layout to documents"""
+        plan = self._plan(columns)
+        if not plan:
+            return [dict(zip(columns, row)) for row in rows]
+
+        documents = []
+        for row in rows:
+            values = list(row)
+            for index, convert in plan:
+                value = values[index]
+                if value is not None:
+                    values[index] = convert(value)
+            documents.append(dict(zip(columns, values)))
+        return documents
+
+    def _plan(self, columns: Sequence[str]) -> List[Tuple[int, Converter]]:
+        """Column-index -> converter list for a column layout (compiled once per layout)"""
+        layout = tuple(columns)
+        plan = self._plans.get(layout)
+        if plan is None:
+            plan = [(index, self._decoders[column]) for index, column in enumerate(layout) if column in self._decoders]
+            self._plans[layout] = plan
+        return plan
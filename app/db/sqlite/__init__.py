@@ -32,5 +32,6 @@ class SQLiteDatabase(DatabaseInterface):
         """Initialize SQLite database"""
         await self.core.init(self.db_path)
         await self.documents.initialize_schema()
+        await self.indexes.load_search()
         self._initialized = True
         self._health_state = "healthy"
@@ -1,24 +1,56 @@
 """
 SQLite core manager - connection and initialization.
+
+One read-write connection (the writer) plus a pool of read-only connections. In WAL mode
+readers don't block the writer or each other, and each aiosqlite connection has its own
+thread, so reads run in parallel instead of queueing behind one connection thread.
+
+Configured under "sqlite" in the config file (all optional):
+
+    "sqlite": {
+        "readers": 4,
+        "pragmas": {"synchronous": "NORMAL", "cache_size": -16000, "mmap_size": 268435456, "temp_store": "MEMORY"}
+    }
 """
 
+import asyncio
 import aiosqlite
 import logging
-from typing import Dict, Any, Optional
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Dict, Any, List, Optional
 from ..core_manager import CoreManager
 from app.core.config import Config
 
+# Tuning pragmas applied to every connection (overridable per key in config)
+DEFAULT_PRAGMAS: Dict[str, Any] = {
+    'synchronous': 'NORMAL',    # durable with WAL, without an fsync per commit
+    'cache_size': -16000,       # page cache per connection, in KiB when negative
+    'mmap_size': 268435456,     # 256MB memory-mapped reads
+    'temp_store': 'MEMORY',     # sorts/temp indexes in memory
+}
+# Pragmas that only make sense (or are only allowed) on the writer
+WRITER_PRAGMAS = ('synchronous',)
+DEFAULT_READERS = 4
+
+
 class SQLiteCore(CoreManager):
     """SQLite connection management"""
 
     def __init__(self, database):
         super().__init__(database)
-        self.connection = None
+        self.connection = None          # the writer
         self.db_path = None
+        self._readers: List[aiosqlite.Connection] = []
+        self._idle_readers: Optional[asyncio.Queue] = None
+        self._write_lock = asyncio.Lock()
 
     async def init(self, db_path: str, database_name: str = None):
-        """Initialize SQLite connection"""
+        """Initialize the writer connection and the reader pool"""
         self.db_path = db_path
+        settings = Config.get('sqlite', {}) or {}
+        pragmas = {**DEFAULT_PRAGMAS, **settings.get('pragmas', {})}
+
         self.connection = await aiosqlite.connect(db_path)
 
         # Enable foreign key constraints
@@ -27,8 +59,54 @@ class SQLiteCore(CoreManager):
         # Enable WAL mode for better concurrency
         await self.connection.execute("PRAGMA journal_mode = WAL")
 
+        await self._apply_pragmas(self.connection, pragmas)
         await self.connection.commit()
-        logging.info(f"SQLite: Connected to {db_path}")
+
+        # In-memory databases are private to their connection - readers would see an empty db
+        reader_count = 0 if db_path in ('', ':memory:') else int(settings.get('readers', DEFAULT_READERS))
+        self._idle_readers = asyncio.Queue()
+        for _ in range(reader_count):
+            reader = await aiosqlite.connect(self._read_only_uri(), uri=True)
+            await self._apply_pragmas(reader, {k: v for k, v in pragmas.items() if k not in WRITER_PRAGMAS})
+            self._readers.append(reader)
+            self._idle_readers.put_nowait(reader)
+
+        logging.info(f"SQLite: Connected to {db_path} (1 writer, {reader_count} readers)")
+
+    def _read_only_uri(self) -> str:
+        """file: URI opening the database read-only - as_uri() escapes '?', '#' and '%' in the path"""
+        return f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+
+    async def _apply_pragmas(self, connection: aiosqlite.Connection, pragmas: Dict[str, Any]) -> None:
+        for name, value in pragmas.items():
+            if not name.isidentifier():
+                raise ValueError(f"sqlite: invalid pragma {name}")
+            await connection.execute(f"PRAGMA {name} = {value!r}" if isinstance(value, str) else f"PRAGMA {name} = {int(value)}")
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Check out a read-only connection (the writer, under its lock, when no readers are configured)"""
+        if not self._readers:
+            # sharing the writer unlocked would show reads another task's uncommitted writes
+            async with self._write_lock:
+                yield self.connection
+            return
+        connection = await self._idle_readers.get()
+        try:
+            yield connection
+        finally:
+            self._idle_readers.put_nowait(connection)
+
+    @asynccontextmanager
+    async def writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Hold the writer connection for one write (statements + commit) at a time.
+        A write that raises is rolled back, so its open transaction never leaks into the next one."""
+        async with self._write_lock:
+            try:
+                yield self.connection
+            except BaseException:
+                await self.connection.rollback()
+                raise
 
     @property
     def id_field(self) -> str:
@@ -44,7 +122,10 @@ class SQLiteCore(CoreManager):
         return self.connection
 
     async def close(self):
-        """Close database connection"""
+        """Close the reader pool and the writer connection"""
+        for reader in self._readers:
+            await reader.close()
+        self._readers = []
         if self.connection:
             await self.connection.close()
             logging.info("SQLite: Connection closed")
@@ -61,26 +142,30 @@ class SQLiteCore(CoreManager):
             return False
 
         try:
-            # Get all table names
-            cursor = await self.connection.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
-            )
-            tables = await cursor.fetchall()
+            async with self.writer():
+                # Get all table names - FTS5 search tables first, their shadow tables go with them
+                cursor = await self.connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' "
+                    "ORDER BY sql LIKE 'CREATE VIRTUAL%' DESC"
+                )
+                tables = await cursor.fetchall()
 
-            # Drop all tables
-            for table in tables:
-                await self.connection.execute(f'DROP TABLE IF EXISTS "{table[0]}"')
+                # Drop all tables
+                for table in tables:
+                    await self.connection.execute(f'DROP TABLE IF EXISTS "{table[0]}"')
 
-            await self.connection.commit()
+                await self.connection.commit()
 
-            # Recreate all tables with proper schemas from metadata
-            from app.core.metadata import MetadataService
-            for entity in MetadataService.list_entities():
-                create_sql = self.database.documents._build_create_table_sql(entity)
-                await self.connection.execute(create_sql)
+                # Recreate all tables with proper schemas from metadata
+                from app.core.metadata import MetadataService
+                for entity in MetadataService.list_entities():
+                    create_sql = self.database.documents._build_create_table_sql(entity)
+                    await self.connection.execute(create_sql)
 
-            await self.connection.commit()
+                await self.connection.commit()
 
+            # Takes the writer itself
+            await self.database.indexes.initialize_search()
             logging.info("SQLite: Database wiped and reinitialized with proper schemas")
             return True
 
@@ -99,9 +184,10 @@ class SQLiteCore(CoreManager):
             }
 
         try:
-            # Get all tables
+            # Get all tables (not the FTS5 search tables or their shadow tables)
             cursor = await self.connection.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+                "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' "
+                "AND name NOT LIKE '%\\_search' ESCAPE '\\' AND name NOT LIKE '%\\_search\\_%' ESCAPE '\\'"
             )
             tables = await cursor.fetchall()
 
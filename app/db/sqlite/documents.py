@@ -6,10 +6,12 @@ import json
 import uuid
 import sqlite3
 import aiosqlite
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import groupby
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from ..document_manager import DocumentManager
 from ..core_manager import CoreManager
+from ..row_codec import RowCodec, Converter
 from app.core.exceptions import DocumentNotFound, DatabaseError, DuplicateConstraintError
 from app.core.metadata import MetadataService
 from app.core.config import Config
@@ -20,6 +22,7 @@ class SqliteDocuments(DocumentManager):
 
     def __init__(self, database):
         super().__init__(database)
+        self._codecs: Dict[str, RowCodec] = {}
 
     def _get_sqlite_type(self, field_type: str) -> str:
         """Map schema field type to SQLite type"""
@@ -88,126 +91,143 @@ class SqliteDocuments(DocumentManager):
         dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
         return dt.strftime('%Y-%m-%d')
 
+    def _encoder_for(self, field_type: str) -> Optional[Converter]:
+        """Row codec hook: convert Python values to SQLite-compatible format"""
+        if field_type == 'Date':
+            return self._convert_date
+        elif field_type == 'Datetime':
+            return self._convert_datetime
+        elif field_type == 'Boolean':
+            return lambda value: 1 if value else 0
+        elif field_type == 'JSON':
+            return lambda value: json.dumps(value) if not isinstance(value, str) else value
+        return None
+
+    def _decoder_for(self, field_type: str) -> Optional[Converter]:
+        """Row codec hook: convert booleans back from 0/1 and parse JSON text"""
+        if field_type == 'Boolean':
+            return bool
+        elif field_type == 'JSON':
+            return lambda value: json.loads(value) if isinstance(value, str) else value
+        return None
+
+    def _codec(self, entity: str) -> RowCodec:
+        """Compiled row codec for an entity (built by initialize_schema, or on first use)"""
+        codec = self._codecs.get(entity)
+        if codec is None:
+            codec = self._codecs[entity] = RowCodec(entity, self._encoder_for, self._decoder_for)
+        return codec
+
     def _prepare_values_for_sqlite(self, entity: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Convert Python values to SQLite-compatible format"""
-        prepared = {}
-        for field_name, value in data.items():
-            if value is None:
-                prepared[field_name] = None
-            else:
-                field_type = MetadataService.get(entity, field_name, 'type')
-                if field_type == 'Date':
-                    prepared[field_name] = self._convert_date(value)
-                elif field_type == 'Datetime':
-                    prepared[field_name] = self._convert_datetime(value)
-                elif field_type == 'Boolean':
-                    prepared[field_name] = 1 if value else 0
-                elif field_type == 'JSON':
-                    prepared[field_name] = json.dumps(value) if not isinstance(value, str) else value
-                else:
-                    prepared[field_name] = value
-        return prepared
+        return self._codec(entity).encode(data)
 
     async def initialize_schema(self):
-        """Create all tables with proper schemas from metadata"""
+        """Create all tables with proper schemas from metadata and compile their row codecs"""
         db = self.database.core.get_connection()
         for entity in MetadataService.list_entities():
             create_sql = self._build_create_table_sql(entity)
             await db.execute(create_sql)
+            self._codecs[entity] = RowCodec(entity, self._encoder_for, self._decoder_for)
         await db.commit()
 
     async def _create_impl(self, entity: str, id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create document in SQLite with proper columns"""
-        db = self.database.core.get_connection()
-        data.pop('id', None)
+        async with self.database.core.writer() as db:
+            data.pop('id', None)
 
-        # Prepare values
-        prepared_data = self._prepare_values_for_sqlite(entity, data)
+            # Prepare values
+            prepared_data = self._prepare_values_for_sqlite(entity, data)
 
-        # Build INSERT statement dynamically
-        fields = ['id'] + list(prepared_data.keys())
-        placeholders = ', '.join(['?' for _ in fields])
-        fields_str = ', '.join(f'"{f}"' for f in fields)
-        values = [id] + list(prepared_data.values())
+            # Build INSERT statement dynamically
+            fields = ['id'] + list(prepared_data.keys())
+            placeholders = ', '.join(['?' for _ in fields])
+            fields_str = ', '.join(f'"{f}"' for f in fields)
+            values = [id] + list(prepared_data.values())
 
-        try:
-            await db.execute(
-                f'INSERT INTO "{entity}" ({fields_str}) VALUES ({placeholders})',
-                values
-            )
-            await db.commit()
-            return {'id': id, **data}
-
-        except (aiosqlite.IntegrityError, sqlite3.IntegrityError) as e:
-            error_msg = str(e)
-            field = None
-
-            # Check for UNIQUE constraint violation
-            if 'UNIQUE constraint failed:' in error_msg:
-                # Parse "UNIQUE constraint failed: User.username" -> "username"
-                parts = error_msg.split('UNIQUE constraint failed:')[1].strip()
-                # Handle both single field "User.username" and multi-field "User.field1, User.field2"
-                if '.' in parts:
-                    # Extract first field from "User.username" or "User.field1, User.field2"
-                    first_field_part = parts.split(',')[0].strip()  # Get "User.username"
-                    field = first_field_part.split('.')[1] if '.' in first_field_part else None
-
-                # Create user-friendly message
-                field_display = field.capitalize() if field else "Field"
-                message = f"{field_display} already exists"
-
-                raise DuplicateConstraintError(
-                    message=message,
-                    entity=entity,
-                    field=field,
-                    entity_id=id
+            try:
+                await db.execute(
+                    f'INSERT INTO "{entity}" ({fields_str}) VALUES ({placeholders})',
+                    values
                 )
-
-            # Check for NOT NULL constraint violation
-            elif 'NOT NULL constraint failed:' in error_msg:
-                # Parse "NOT NULL constraint failed: User.username" -> "username"
-                parts = error_msg.split('NOT NULL constraint failed:')[1].strip()
-                if '.' in parts:
-                    field = parts.split('.')[1].strip()
-
-                # Create user-friendly message
-                field_display = field.capitalize() if field else "Field"
-                message = f"{field_display} is required"
-
-                from app.core.notify import Notification, HTTP
-                Notification.error(HTTP.BAD_REQUEST, message, entity=entity, entity_id=id, field=field)
-                raise  # Unreachable
-
-            # Unknown integrity error
-            raise DatabaseError(f"SQLite integrity error: {error_msg}")
+                await db.commit()
+                return {'id': id, **data}
+
+            except (aiosqlite.IntegrityError, sqlite3.IntegrityError) as e:
+                error_msg = str(e)
+                field = None
+
+                # Check for UNIQUE constraint violation
+                if 'UNIQUE constraint failed:' in error_msg:
+                    # Parse "UNIQUE constraint failed: User.username" -> "username"
+                    parts = error_msg.split('UNIQUE constraint failed:')[1].strip()
+                    # Handle both single field "User.username" and multi-field "User.field1, User.field2"
+                    if '.' in parts:
+                        # Extract first field from "User.username" or "User.field1, User.field2"
+                        first_field_part = parts.split(',')[0].strip()  # Get "User.username"
+                        field = first_field_part.split('.')[1] if '.' in first_field_part else None
+
+                    # Create user-friendly message
+                    field_display = field.capitalize() if field else "Field"
+                    message = f"{field_display} already exists"
+
+                    raise DuplicateConstraintError(
+                        message=message,
+                        entity=entity,
+                        field=field,
+                        entity_id=id
+                    )
+
+                # Check for NOT NULL constraint violation
+                elif 'NOT NULL constraint failed:' in error_msg:
+                    # Parse "NOT NULL constraint failed: User.username" -> "username"
+                    parts = error_msg.split('NOT NULL constraint failed:')[1].strip()
+                    if '.' in parts:
+                        field = parts.split('.')[1].strip()
+
+                    # Create user-friendly message
+                    field_display = field.capitalize() if field else "Field"
+                    message = f"{field_display} is required"
+
+                    from app.core.notify import Notification, HTTP
+                    Notification.error(HTTP.BAD_REQUEST, message, entity=entity, entity_id=id, field=field)
+                    raise  # Unreachable
+
+                # Unknown integrity error
+                raise DatabaseError(f"SQLite integrity error: {error_msg}")
 
     async def _get_impl(self, entity: str, id: str) -> Tuple[Dict[str, Any], int]:
         """Get single document by ID from proper columns"""
-        db = self.database.core.get_connection()
-
-        cursor = await db.execute(
-            f'SELECT * FROM "{entity}" WHERE id = ?',
-            (id,)
-        )
-        row = await cursor.fetchone()
-
-        if not row:
-            raise DocumentNotFound(entity, id)
+        async with self.database.core.reader() as db:
+            cursor = await db.execute(
+                f'SELECT * FROM "{entity}" WHERE id = ?',
+                (id,)
+            )
+            row = await cursor.fetchone()
 
-        # Convert row to dict using column names
-        document = dict(zip([d[0] for d in cursor.description], row))
+            if not row:
+                raise DocumentNotFound(entity, id)
 
-        # Convert boolean values back from 0/1
-        fields_meta = MetadataService.fields(entity)
-        for field_name, value in document.items():
-            if value is not None:
-                field_type = MetadataService.get(entity, field_name, 'type')
-                if field_type == 'Boolean':
-                    document[field_name] = bool(value)
-                elif field_type == 'JSON' and isinstance(value, str):
-                    document[field_name] = json.loads(value)
+            document = self._codec(entity).decode([d[0] for d in cursor.description], row)
+            return document, 1
+
+    async def _get_many_impl(self, entity: str, ids: List[str]) -> List[Dict[str, Any]]:
+        """Get documents for a set of IDs with chunked IN queries"""
+        async with self.database.core.reader() as db:
+            codec = self._codec(entity)
+            documents = []
+            # stay well below SQLITE_MAX_VARIABLE_NUMBER on older builds
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                placeholders = ', '.join('?' for _ in chunk)
+                cursor = await db.execute(
+                    f'SELECT * FROM "{entity}" WHERE id IN ({placeholders})',
+                    chunk
+                )
+                rows = await cursor.fetchall()
+                documents.extend(codec.decode_rows([d[0] for d in cursor.description], rows))
 
-        return document, 1
+            return documents
 
     async def _get_all_impl(
         self,
@@ -216,12 +236,100 @@ class SqliteDocuments(DocumentManager):
         filter: Optional[Dict[str, Any]] = None,
         page: int = 1,
         pageSize: int = 25,
-        substring_match: bool = True
-    ) -> Tuple[List[Dict[str, Any]], int]:
+        substring_match: bool = True,
+        cursor: Optional[Dict[str, Any]] = None,
+        count_mode: str = 'exact'
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
         """Get paginated list of documents with filter/sort on proper columns"""
-        db = self.database.core.get_connection()
-
-        # Build WHERE clause from filters
+        async with self.database.core.reader() as db:
+            where_parts, params = self._build_where(entity, filter, substring_match)
+            where_clause = f"WHERE {' AND '.join(where_parts)}" if where_parts else ""
+
+            # Build ORDER BY clause - sort fields plus the id tiebreaker (keyset order)
+            keyset, sort_exprs, order_clause = self._build_order(entity, sort)
+
+            # The total (filter only - no seek or pagination) rides along as an uncorrelated scalar
+            # subquery: SQLite evaluates it once, and the page and count share one round trip through
+            # the connection thread. (COUNT(*) OVER() would materialize every matching row.)
+            count_sql = self._count_sql(entity, where_clause, count_mode)
+            select_list = f'*, ({count_sql}) AS "_total"' if count_sql else '*'
+
+            # Pagination: seek past the cursor row, or skip to the page
+            page_where_parts, page_params = list(where_parts), (list(params) if count_sql else []) + list(params)
+            if cursor and cursor['v']:
+                seek_sql, seek_params = self._build_seek_clause(entity, keyset, sort_exprs, cursor['v'])
+                page_where_parts.append(seek_sql)
+                page_params.extend(seek_params)
+                offset = 0
+            else:
+                offset = self._calculate_pagination_offset(page, pageSize)
+            page_where_clause = f"WHERE {' AND '.join(page_where_parts)}" if page_where_parts else ""
+            limit_clause = f"LIMIT ? OFFSET ?"
+            page_params.extend([pageSize + 1, offset])  # one look-ahead row for hasMore
+
+            # Execute main query
+            query = f'SELECT {select_list} FROM "{entity}" {page_where_clause} {order_clause} {limit_clause}'
+            db_cursor = await db.execute(query, page_params)
+            rows = await db_cursor.fetchall()
+            column_names = [d[0] for d in db_cursor.description]
+
+            total = None
+            if count_sql and rows:
+                total = rows[0][-1]
+                rows = [row[:-1] for row in rows]
+                column_names = column_names[:-1]
+            elif count_sql:
+                # Empty page (no matches, or past the end) - the count still has to be asked for
+                count_cursor = await db.execute(count_sql, params)
+                total = (await count_cursor.fetchone())[0]
+
+            # Convert rows to documents
+            documents = self._codec(entity).decode_rows(column_names, rows)
+
+            return documents, total
+
+    async def _stream_impl(
+        self,
+        entity: str,
+        sort: Optional[List[Tuple[str, str]]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        substring_match: bool = True
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream matching rows in keyset order, one EXPORT_BATCH_SIZE page per reader checkout.
+        Each page seeks past the last row of the one before, so a slow client never holds a pooled
+        reader (or a WAL snapshot) between batches. Rows written mid-export show up if they sort
+        after the page already sent."""
+        where_parts, params = self._build_where(entity, filter, substring_match)
+        keyset, sort_exprs, order_clause = self._build_order(entity, sort)
+        codec = self._codec(entity)
+
+        last: Optional[Dict[str, Any]] = None
+        while True:
+            page_where_parts, page_params = list(where_parts), list(params)
+            if last is not None:
+                seek_sql, seek_params = self._build_seek_clause(entity, keyset, sort_exprs, self._cursor_values(keyset, last))
+                page_where_parts.append(seek_sql)
+                page_params.extend(seek_params)
+            page_where_clause = f"WHERE {' AND '.join(page_where_parts)}" if page_where_parts else ""
+
+            async with self.database.core.reader() as db:
+                db_cursor = await db.execute(
+                    f'SELECT * FROM "{entity}" {page_where_clause} {order_clause} LIMIT ?',
+                    page_params + [self.EXPORT_BATCH_SIZE]
+                )
+                rows = await db_cursor.fetchall()
+                column_names = [d[0] for d in db_cursor.description]
+
+            if not rows:
+                return
+            documents = codec.decode_rows(column_names, rows)
+            yield documents
+            if len(rows) < self.EXPORT_BATCH_SIZE:
+                return
+            last = documents[-1]
+
+    def _build_where(self, entity: str, filter: Optional[Dict[str, Any]], substring_match: bool) -> Tuple[List[str], List[Any]]:
+        """WHERE conditions and their params for a get_all/export filter"""
         where_parts = []
         params = []
 
@@ -251,7 +359,11 @@ class SqliteDocuments(DocumentManager):
                         # Handle all 4 combinations of case_sensitive and substring_match
                         case_sensitive = Config.get("case_sensitive", False)
 
-                        if substring_match:
+                        if substring_match and not case_sensitive and proper_field in self.database.indexes.search_fields(entity):
+                            # Searchable field: LIKE against the trigram FTS5 table, matched back by rowid
+                            where_parts.append(f'rowid IN (SELECT rowid FROM "{entity}_search" WHERE "{proper_field}" LIKE ?)')
+                            params.append(f"%{value}%")
+                        elif substring_match:
                             # Substring matching: partial match with LIKE
                             if case_sensitive:
                                 # SQLite LIKE is case-insensitive by default, use GLOB for case-sensitive
@@ -282,177 +394,248 @@ class SqliteDocuments(DocumentManager):
                         where_parts.append(f'"{proper_field}" = ?')
                         params.append(value)
 
-        where_clause = f"WHERE {' AND '.join(where_parts)}" if where_parts else ""
-
-        # Build ORDER BY clause
-        order_clause = ""
-        if sort:
-            order_parts = []
-            for field, direction in sort:
-                proper_field = MetadataService.get_proper_name(entity, field)
-                field_type = MetadataService.get(entity, proper_field, 'type') or 'String'
+        return where_parts, params
+
+    def _build_order(self, entity: str, sort: Optional[List[Tuple[str, str]]]) -> Tuple[List[Tuple[str, str]], List[str], str]:
+        """Keyset (sort fields plus the id tiebreaker), its column expressions and the ORDER BY clause"""
+        keyset = self._keyset_sort(entity, sort)
+        sort_exprs = [self._sort_expression(entity, field) for field, _ in keyset]
+        order_clause = "ORDER BY " + ", ".join(f"{expr} {direction.upper()}" for expr, (_, direction) in zip(sort_exprs, keyset))
+        return keyset, sort_exprs, order_clause
+
+    def _count_sql(self, entity: str, where_clause: str, count_mode: str) -> Optional[str]:
+        """
+        Query for a get_all total (takes the filter params), or None for count_mode 'none'.
+        estimate: MAX(rowid) when unfiltered (exact until rows are deleted), otherwise a count
+        that stops at ESTIMATE_COUNT_CAP rows.
+        """
+        if count_mode == 'none':
+            return None
+        if count_mode == 'estimate':
+            if where_clause:
+                return f'SELECT COUNT(*) FROM (SELECT 1 FROM "{entity}" {where_clause} LIMIT {self.ESTIMATE_COUNT_CAP})'
+            return f'SELECT COALESCE(MAX(rowid), 0) FROM "{entity}"'
+        return f'SELECT COUNT(*) FROM "{entity}" {where_clause}'
+
+    def _sort_expression(self, entity: str, field: str) -> str:
+        """Column expression a keyset field is ordered (and compared) by"""
+        if field == 'id':
+            return 'id' if self.database.case_sensitive_sorting else 'id COLLATE NOCASE'
+        field_type = MetadataService.get(entity, field, 'type') or 'String'
+
+        # Only apply COLLATE NOCASE to String fields (not numeric, date, etc.)
+        if not self.database.case_sensitive_sorting and field_type == 'String':
+            return f'"{field}" COLLATE NOCASE'
+        return f'"{field}"'
+
+    def _build_seek_clause(self, entity: str, keyset: List[Tuple[str, str]], sort_exprs: List[str],
+                           values: List[Any]) -> Tuple[str, List[Any]]:
+        """
+        WHERE clause selecting rows after the cursor row in keyset order:
+            (a > ?) OR (a = ? AND b > ?) OR (a = ? AND b = ? AND id > ?)
+        SQLite sorts NULLs first ascending and last descending.
+        """
+        codec = self._codec(entity)
+        params: List[Any] = []
+
+        keys = []
+        for (field, direction), expr, value in zip(keyset, sort_exprs, values):
+            column = 'id' if field == 'id' else f'"{field}"'
+            keys.append((field, direction, expr, column, None if value is None else codec.encode({field: value})[field]))
+
+        clauses = []
+        for i, (field, direction, expr, column, value) in enumerate(keys):
+            if value is None:
+                if direction == 'desc':
+                    continue  # only more NULLs follow a NULL
+                after = f'{column} IS NOT NULL'
+            elif direction == 'asc':
+                after = f'{expr} > ?'
+            else:
+                after = f'({expr} < ? OR {column} IS NULL)'
 
-                # Only apply COLLATE NOCASE to String fields (not numeric, date, etc.)
-                if self.database.case_sensitive_sorting:
-                    sort_expr = f'"{proper_field}" {direction.upper()}'
+            # Rows tied with the cursor on every earlier key...
+            parts = []
+            for _, _, e, c, v in keys[:i]:
+                if v is None:
+                    parts.append(f'{c} IS NULL')
                 else:
-                    if field_type == 'String':
-                        sort_expr = f'"{proper_field}" COLLATE NOCASE {direction.upper()}'
-                    else:
-                        sort_expr = f'"{proper_field}" {direction.upper()}'
-
-                order_parts.append(sort_expr)
-            order_clause = f"ORDER BY {', '.join(order_parts)}"
-        else:
-            # Default sort by 'id' column for consistent pagination
-            collate = "" if self.database.case_sensitive_sorting else " COLLATE NOCASE"
-            order_clause = f"ORDER BY id{collate} ASC"
-
-        # Pagination
-        offset = self._calculate_pagination_offset(page, pageSize)
-        limit_clause = f"LIMIT ? OFFSET ?"
-        params.extend([pageSize, offset])
-
-        # Execute main query
-        query = f'SELECT * FROM "{entity}" {where_clause} {order_clause} {limit_clause}'
-        cursor = await db.execute(query, params)
-        rows = await cursor.fetchall()
-
-        # Save column names before executing COUNT query
-        column_names = [d[0] for d in cursor.description]
-
-        # Get total count (without pagination)
-        count_params = params[:-2]  # Exclude LIMIT/OFFSET params
-        count_query = f'SELECT COUNT(*) FROM "{entity}" {where_clause}'
-        count_cursor = await db.execute(count_query, count_params)
-        total = (await count_cursor.fetchone())[0]
-
-        # Convert rows to documents
-        documents = []
-        for row in rows:
-            document = dict(zip(column_names, row))
-
-            # Convert boolean values back from 0/1
-            for field_name, value in document.items():
-                if value is not None:
-                    field_type = MetadataService.get(entity, field_name, 'type')
-                    if field_type == 'Boolean':
-                        document[field_name] = bool(value)
-                    elif field_type == 'JSON' and isinstance(value, str):
-                        document[field_name] = json.loads(value)
-
-            documents.append(document)
-
-        return documents, total
+                    parts.append(f'{e} = ?')
+                    params.append(v)
+            # ...and after it on this one
+            parts.append(after)
+            if value is not None:
+                params.append(value)
+            clauses.append(' AND '.join(parts))
+
+        if not clauses:
+            return '0', []
+        return '(' + ' OR '.join(f'({clause})' for clause in clauses) + ')', params
 
     async def _update_impl(self, entity: str, id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update document with proper columns"""
-        db = self.database.core.get_connection()
-        data.pop('id', None)
+        async with self.database.core.writer() as db:
+            data.pop('id', None)
 
-        # Prepare values
-        prepared_data = self._prepare_values_for_sqlite(entity, data)
+            # Prepare values
+            prepared_data = self._prepare_values_for_sqlite(entity, data)
 
-        # Build UPDATE statement dynamically
-        set_parts = []
-        values = []
-        for field_name, value in prepared_data.items():
-            set_parts.append(f'"{field_name}" = ?')
-            values.append(value)
+            # Build UPDATE statement dynamically
+            set_parts = []
+            values = []
+            for field_name, value in prepared_data.items():
+                set_parts.append(f'"{field_name}" = ?')
+                values.append(value)
 
-        values.append(id)  # Add id for WHERE clause
+            values.append(id)  # Add id for WHERE clause
 
-        try:
-            cursor = await db.execute(
-                f'UPDATE "{entity}" SET {", ".join(set_parts)} WHERE id = ?',
-                values
-            )
-            await db.commit()
-
-            if cursor.rowcount == 0:
-                raise DocumentNotFound(entity, id)
-
-            return {'id': id, **data}
-
-        except (aiosqlite.IntegrityError, sqlite3.IntegrityError) as e:
-            error_msg = str(e)
-            field = None
-
-            # Check for UNIQUE constraint violation
-            if 'UNIQUE constraint failed:' in error_msg:
-                # Parse "UNIQUE constraint failed: User.username" -> "username"
-                parts = error_msg.split('UNIQUE constraint failed:')[1].strip()
-                # Handle both single field "User.username" and multi-field "User.field1, User.field2"
-                if '.' in parts:
-                    # Extract first field from "User.username" or "User.field1, User.field2"
-                    first_field_part = parts.split(',')[0].strip()  # Get "User.username"
-                    field = first_field_part.split('.')[1] if '.' in first_field_part else None
-
-                # Create user-friendly message
-                field_display = field.capitalize() if field else "Field"
-                message = f"{field_display} already exists"
-
-                raise DuplicateConstraintError(
-                    message=message,
-                    entity=entity,
-                    field=field,
-                    entity_id=id
+            try:
+                cursor = await db.execute(
+                    f'UPDATE "{entity}" SET {", ".join(set_parts)} WHERE id = ?',
+                    values
                 )
-
-            # Check for NOT NULL constraint violation
-            elif 'NOT NULL constraint failed:' in error_msg:
-                # Parse "NOT NULL constraint failed: User.username" -> "username"
-                parts = error_msg.split('NOT NULL constraint failed:')[1].strip()
-                if '.' in parts:
-                    field = parts.split('.')[1].strip()
-
-                # Create user-friendly message
-                field_display = field.capitalize() if field else "Field"
-                message = f"{field_display} is required"
-
-                from app.core.notify import Notification, HTTP
-                Notification.error(HTTP.BAD_REQUEST, message, entity=entity, entity_id=id, field=field)
-                raise  # Unreachable
-
-            # Unknown integrity error
-            raise DatabaseError(f"SQLite integrity error: {error_msg}")
-        except Exception as e:
-            raise DatabaseError(f"Database error during update: {str(e)}")
+                await db.commit()
+
+                if cursor.rowcount == 0:
+                    raise DocumentNotFound(entity, id)
+
+                return {'id': id, **data}
+
+            except (aiosqlite.IntegrityError, sqlite3.IntegrityError) as e:
+                error_msg = str(e)
+                field = None
+
+                # Check for UNIQUE constraint violation
+                if 'UNIQUE constraint failed:' in error_msg:
+                    # Parse "UNIQUE constraint failed: User.username" -> "username"
+                    parts = error_msg.split('UNIQUE constraint failed:')[1].strip()
+                    # Handle both single field "User.username" and multi-field "User.field1, User.field2"
+                    if '.' in parts:
+                        # Extract first field from "User.username" or "User.field1, User.field2"
+                        first_field_part = parts.split(',')[0].strip()  # Get "User.username"
+                        field = first_field_part.split('.')[1] if '.' in first_field_part else None
+
+                    # Create user-friendly message
+                    field_display = field.capitalize() if field else "Field"
+                    message = f"{field_display} already exists"
+
+                    raise DuplicateConstraintError(
+                        message=message,
+                        entity=entity,
+                        field=field,
+                        entity_id=id
+                    )
+
+                # Check for NOT NULL constraint violation
+                elif 'NOT NULL constraint failed:' in error_msg:
+                    # Parse "NOT NULL constraint failed: User.username" -> "username"
+                    parts = error_msg.split('NOT NULL constraint failed:')[1].strip()
+                    if '.' in parts:
+                        field = parts.split('.')[1].strip()
+
+                    # Create user-friendly message
+                    field_display = field.capitalize() if field else "Field"
+                    message = f"{field_display} is required"
+
+                    from app.core.notify import Notification, HTTP
+                    Notification.error(HTTP.BAD_REQUEST, message, entity=entity, entity_id=id, field=field)
+                    raise  # Unreachable
+
+                # Unknown integrity error
+                raise DatabaseError(f"SQLite integrity error: {error_msg}")
+            except Exception as e:
+                raise DatabaseError(f"Database error during update: {str(e)}")
 
     async def _delete_impl(self, entity: str, id: str) -> Tuple[Dict[str, Any], int]:
         """Delete document by ID from proper columns"""
-        db = self.database.core.get_connection()
+        async with self.database.core.writer() as db:
+            # Fetch document before deleting
+            cursor = await db.execute(
+                f'SELECT * FROM "{entity}" WHERE id = ?',
+                (id,)
+            )
+            row = await cursor.fetchone()
 
-        # Fetch document before deleting
-        cursor = await db.execute(
-            f'SELECT * FROM "{entity}" WHERE id = ?',
-            (id,)
-        )
-        row = await cursor.fetchone()
+            if not row:
+                raise DocumentNotFound(entity, id)
 
-        if not row:
-            raise DocumentNotFound(entity, id)
+            document = self._codec(entity).decode([d[0] for d in cursor.description], row)
 
-        # Convert row to dict using column names
-        document = dict(zip([d[0] for d in cursor.description], row))
+            # Delete document
+            await db.execute(
+                f'DELETE FROM "{entity}" WHERE id = ?',
+                (id,)
+            )
+            await db.commit()
 
-        # Convert boolean values back from 0/1
-        for field_name, value in document.items():
-            if value is not None:
-                field_type = MetadataService.get(entity, field_name, 'type')
-                if field_type == 'Boolean':
-                    document[field_name] = bool(value)
-                elif field_type == 'JSON' and isinstance(value, str):
-                    document[field_name] = json.loads(value)
-
-        # Delete document
-        await db.execute(
-            f'DELETE FROM "{entity}" WHERE id = ?',
-            (id,)
-        )
-        await db.commit()
+            return document, 1
+
+    async def _bulk_write_impl(self, entity: str, ops: List[Tuple[str, str, Dict[str, Any]]]) -> List[Optional[Exception]]:
+        """Write a batch in one writer transaction - executemany per run of same-shaped statements.
+        If the batch hits a constraint it is rolled back and replayed item by item under savepoints,
+        so only the offending items fail."""
+        statements = [self._bulk_statement(entity, op, id, data) for op, id, data in ops]
 
-        return document, 1
+        async with self.database.core.writer() as db:
+            try:
+                for sql, run in groupby(statements, key=lambda statement: statement[0]):
+                    await db.executemany(sql, [params for _, params in run])
+                await db.commit()
+                return [None] * len(ops)
+            except (aiosqlite.IntegrityError, sqlite3.IntegrityError):
+                await db.rollback()
+            except Exception:
+                # don't leave part of the batch pending for the next writer to commit
+                await db.rollback()
+                raise
+
+            # Explicit BEGIN so the savepoints nest in one transaction - otherwise the first
+            # SAVEPOINT opens it and each RELEASE of that outermost savepoint commits
+            outcomes: List[Optional[Exception]] = []
+            await db.execute('BEGIN')
+            try:
+                for (sql, params), (_, id, _) in zip(statements, ops):
+                    await db.execute('SAVEPOINT bulk_item')
+                    try:
+                        await db.execute(sql, params)
+                        outcomes.append(None)
+                    except (aiosqlite.IntegrityError, sqlite3.IntegrityError) as e:
+                        await db.execute('ROLLBACK TO bulk_item')
+                        outcomes.append(self._integrity_error(entity, id, e))
+                    await db.execute('RELEASE bulk_item')
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+            return outcomes
+
+    def _bulk_statement(self, entity: str, op: str, id: str, data: Dict[str, Any]) -> Tuple[str, List[Any]]:
+        """SQL and parameters for one bulk op - same-shaped ops share the SQL text"""
+        if op == 'delete':
+            return f'DELETE FROM "{entity}" WHERE id = ?', [id]
+
+        prepared_data = self._prepare_values_for_sqlite(entity, {k: v for k, v in data.items() if k != 'id'})
+        if op == 'create':
+            fields_str = ', '.join(f'"{f}"' for f in ['id', *prepared_data])
+            placeholders = ', '.join('?' for _ in range(len(prepared_data) + 1))
+            return f'INSERT INTO "{entity}" ({fields_str}) VALUES ({placeholders})', [id, *prepared_data.values()]
+
+        set_parts = ', '.join(f'"{f}" = ?' for f in prepared_data)
+        return f'UPDATE "{entity}" SET {set_parts} WHERE id = ?', [*prepared_data.values(), id]
+
+    def _integrity_error(self, entity: str, id: str, e: Exception) -> Exception:
+        """Translate a SQLite integrity error for one bulk item to the app exception it reports"""
+        error_msg = str(e)
+        if 'UNIQUE constraint failed:' in error_msg:
+            # "UNIQUE constraint failed: User.username" or "User.field1, User.field2" -> first field
+            first_field_part = error_msg.split('UNIQUE constraint failed:')[1].strip().split(',')[0].strip()
+            field = first_field_part.split('.')[1] if '.' in first_field_part else None
+            field_display = field.capitalize() if field else "Field"
+            return DuplicateConstraintError(message=f"{field_display} already exists", entity=entity, field=field, entity_id=id)
+        if 'NOT NULL constraint failed:' in error_msg:
+            field = error_msg.split('NOT NULL constraint failed:')[1].strip().split('.')[-1]
+            return DatabaseError(message=f"{field.capitalize()} is required")
+        return DatabaseError(message=f"SQLite integrity error: {error_msg}")
 
     def _get_core_manager(self) -> CoreManager:
         """Get core manager instance"""
@@ -538,3 +721,12 @@ class SqliteDocuments(DocumentManager):
     ) -> bool:
         """Validate unique constraints for SQLite"""
         return True  # SQLite handles unique constraints natively via indexes
+
+    async def _find_duplicate_uniques(
+        self,
+        entity: str,
+        constraint_fields: List[str],
+        docs: List[Dict[str, Any]]
+    ) -> set:
+        """Find duplicated unique values for SQLite"""
+        return set()  # SQLite enforces unique constraints natively via indexes - duplicates cannot be stored
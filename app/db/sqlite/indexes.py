@@ -1,12 +1,15 @@
 """
-SQLite index management - unique constraints.
+SQLite index management - unique constraints and FTS5 search tables.
 """
 
 import aiosqlite
-from typing import List, Optional
+import logging
+import sqlite3
+from typing import Dict, List, Optional
 
 from ..index_manager import IndexManager
 from app.core.exceptions import DatabaseError
+from app.core.metadata import MetadataService
 
 
 class SqliteIndexes(IndexManager):
@@ -14,44 +17,146 @@ class SqliteIndexes(IndexManager):
 
     def __init__(self, database):
         super().__init__(database)
+        # entity -> searchable fields covered by its "<entity>_search" FTS5 table
+        self._search_fields: Dict[str, List[str]] = {}
+
+    def search_fields(self, entity: str) -> List[str]:
+        """Fields whose substring filters can go through the entity's search table"""
+        return self._search_fields.get(entity, [])
+
+    def _search_table_sql(self, entity: str, fields: List[str]) -> str:
+        columns = ', '.join(f'"{field}"' for field in fields)
+        return (f'CREATE VIRTUAL TABLE "{entity}_search" USING fts5({columns}, '
+                f'content="{entity}", tokenize="trigram")')
+
+    async def _search_table_current(self, db: aiosqlite.Connection, entity: str, fields: List[str]) -> bool:
+        cursor = await db.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (f"{entity}_search",))
+        row = await cursor.fetchone()
+        return bool(row) and row[0] == self._search_table_sql(entity, fields)
+
+    async def _verify_search(self, db: aiosqlite.Connection, entity: str) -> None:
+        """
+        Rebuild the search table if its index no longer matches the entity's rows. It is keyed by
+        rowid, which VACUUM may renumber on tables without an INTEGER PRIMARY KEY, and a stale
+        index answers substring filters with the wrong rows. Reads every row - startup only.
+        """
+        table = f"{entity}_search"
+        try:
+            # rank 1: also compare the index against the external content, not just itself
+            await db.execute(f"INSERT INTO \"{table}\"(\"{table}\", rank) VALUES ('integrity-check', 1)")
+        except (aiosqlite.DatabaseError, sqlite3.DatabaseError) as e:
+            await db.rollback()
+            logging.warning(f"SQLite: search table for {entity} is out of step with its rows ({str(e)}) - rebuilding")
+            await db.execute(f"INSERT INTO \"{table}\"(\"{table}\") VALUES ('rebuild')")
+        await db.commit()
+
+    async def load_search(self) -> None:
+        """Register the search tables already in the database (for startups that skip initialize),
+        rebuilding any that no longer match their rows"""
+        async with self.database.core.writer() as db:
+            for entity in MetadataService.list_entities():
+                fields = MetadataService.searchable_fields(entity)
+                if fields and await self._search_table_current(db, entity, fields):
+                    await self._verify_search(db, entity)
+                    self._search_fields[entity] = fields
+
+    async def create_search(self, entity: str, fields: List[str]) -> None:
+        """
+        Trigram FTS5 table over the entity's searchable fields, reading its text from the entity
+        table (external content) and kept in sync by insert/update/delete triggers. LIKE '%value%'
+        against it is answered from the trigram index instead of scanning every row.
+
+        Rebuilt when the searchable fields change, or when it no longer matches the entity's rows
+        (see _verify_search).
+        """
+        table = f"{entity}_search"
+        async with self.database.core.writer() as db:
+            try:
+                if await self._search_table_current(db, entity, fields):
+                    await self._verify_search(db, entity)
+                    self._search_fields[entity] = fields
+                    return
+
+                await self._drop_search(db, entity)
+                await db.execute(self._search_table_sql(entity, fields))
+
+                columns = ', '.join(f'"{field}"' for field in fields)
+                new_values = ', '.join(f'new."{field}"' for field in fields)
+                old_values = ', '.join(f'old."{field}"' for field in fields)
+                remove = f"INSERT INTO \"{table}\"(\"{table}\", rowid, {columns}) VALUES ('delete', old.rowid, {old_values});"
+                add = f'INSERT INTO "{table}"(rowid, {columns}) VALUES (new.rowid, {new_values});'
+                await db.execute(f'CREATE TRIGGER "{table}_ai" AFTER INSERT ON "{entity}" BEGIN {add} END')
+                await db.execute(f'CREATE TRIGGER "{table}_ad" AFTER DELETE ON "{entity}" BEGIN {remove} END')
+                await db.execute(f'CREATE TRIGGER "{table}_au" AFTER UPDATE OF {columns} ON "{entity}" BEGIN {remove} {add} END')
+
+                # index the rows already there
+                await db.execute(f"INSERT INTO \"{table}\"(\"{table}\") VALUES ('rebuild')")
+                await db.commit()
+                self._search_fields[entity] = fields
+                self.logger.info(f"Created search table for {entity}: {fields}")
+
+            except sqlite3.OperationalError as e:
+                # e.g. built without FTS5 or older than 3.34 (no trigram tokenizer) - LIKE scans still work
+                await db.rollback()
+                self._search_fields.pop(entity, None)
+                logging.warning(f"SQLite: no search table for {entity}: {str(e)}")
+            except Exception as e:
+                raise DatabaseError(f"SQLite create search table error: {str(e)}")
+
+    async def _drop_search(self, db: aiosqlite.Connection, entity: str) -> None:
+        table = f"{entity}_search"
+        for suffix in ('ai', 'ad', 'au'):
+            await db.execute(f'DROP TRIGGER IF EXISTS "{table}_{suffix}"')
+        await db.execute(f'DROP TABLE IF EXISTS "{table}"')
+        self._search_fields.pop(entity, None)
 
     async def create(self, entity: str, fields: List[str], unique: bool = True, name: Optional[str] = None) -> None:
         """Create index on entity with proper columns"""
-        db = self.database.core.get_connection()
-
-        try:
-            # Check if table exists first
-            cursor = await db.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-                (entity,)
-            )
-            table_exists = await cursor.fetchone()
-
-            if not table_exists:
-                # Table should exist from initialize_schema, but create it if not
-                create_sql = self.database.documents._build_create_table_sql(entity)
-                await db.execute(create_sql)
+        # DDL and commit under the writer lock, so they never commit half of a concurrent write
+        async with self.database.core.writer() as db:
+            try:
+                # Check if table exists first
+                cursor = await db.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
+                    (entity,)
+                )
+                table_exists = await cursor.fetchone()
+
+                if not table_exists:
+                    # Table should exist from initialize_schema, but create it if not
+                    create_sql = self.database.documents._build_create_table_sql(entity)
+                    await db.execute(create_sql)
+                    await db.commit()
+
+                # Unique indexes are on the plain columns; secondary ones (index advisor) on the
+                # expressions queries filter and sort by (COLLATE NOCASE on case-insensitive Strings)
+                if unique:
+                    columns = [f'"{field}"' for field in fields]
+                else:
+                    columns = [self.database.documents._sort_expression(entity, field) for field in fields]
+
+                # Generate index name if not provided
+                if not name:
+                    field_str = '_'.join(fields)
+                    if unique:
+                        suffix = '_unique'
+                    else:
+                        suffix = '_ci' if any(column.endswith('COLLATE NOCASE') for column in columns) else ''
+                    name = f"idx_{entity}_{field_str}{suffix}"
+
+                # Build field list for proper columns
+                fields_str = ', '.join(columns)
+
+                # Create index
+                unique_clause = 'UNIQUE' if unique else ''
+                await db.execute(f'''
+                    CREATE {unique_clause} INDEX IF NOT EXISTS {name}
+                    ON "{entity}"({fields_str})
+                ''')
                 await db.commit()
 
-            # Generate index name if not provided
-            if not name:
-                field_str = '_'.join(fields)
-                suffix = '_unique' if unique else ''
-                name = f"idx_{entity}_{field_str}{suffix}"
-
-            # Build field list for proper columns
-            fields_str = ', '.join(f'"{field}"' for field in fields)
-
-            # Create index
-            unique_clause = 'UNIQUE' if unique else ''
-            await db.execute(f'''
-                CREATE {unique_clause} INDEX IF NOT EXISTS {name}
-                ON "{entity}"({fields_str})
-            ''')
-            await db.commit()
-
-        except Exception as e:
-            raise DatabaseError(f"SQLite create index error: {str(e)}")
+            except Exception as e:
+                raise DatabaseError(f"SQLite create index error: {str(e)}")
 
     async def get_all(self, entity: str) -> List[List[str]]:
         """Get all unique indexes for entity as field lists"""
@@ -144,12 +249,14 @@ class SqliteIndexes(IndexManager):
                     (index_name,)
                 )
                 sql_row = await cursor.fetchone()
-                fields = []
+                fields, keys = [], []
                 if sql_row and sql_row[0]:
                     fields = self._parse_fields_from_sql(sql_row[0])
+                    keys = self._parse_keys_from_sql(sql_row[0])
 
                 indexes[index_name] = {
                     "fields": fields,
+                    "keys": keys or fields,
                     "unique": is_unique,
                     "type": "native"
                 }
@@ -161,32 +268,54 @@ class SqliteIndexes(IndexManager):
 
     async def delete(self, entity: str, fields: List[str]) -> None:
         """Delete index by field names"""
-        db = self.database.core.get_connection()
-
-        try:
-            # Find the index name for these fields
-            cursor = await db.execute(f"PRAGMA index_list('{entity}')")
-            indexes = await cursor.fetchall()
-
-            for index_row in indexes:
-                index_name = index_row[1]
-
-                # Get the SQL for this index
-                cursor = await db.execute(
-                    "SELECT sql FROM sqlite_master WHERE type='index' AND name=?",
-                    (index_name,)
-                )
-                sql_row = await cursor.fetchone()
-                if sql_row and sql_row[0]:
-                    index_fields = self._parse_fields_from_sql(sql_row[0])
-                    if index_fields == fields:
-                        # Found the matching index, drop it
-                        await db.execute(f"DROP INDEX IF EXISTS {index_name}")
-                        await db.commit()
-                        return
+        # DDL and commit under the writer lock, so they never commit half of a concurrent write
+        async with self.database.core.writer() as db:
+            try:
+                # Find the index name for these fields
+                cursor = await db.execute(f"PRAGMA index_list('{entity}')")
+                indexes = await cursor.fetchall()
+
+                for index_row in indexes:
+                    index_name = index_row[1]
+
+                    # Get the SQL for this index
+                    cursor = await db.execute(
+                        "SELECT sql FROM sqlite_master WHERE type='index' AND name=?",
+                        (index_name,)
+                    )
+                    sql_row = await cursor.fetchone()
+                    if sql_row and sql_row[0]:
+                        index_fields = self._parse_fields_from_sql(sql_row[0])
+                        if index_fields == fields:
+                            # Found the matching index, drop it
+                            await db.execute(f"DROP INDEX IF EXISTS {index_name}")
+                            await db.commit()
+                            return
+
+            except Exception as e:
+                raise DatabaseError(f"SQLite delete index error: {str(e)}")
+
+    def index_keys(self, entity: str, fields: List[str]) -> List[str]:
+        """Keys of the index create(unique=False) builds, normalized like _parse_keys_from_sql"""
+        return [self._sort_expression_key(self.database.documents._sort_expression(entity, field)) for field in fields]
+
+    def _parse_keys_from_sql(self, sql: str) -> List[str]:
+        """Parse the key columns from CREATE INDEX SQL, keeping their collation"""
+        # Example: CREATE INDEX idx_Event_title_ci ON "Event"("title" COLLATE NOCASE, "dateTime")
+        import re
+        on_match = re.search(r'ON\s+"\w+"\s*\((.*)\)', sql, re.IGNORECASE | re.DOTALL)
+        if not on_match or 'json_extract' in sql:
+            return []
+        return [key for key in (self._sort_expression_key(part) for part in on_match.group(1).split(',')) if key]
 
-        except Exception as e:
-            raise DatabaseError(f"SQLite delete index error: {str(e)}")
+    def _sort_expression_key(self, expr: str) -> str:
+        """'<column> COLLATE NOCASE' for a NOCASE column, else the bare column name"""
+        import re
+        name = re.search(r'"(\w+)"|\b(\w+)\b', expr)
+        if not name:
+            return ''
+        column = name.group(1) or name.group(2)
+        return f"{column} COLLATE NOCASE" if re.search(r'COLLATE\s+NOCASE', expr, re.IGNORECASE) else column
 
     def _parse_fields_from_sql(self, sql: str) -> List[str]:
         """Parse field names from CREATE INDEX SQL statement"""
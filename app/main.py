@@ -4,6 +4,7 @@ import argparse
 from pathlib import Path
 from app.core.config import Config
 from app.db import DatabaseFactory
+from app.db.entity_cache import EntityCache
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
@@ -11,6 +12,8 @@ from app.core.metadata import MetadataService
 from app.core.model import ModelService
 from app.services import ServiceManager
 from app.core.exceptions import StopWorkError
+from app.core.log_queue import start_queue_logging
+from app.core.notify import Notification
 from app.routers.router import get_all_dynamic_routers
 from app.routers.admin import router as admin_router
 from app.routers.endpoint_handlers import update_response
@@ -127,14 +130,16 @@ project = config.get('project_name', 'Project Name Here')
 my_log_level = (args.log_level or 
                config.get('log_level', 'info' if is_dev else 'warning')).upper()
 
-logging.basicConfig(
+# Handlers run on a listener thread - request code only enqueues records
+start_queue_logging(
     level=my_log_level,
-    format="%(asctime)s [%(levelname)s] %(message)s",
+    fmt="%(asctime)s [%(levelname)s] %(message)s",
     handlers=[
         logging.StreamHandler(sys.stdout),  # Output to console
         logging.FileHandler(LOG_FILE, mode="a"),  # Write to a log file
     ],
 )
+Notification.configure_logging(config.get('notification_logging'))
 logger = logging.getLogger(__name__)
 
 # Add the project root to PYTHONPATH
@@ -186,6 +191,7 @@ async def lifespan(app: FastAPI):
         case_sensitive = Config.get('case_sensitive', False)
         db_instance = await DatabaseFactory.initialize(db_type, db_uri, db_name, case_sensitive)
         logger.info(f"Connected to {db_type} successfully")
+        EntityCache.initialize(Config.get('entity_cache', {}))
                 
         # Auto-run database initialization unless --noinitdb flag is set
         if not args.noinitdb:
@@ -45,7 +45,7 @@ class Crawl(BaseModel):
 
     model_config = ConfigDict()
 
-    _metadata: ClassVar[Dict[str, Any]] = {   'fields': {   'lastParsedDate': {'type': 'Date', 'required': False},
+    _metadata: ClassVar[Dict[str, Any]] = {   'fields': {   'lastParsedDate': {'type': 'Date', 'required': False, 'sortable': True},
                   'parseStatus': {'type': 'JSON', 'required': False},
                   'errorsEncountered': {   'type': 'Array[String]',
                                            'required': False},
@@ -69,11 +69,14 @@ class Event(BaseModel):
                                             'message': 'Bad URL format'}},
                   'title': {   'type': 'String',
                                'required': True,
-                               'max_length': 200},
-                  'dateTime': {'type': 'Date', 'required': True},
+                               'max_length': 200,
+                               'searchable': True,
+                               'sortable': True},
+                  'dateTime': {'type': 'Date', 'required': True, 'sortable': True},
                   'location': {   'type': 'String',
                                   'required': False,
-                                  'max_length': 200},
+                                  'max_length': 200,
+                                  'searchable': True},
                   'cost': {   'type': 'Number',
                               'required': False,
                               'ge': 0,
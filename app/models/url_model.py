@@ -42,7 +42,8 @@ class Url(BaseModel):
     _metadata: ClassVar[Dict[str, Any]] = {   'fields': {   'url': {   'type': 'String',
                              'required': True,
                              'pattern': {   'regex': 'main.url',
-                                            'message': 'Bad URL format'}},
+                                            'message': 'Bad URL format'},
+                             'searchable': True},
                   'params': {'type': 'JSON', 'required': False},
                   'createdAt': {   'type': 'Date',
                                    'ui': {   'displayAfterField': '-1',
@@ -86,7 +86,9 @@ class User(BaseModel):
     _metadata: ClassVar[Dict[str, Any]] = {   'fields': {   'username': {   'type': 'String',
                                   'required': True,
                                   'min_length': 3,
-                                  'max_length': 50},
+                                  'max_length': 50,
+                                  'searchable': True,
+                                  'sortable': True},
                   'email': {   'type': 'String',
                                'required': True,
                                'min_length': 8,
@@ -108,6 +110,7 @@ class User(BaseModel):
                                   'required': True,
                                   'min_length': 3,
                                   'max_length': 100,
+                                  'sortable': True,
                                   'ui': {'displayName': 'Last Name'}},
                   'gender': {   'type': 'String',
                                 'required': False,
@@ -3,6 +3,7 @@ Admin endpoints for database management and system health.
 """
 
 import logging
+from typing import Optional
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse, JSONResponse
 from app.db import DatabaseFactory
@@ -130,6 +131,9 @@ async def db_init(request: Request):
             if authz_service:
                 authz_service.clear_cache()
 
+            from app.db.entity_cache import EntityCache
+            EntityCache.clear()
+
             return {
                 "status": "success",
                 "message": "Database wiped and reinitialized successfully"
@@ -179,4 +183,87 @@ async def db_report():
                 "status": "error",
                 "message": f"Database report failed: {str(e)}"
             }
-        )
\ No newline at end of file
+        )
+
+
+@router.get('/cache')
+async def cache_report():
+    """Get read cache statistics (identity map hits/misses per endpoint, entity cache hit ratios)"""
+    from app.core.request_context import RequestContext
+    from app.db.entity_cache import EntityCache
+
+    return {
+        "identity_map": RequestContext.get_identity_stats(),
+        "entity_cache": EntityCache.stats()
+    }
+
+
+@router.get('/authn')
+async def authn_report():
+    """Get authn session store metrics (connection pool usage, command latency, session cache)"""
+    from app.services.services import ServiceManager
+
+    authn_service = ServiceManager.get_service_instance("authn")
+    if authn_service is None or not hasattr(authn_service, "stats"):
+        return {"authn": None}
+    return {"authn": authn_service.stats()}
+
+
+@router.get('/indexes/advice')
+async def index_advice(min_requests: Optional[int] = None):
+    """Recommend secondary indexes from the recorded list query shapes (filters and sorts)"""
+    from app.core.request_context import RequestContext
+    from app.db.index_advisor import IndexAdvisor, MIN_REQUESTS
+
+    db_instance = DatabaseFactory.get_instance()
+    return {
+        "recommendations": await IndexAdvisor.recommend(db_instance, min_requests or MIN_REQUESTS),
+        "shapes": RequestContext.get_query_shapes()
+    }
+
+
+@router.post('/indexes/advice')
+async def apply_index_advice(request: Request):
+    """Create the recommended secondary indexes. Requires create: true in the request body"""
+    from app.db.index_advisor import IndexAdvisor, MIN_REQUESTS
+
+    try:
+        try:
+            body = await request.json()
+            if not isinstance(body, dict):
+                raise ValueError("request body must be a JSON object")
+            min_requests = int(body.get("min_requests") or MIN_REQUESTS)
+        except (ValueError, TypeError) as e:
+            return JSONResponse(
+                status_code=400,
+                content={
+                    "status": "error",
+                    "message": f"Invalid index advice request: {str(e)}"
+                }
+            )
+
+        if not body.get("create"):
+            return JSONResponse(
+                status_code=400,
+                content={
+                    "status": "error",
+                    "message": "Creating indexes requires create: true in request body"
+                }
+            )
+
+        db_instance = DatabaseFactory.get_instance()
+        recommendations = await IndexAdvisor.recommend(db_instance, min_requests)
+        return {
+            "status": "success",
+            "indexes": await IndexAdvisor.apply(db_instance, recommendations)
+        }
+
+    except Exception as e:
+        logger.error(f"Index advice failed: {str(e)}")
+        return JSONResponse(
+            status_code=500,
+            content={
+                "status": "error",
+                "message": f"Index advice failed: {str(e)}"
+            }
+        )
@@ -6,20 +6,35 @@ across different entity routers, including FK data processing and
 notification handling.
 """
 
+import csv
 import json
+import tempfile
+import time
 import logging
 import inspect
-from typing import Dict, Any, Type, Optional, Union, Protocol, Callable
+from contextlib import aclosing
+from typing import AsyncIterator, Dict, Any, List, Type, Optional, Union, Protocol, Callable
 from urllib.parse import unquote
 from functools import wraps
+from datetime import date
+from decimal import Decimal
 from fastapi import Request, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from app.core.notify import Notification
+from app.core.model import ModelService
+from app.core.notify import Notification, HTTP
 from app.core.request_context import RequestContext
 
 logger = logging.getLogger(__name__)
 
+# failed rows returned by a JSON POST _import - the summary still counts them all (NDJSON returns every one)
+IMPORT_MAX_ERRORS = 1000
+# failed rows an NDJSON _import holds in memory before spooling them to a temporary file, and the
+# size of the chunks they are sent back in
+IMPORT_SPOOL_BYTES = 8 * 1024 * 1024
+IMPORT_CHUNK_BYTES = 64 * 1024
+
 class EntityModelProtocol(Protocol):
     """Protocol for entity model classes with required methods and attributes."""
     _metadata: Dict[str, Any]
@@ -74,7 +89,12 @@ def parse_request_context(handler: Callable) -> Callable:
                 if authn_svc:
                     await authn_svc.authorized()  # Fetches from Redis, caches in RC
 
-        return await handler(*args, **kwargs)
+        try:
+            return await handler(*args, **kwargs)
+        finally:
+            if request:
+                route = request.scope.get('route')
+                RequestContext.record_identity_stats(f"{request.method} {getattr(route, 'path', request.url.path)}")
     return wrapper
 
 
@@ -93,7 +113,7 @@ async def get_all_handler(entity_cls: Type[EntityModelProtocol], request: Reques
         RequestContext.get_substring_match()
     )
 
-    return await update_response(data, count)
+    return await update_response(data, count, paginated=True)
 
 
 @parse_request_context
@@ -132,18 +152,255 @@ async def delete_entity_handler(entity_cls: Type[EntityModelProtocol], entity_id
     return await update_response(response)
 
 
-async def update_response(data: Any, records: Optional[int] = None) -> Dict[str, Any]:
+@parse_request_context
+async def bulk_handler(entity_cls: Type[EntityModelProtocol], request: Request) -> Dict[str, Any]:
+    """Reusable handler for POST _bulk endpoint - a JSON array or NDJSON (one item per line)."""
+    items = parse_bulk_body(await request.body(), request.headers.get('content-type', ''))
+
+    # Model handles notifications internally, per-item status comes back as the data
+    results = await ModelService.bulk_save(entity_cls.__name__, items)
+    response = await update_response(results)
+    response['summary'] = {
+        'total': len(results),
+        'succeeded': sum(1 for result in results if result['status'] < 300),
+        'failed': sum(1 for result in results if result['status'] >= 300)
+    }
+    return response
+
+
+def parse_bulk_body(body: bytes, content_type: str) -> List[Any]:
+    """Parse a bulk request body: a JSON array, or NDJSON when the content type says so or the
+    body is not an array. Blank NDJSON lines are skipped."""
+    try:
+        text = body.decode('utf-8').strip()
+        if not text:
+            return []
+        if 'ndjson' not in content_type.lower() and text.startswith('['):
+            items = json.loads(text)
+            if not isinstance(items, list):
+                raise ValueError("expected a JSON array")
+            return items
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+    except ValueError as e:
+        Notification.error(HTTP.BAD_REQUEST, f"Invalid bulk request body: {str(e)}")
+        raise  # Unreachable
+
+
+@parse_request_context
+async def import_handler(entity_cls: Type[EntityModelProtocol], request: Request) -> Union[Dict[str, Any], StreamingResponse]:
+    """
+    Reusable handler for POST _import endpoint - NDJSON, or CSV with a header row, created as it is read.
+
+    With Accept: application/x-ndjson the response is a {"summary": ...} line followed by every failed
+    row, one per line, however many there are. Otherwise it is JSON carrying the first IMPORT_MAX_ERRORS.
+    """
+    rows = parse_import_stream(request.stream(), request.headers.get('content-type', ''))
+    if 'ndjson' in request.headers.get('accept', '').lower():
+        return await _import_ndjson_response(entity_cls.__name__, rows)
+
+    total = failed = 0
+    errors: List[Dict[str, Any]] = []
+    started = time.perf_counter()
+    # aclosing: the import's end-of-load work runs even if this loop is cut short
+    async with aclosing(ModelService.import_rows(entity_cls.__name__, rows)) as batches:
+        async for batch, results in batches:
+            failures = import_failures(batch, results)
+            total += len(results)
+            failed += len(failures)
+            errors.extend(failures[:IMPORT_MAX_ERRORS - len(errors)])
+
+    response = await update_response(errors)
+    response['summary'] = import_summary(total, failed, started)
+    response['summary']['errorsTruncated'] = failed > len(errors)
+    return response
+
+
+async def _import_ndjson_response(entity: str, rows: AsyncIterator[Any]) -> StreamingResponse:
+    # The failures are spooled (to disk past IMPORT_SPOOL_BYTES) and sent once the body has been read:
+    # most clients only read the response after sending the whole body, so failures streamed back
+    # mid-upload could fill both socket buffers and stall. An import that fails still gets a normal
+    # error response.
+    total = failed = 0
+    started = time.perf_counter()
+    spool = tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_BYTES)
+    try:
+        async with aclosing(ModelService.import_rows(entity, rows)) as batches:
+            async for batch, results in batches:
+                failures = import_failures(batch, results)
+                total += len(results)
+                failed += len(failures)
+                if failures:
+                    spool.write(_ndjson_lines(failures).encode('utf-8'))
+        summary = _ndjson_lines([{'summary': import_summary(total, failed, started)}]).encode('utf-8')
+        spool.seek(0)
+    except BaseException:
+        spool.close()
+        raise
+
+    def ndjson():
+        with spool:
+            yield summary
+            while chunk := spool.read(IMPORT_CHUNK_BYTES):
+                yield chunk
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+def import_summary(total: int, failed: int, started: float) -> Dict[str, Any]:
+    """Counts and throughput of an import so far"""
+    elapsed = time.perf_counter() - started
+    return {
+        'total': total,
+        'succeeded': total - failed,
+        'failed': failed,
+        'seconds': round(elapsed, 3),
+        'rowsPerSecond': round(total / elapsed) if elapsed > 0 else total
+    }
+
+
+async def parse_import_stream(chunks: AsyncIterator[bytes], content_type: str) -> AsyncIterator[Any]:
+    """
+    Rows of an import body as the chunks arrive: NDJSON (one document per line), or CSV with a
+    header row when the content type says csv. Empty CSV cells are left out, and cells that look
+    like JSON arrays or objects are decoded. A line that can't be parsed comes through as a
+    ValueError naming the line, so the import reports it and carries on.
+    """
+    is_csv = 'csv' in content_type.lower()
+    header: Optional[List[str]] = None
+    record = ''     # CSV record whose quoted field runs over several lines
+    line_number = 0
+    async for raw in _split_lines(chunks):
+        line_number += 1
+        try:
+            line = raw.decode('utf-8').rstrip('\r')
+        except UnicodeDecodeError as e:
+            yield ValueError(f"Line {line_number}: {str(e)}")
+            continue
+        if line_number == 1:
+            line = line.lstrip('\ufeff')
+
+        if not is_csv:
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except ValueError as e:
+                    yield ValueError(f"Line {line_number}: invalid JSON - {str(e)}")
+            continue
+
+        record = f"{record}\n{line}" if record else line
+        if record.count('"') % 2:
+            continue    # inside a quoted field
+        values = next(csv.reader([record]), [])
+        record = ''
+        if not any(value.strip() for value in values):
+            continue
+        if header is None:
+            header = [value.strip() for value in values]
+        elif len(values) != len(header):
+            yield ValueError(f"Line {line_number}: {len(values)} columns, expected {len(header)}")
+        else:
+            yield {name: _csv_value(value) for name, value in zip(header, values) if value != ''}
+    if record:
+        yield ValueError(f"Line {line_number}: unterminated quoted field")
+
+
+async def _split_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    pending = b''
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b'\n')
+        for line in lines:
+            yield line
+    if pending:
+        yield pending
+
+
+def _csv_value(value: str) -> Any:
+    if value[:1] in ('[', '{'):
+        try:
+            return json.loads(value)
+        except ValueError:
+            pass
+    return value
+
+
+def import_failures(rows: List[Any], results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """The failed rows of an import batch: row number (1-based, data rows only), status, error
+    and the document as it was read (None when the line itself could not be parsed)"""
+    failures = []
+    for row, result in zip(rows, results):
+        if result['status'] >= 300:
+            failure = {'row': result['index'] + 1, 'id': result['id'], 'status': result['status'], 'error': result.get('error')}
+            if result.get('field'):
+                failure['field'] = result['field']
+            failure['document'] = row if isinstance(row, dict) else None
+            failures.append(failure)
+    return failures
+
+
+@parse_request_context
+async def export_handler(entity_cls: Type[EntityModelProtocol], request: Request) -> StreamingResponse:
+    """Reusable handler for GET _export endpoint - every matching document streamed as NDJSON."""
+    batches = ModelService.export(
+        entity_cls.__name__,
+        RequestContext.get_sort_fields(),
+        RequestContext.get_filters(),
+        RequestContext.get_substring_match()
+    )
+
+    # Pull the first batch before the response starts, so permission, filter and connection
+    # errors still come back as a normal error response instead of a truncated stream
+    try:
+        first = await anext(batches, [])
+    except BaseException:
+        await batches.aclose()
+        raise
+
+    async def ndjson():
+        try:
+            if first:
+                yield _ndjson_lines(first)
+            async for batch in batches:
+                yield _ndjson_lines(batch)
+        finally:
+            await batches.aclose()  # releases the driver cursor if the client goes away
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+def _ndjson_lines(docs: List[Dict[str, Any]]) -> str:
+    return ''.join(json.dumps(doc, default=_json_default) + '\n' for doc in docs)
+
+
+def _json_default(value: Any) -> Any:
+    """JSON for the values drivers hand back that json can't encode (as FastAPI would encode them)"""
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+async def update_response(data: Any, records: Optional[int] = None, paginated: bool = False) -> Dict[str, Any]:
     result: Dict[str, Any] = {}
 
     result['data'] = data
 
-    if records is not None:
-        totalPages = (records + RequestContext.get_pageSize() - 1) // RequestContext.get_pageSize() if records > 0 else 0
+    if records is not None or paginated:
+        # records is None for ?count=none - hasMore still says whether to ask for another page
+        page_info = RequestContext.get_page_info()
+        if records is None:
+            totalPages = None
+        else:
+            totalPages = (records + RequestContext.get_pageSize() - 1) // RequestContext.get_pageSize() if records > 0 else 0
         result['pagination'] = {
             "page": RequestContext.get_page(),
             "pageSize": RequestContext.get_pageSize(),
             "total": records,
-            "totalPages": totalPages
+            "totalPages": totalPages,
+            "count": page_info.get('count', 'exact'),
+            "hasMore": page_info.get('hasMore', False),
+            "nextCursor": page_info.get('nextCursor')
         }
 
     notification_response = Notification.get()
@@ -7,21 +7,23 @@ eliminating the need for metadata services, reflection, or async complexity.
 
 from pathlib import Path
 from fastapi import APIRouter, Request
-from typing import Dict, Any, List, Optional, Type, Protocol
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, List, Optional, Type, Protocol, Union
 from pydantic import BaseModel, Field
 import logging
 
 from app.core.model import ModelService
 from app.routers.endpoint_handlers import (
     get_all_handler, get_entity_handler, create_entity_handler,
-    update_entity_handler, delete_entity_handler, EntityModelProtocol
+    update_entity_handler, delete_entity_handler, bulk_handler, export_handler,
+    import_handler, EntityModelProtocol
 )
 
 logger = logging.getLogger(__name__)
 
 
 # Generic response models for OpenAPI
-def create_response_models(entity_cls: Type[EntityModelProtocol]) -> tuple[Type[BaseModel], Type[BaseModel]]:
+def create_response_models(entity_cls: Type[EntityModelProtocol]) -> tuple[Type[BaseModel], Type[BaseModel], Type[BaseModel]]:
     """Create response models dynamically for any entity"""
     entity = entity_cls.__name__
     
@@ -39,12 +41,19 @@ def create_response_models(entity_cls: Type[EntityModelProtocol]) -> tuple[Type[
         status: Optional[str] = None
         summary: Optional[Dict[str, Any]] = None
         pagination: Optional[Dict[str, Any]]
+
+    class EntityBulkResponse(BaseModel):
+        data: Optional[List[Dict[str, Any]]] = Field(default_factory=list)   # per-item status
+        notifications: Optional[Dict[str, Any]] = None
+        status: Optional[str] = None
+        summary: Optional[Dict[str, Any]] = None
     
     # Dynamically set the class names for better OpenAPI docs
     EntityResponse.__name__ = f"{entity}Response"
     EntityAllResponse.__name__ = f"{entity}AllResponse"
+    EntityBulkResponse.__name__ = f"{entity}BulkResponse"
     
-    return EntityResponse, EntityAllResponse
+    return EntityResponse, EntityAllResponse, EntityBulkResponse
 
 
 class SimpleDynamicRouterFactory:
@@ -80,7 +89,7 @@ class SimpleDynamicRouterFactory:
         entity_lower = entity
         
         # Create response models for OpenAPI documentation
-        EntityResponse, EntityAllResponse = create_response_models(entity_cls) # type: ignore
+        EntityResponse, EntityAllResponse, EntityBulkResponse = create_response_models(entity_cls) # type: ignore
         
         # Use proper FastAPI decorators for better OpenAPI schema generation
         
@@ -98,6 +107,20 @@ class SimpleDynamicRouterFactory:
         async def get_all(request: Request) -> Dict[str, Any]:  # noqa: F811
             return await get_all_handler(entity_cls, request)
         
+        @router.get(
+            "/_export",
+            summary=f"Export all {entity_lower}s as NDJSON",
+            response_description=f"One {entity_lower} per line, in sort order",
+            response_class=StreamingResponse,
+            responses={
+                200: {"description": f"Stream of matching {entity_lower}s", "content": {"application/x-ndjson": {}}},
+                400: {"description": "Invalid query parameters"},
+                500: {"description": "Server error"}
+            }
+        )
+        async def export_entities(request: Request) -> StreamingResponse:  # noqa: F811
+            return await export_handler(entity_cls, request)
+
         @router.get(
             "/{entity_id}",
             summary=f"Get a specific {entity_lower} by ID",
@@ -129,6 +152,36 @@ class SimpleDynamicRouterFactory:
         )
         async def create_entity(entity_data: create_cls, request: Request) -> Dict[str, Any]:  # type: ignore # noqa: F811
             return await create_entity_handler(entity_cls, entity_data, request)
+
+        @router.post(
+            "/_bulk",
+            summary=f"Create, update and delete {entity_lower}s in one batch",
+            response_description="Per-item status in request order",
+            response_model=EntityBulkResponse,
+            responses={
+                200: {"description": "Batch processed - check each item's status"},
+                400: {"description": "Malformed body or batch too large"},
+                500: {"description": "Server error"}
+            }
+        )
+        async def bulk_entities(request: Request) -> Dict[str, Any]:  # noqa: F811
+            return await bulk_handler(entity_cls, request)
+
+        @router.post(
+            "/_import",
+            summary=f"Import {entity_lower}s from NDJSON or CSV",
+            response_description="Import summary with throughput and the failed rows",
+            response_model=EntityBulkResponse,
+            responses={
+                200: {"description": "Import finished - failed rows are listed in data, or with Accept: "
+                                     "application/x-ndjson sent as a summary line followed by every failed row",
+                      "content": {"application/x-ndjson": {}}},
+                403: {"description": "Create not permitted"},
+                500: {"description": "Server error"}
+            }
+        )
+        async def import_entities(request: Request) -> Union[Dict[str, Any], StreamingResponse]:  # noqa: F811
+            return await import_handler(entity_cls, request)
         
         @router.put(
             "/{entity_id}",
@@ -1,12 +1,20 @@
 # app/services/auth/cookies/redis.py
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+from contextlib import asynccontextmanager
+import asyncio
+import logging
 import uuid
 import json
 import time
 import redis.asyncio as redis
+from redis.asyncio.connection import UnixDomainSocketConnection
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import ConnectionError as RedisConnectionError, ResponseError, TimeoutError as RedisTimeoutError
 from fastapi import Request, Response
 from pydantic import BaseModel
 from app.services.framework import decorators
+from app.core.cache import TTLCache
 from app.core.metadata import MetadataService
 from app.core.notify import Notification, HTTP
 from app.services.services import ServiceManager
@@ -21,33 +29,194 @@ class AuthResponse(BaseModel):
 SESSION_TTL = 3600              # 1 hour sliding window
 ABSOLUTE_SESSION_MAX = 28800    # 8 hours absolute maximum (force re-login)
 NEAR_EXPIRY_THRESHOLD = 300     # 5 minutes threshold
+SESSION_CACHE_MAX_TTL = 5       # in-process session cache entries live at most this long (seconds)
+SESSION_INVALIDATE_CHANNEL = "authn:session:invalidate"   # pub/sub channel carrying changed/deleted session ids
+PUBSUB_POLL_SECONDS = 30.0      # how long one wait for an invalidation may sit idle before waiting again
+
+# Session fetch, TTL check and sliding-window renewal in one round trip.
+# KEYS[1] = session id, ARGV[1] = renewal threshold, ARGV[2] = new TTL. Returns {data, ttl} or nil.
+VALIDATE_SESSION_LUA = """
+local data = redis.call('GET', KEYS[1])
+if not data then
+    return nil
+end
+local ttl = redis.call('TTL', KEYS[1])
+if ttl > 0 and ttl < tonumber(ARGV[1]) then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+    ttl = tonumber(ARGV[2])
+end
+return {data, ttl}
+"""
+
+# Connection pool defaults, each overridable from the authn runtime config
+POOL_DEFAULTS = {
+    "max_connections": 50,          # per worker; callers wait for a free connection beyond this
+    "pool_timeout": 5.0,            # seconds to wait for a free connection before failing
+    "socket_timeout": 2.0,          # seconds per command
+    "socket_connect_timeout": 2.0,
+    "health_check_interval": 30,    # PING idle connections older than this before reuse
+    "retries": 3,                   # retries on connection errors/timeouts, with exponential backoff
+    "backoff_base": 0.01,
+    "backoff_cap": 0.5,
+    "unix_socket_path": None        # connect over a Unix socket instead of host/port
+}
+
+# Command latency histogram bucket upper bounds (ms)
+LATENCY_BUCKETS_MS = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000]
 
 # --- Concrete Cookie Store Implementation Using Async Redis ---
 class RedisCookieStore:
-    def __init__(self, host: str = "127.0.0.1", port: int = 6379, db: int = 0):
+    def __init__(self, host: str = "127.0.0.1", port: int = 6379, db: int = 0, client: Optional[redis.Redis] = None,
+                 pool_config: Optional[Dict[str, Any]] = None):
         self.host = host
         self.port = port
         self.db = db
-        self.redis_client = None
+        self.pool_config = {**POOL_DEFAULTS, **{k: v for k, v in (pool_config or {}).items() if k in POOL_DEFAULTS}}
+        self.redis_client = client      # pass a client (e.g. fakeredis) to skip connecting
+        self._validate_script = None
+        self._scripting = True          # False once the server has refused EVALSHA/EVAL
+        # op -> {calls, errors, total_ms, max_ms, buckets}; peak connections checked out
+        self._latency: Dict[str, Dict[str, Any]] = {}
+        self._peak_in_use = 0
+
+    def _build_pool(self) -> redis.BlockingConnectionPool:
+        cfg = self.pool_config
+        kwargs: Dict[str, Any] = {
+            "db": self.db,
+            "encoding": "utf-8",
+            "decode_responses": True,
+            "socket_timeout": cfg["socket_timeout"],
+            "socket_connect_timeout": cfg["socket_connect_timeout"],
+            "health_check_interval": cfg["health_check_interval"],
+            "retry": Retry(ExponentialBackoff(cap=cfg["backoff_cap"], base=cfg["backoff_base"]), int(cfg["retries"])),
+            "retry_on_error": [RedisConnectionError, RedisTimeoutError],
+        }
+        if cfg["unix_socket_path"]:
+            kwargs["connection_class"] = UnixDomainSocketConnection
+            kwargs["path"] = cfg["unix_socket_path"]
+        else:
+            kwargs["host"] = self.host
+            kwargs["port"] = self.port
+        return redis.BlockingConnectionPool(max_connections=int(cfg["max_connections"]),
+                                            timeout=cfg["pool_timeout"], **kwargs)
 
     async def connect(self):
-        self.redis_client = redis.Redis(
-            host=self.host,
-            port=self.port,
-            db=self.db,
-            encoding="utf-8",
-            decode_responses=True
-        )
+        if self.redis_client is None:
+            self.redis_client = redis.Redis(connection_pool=self._build_pool())
+        # EVALSHA, loading the script on first NOSCRIPT
+        self._validate_script = self.redis_client.register_script(VALIDATE_SESSION_LUA)
+
+    @asynccontextmanager
+    async def _timed(self, op: str):
+        """Record the latency (and failures) of one store operation"""
+        stats = self._latency.get(op)
+        if stats is None:
+            stats = self._latency[op] = {"calls": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0,
+                                         "buckets": [0] * (len(LATENCY_BUCKETS_MS) + 1)}
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            stats["errors"] += 1
+            raise
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            stats["calls"] += 1
+            stats["total_ms"] += elapsed
+            stats["max_ms"] = max(stats["max_ms"], elapsed)
+            bucket = next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if elapsed <= bound), len(LATENCY_BUCKETS_MS))
+            stats["buckets"][bucket] += 1
+            self._peak_in_use = max(self._peak_in_use, self._pool_usage().get("in_use", 0))
+
+    def _pool_usage(self) -> Dict[str, Any]:
+        pool = getattr(self.redis_client, "connection_pool", None)
+        if pool is None:
+            return {}
+        in_use = len(getattr(pool, "_in_use_connections", ()))
+        return {
+            "max_connections": pool.max_connections,
+            "in_use": in_use,
+            "idle": len(getattr(pool, "_available_connections", ())),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool usage and per-operation command latency (avg, max, approximate p50/p99)"""
+        pool = {**self._pool_usage(), "peak_in_use": self._peak_in_use}
+        if self.pool_config["unix_socket_path"]:
+            pool["unix_socket_path"] = self.pool_config["unix_socket_path"]
+        commands = {}
+        for op, stats in self._latency.items():
+            calls = stats["calls"]
+            commands[op] = {
+                "calls": calls,
+                "errors": stats["errors"],
+                "avg_ms": round(stats["total_ms"] / calls, 3) if calls else 0.0,
+                "max_ms": round(stats["max_ms"], 3),
+                "p50_ms": self._percentile(stats["buckets"], calls, 0.50),
+                "p99_ms": self._percentile(stats["buckets"], calls, 0.99),
+            }
+        return {"pool": pool, "commands": commands}
+
+    @staticmethod
+    def _percentile(buckets: List[int], calls: int, fraction: float) -> Optional[float]:
+        """Upper bound (ms) of the histogram bucket holding the given fraction of calls; None past the last bound"""
+        if not calls:
+            return None
+        seen = 0
+        for i, count in enumerate(buckets):
+            seen += count
+            if seen >= calls * fraction:
+                return LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else None
+        return None
+
+    async def validate_session(self, session_id: str, threshold: int, ttl: int) -> dict:
+        """
+        Get a session and renew its TTL if below threshold, in one round trip: the Lua script,
+        or GET+TTL pipelined where scripting isn't available (stand-ins without Lua), with the
+        renewal as a second trip only when it's due. Returns {} if there's no valid session.
+        """
+        if self.redis_client is None:
+            raise RuntimeError("Redis client not connected")
+
+        session_json = None
+        if self._scripting and self._validate_script is not None:
+            try:
+                async with self._timed("validate"):
+                    result = await self._validate_script(keys=[session_id], args=[threshold, ttl])
+                session_json = result[0] if result else None
+            except ResponseError as e:
+                if 'unknown command' not in str(e).lower():
+                    raise
+                self._scripting = False
+
+        if not self._scripting:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.get(session_id)
+            pipe.ttl(session_id)
+            async with self._timed("validate"):
+                session_json, remaining_ttl = await pipe.execute()
+            if session_json is not None and 0 < remaining_ttl < threshold:
+                async with self._timed("renew"):
+                    await self.redis_client.expire(session_id, ttl)
+
+        if session_json is None:
+            return {}
+        try:
+            return json.loads(session_json)
+        except Exception:
+            return {}
 
     async def set_session(self, session_id: str, session_data: dict, ttl: int) -> None:
         if self.redis_client is None:
             raise RuntimeError("Redis client not connected")
-        await self.redis_client.setex(session_id, ttl, json.dumps(session_data))
+        async with self._timed("set"):
+            await self.redis_client.setex(session_id, ttl, json.dumps(session_data))
 
     async def get_session(self, session_id: str) -> dict:
         if self.redis_client is None:
             raise RuntimeError("Redis client not connected")
-        session_json = await self.redis_client.get(session_id)
+        async with self._timed("get"):
+            session_json = await self.redis_client.get(session_id)
         if session_json is None:
             return {}
         try:
@@ -58,18 +227,28 @@ class RedisCookieStore:
     async def delete_session(self, session_id: str) -> None:
         if self.redis_client is None:
             raise RuntimeError("Redis client not connected")
-        await self.redis_client.delete(session_id)
+        async with self._timed("delete"):
+            await self.redis_client.delete(session_id)
+
+    async def publish_invalidation(self, session_id: str) -> None:
+        """Tell every worker's session cache to drop this session"""
+        if self.redis_client is None:
+            raise RuntimeError("Redis client not connected")
+        async with self._timed("publish"):
+            await self.redis_client.publish(SESSION_INVALIDATE_CHANNEL, session_id)
 
     async def get_session_ttl(self, session_id: str) -> int:
         """Get remaining TTL for session key in seconds. Returns -1 if key doesn't exist."""
         if self.redis_client is None:
             raise RuntimeError("Redis client not connected")
-        return await self.redis_client.ttl(session_id)
+        async with self._timed("ttl"):
+            return await self.redis_client.ttl(session_id)
 
     async def renew_session(self, session_id: str, session_data: dict, ttl: int) -> dict:
         if self.redis_client is None:
             raise RuntimeError("Redis client not connected")
-        await self.redis_client.setex(session_id, ttl, json.dumps(session_data))
+        async with self._timed("renew"):
+            await self.redis_client.setex(session_id, ttl, json.dumps(session_data))
         return session_data
 
 # --- Auth Service Implementation Using Cookies + Redis ---
@@ -90,6 +269,9 @@ class Authn:
     cookie_store: Optional[RedisCookieStore] = None
     # Entity-specific configurations: {'Auth': {route, inputs, outputs, delegates}, 'User': {...}}
     entity_configs: Dict[str, dict] = {}
+    # Optional in-process session cache in front of Redis, and its pub/sub invalidation listener
+    session_cache: Optional[TTLCache] = None
+    _invalidation_task: Optional[asyncio.Task] = None
 
     @classmethod
     async def initialize(cls, entity_configs: dict, runtime_config: dict):
@@ -100,21 +282,77 @@ class Authn:
             entity_configs: Dict of entity configs, e.g.:
                 {'Auth': {route: '/login', inputs: {...}, outputs: [...], delegates: [...]},
                  'User': {route: '/login/user', inputs: {...}, outputs: [...], delegates: [...]}}
-            runtime_config: Runtime settings (Redis host, port, db, etc.)
+            runtime_config: Runtime settings (Redis host, port, db, etc.), plus optional pool
+                settings (max_connections, pool_timeout, socket_timeout, socket_connect_timeout,
+                health_check_interval, retries, backoff_base, backoff_cap, unix_socket_path - see
+                POOL_DEFAULTS). An optional
+                "session_cache": {"ttl": 2, "max_entries": 10000} keeps validated sessions in
+                process for up to ttl seconds (capped at SESSION_CACHE_MAX_TTL), so repeat requests
+                with the same cookie skip Redis. Changes and logouts are pushed to every worker
+                over pub/sub.
         """
         # Initialize Redis store (shared across all entity configs)
         store = RedisCookieStore(
             host=runtime_config.get("host", "127.0.0.1"),
             port=runtime_config.get("port", 6379),
-            db=runtime_config.get("db", 0)
+            db=runtime_config.get("db", 0),
+            pool_config=runtime_config
         )
         await store.connect()
         cls.cookie_store = store
         cls.entity_configs = entity_configs
 
+        cache_config = runtime_config.get("session_cache")
+        if cache_config:
+            ttl = min(float(cache_config.get("ttl", 2)), SESSION_CACHE_MAX_TTL)
+            cls.session_cache = TTLCache(ttl, int(cache_config.get("max_entries", 10000)))
+            cls._invalidation_task = asyncio.create_task(cls._listen_invalidations())
+            print(f"  Authn session cache enabled: ttl={ttl}s max_entries={cls.session_cache.max_entries}")
+
         print(f"  Authn service configured for entities: {list(entity_configs.keys())}")
         return cls
 
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """Cookie store pool/latency metrics and session cache counters"""
+        return {
+            "store": cls.cookie_store.stats() if cls.cookie_store is not None else {},
+            "session_cache": cls.session_cache.stats() if cls.session_cache is not None else None
+        }
+
+    @classmethod
+    async def _listen_invalidations(cls) -> None:
+        """Drop sessions other workers (or this one) changed or deleted. Resubscribes after a
+        connection loss, clearing the cache since invalidations may have been missed meanwhile."""
+        while True:
+            pubsub = None
+            try:
+                pubsub = cls.cookie_store.redis_client.pubsub()
+                await pubsub.subscribe(SESSION_INVALIDATE_CHANNEL)
+                while True:
+                    # An explicit read timeout: listen() would fall back to the pool's socket_timeout
+                    # and treat every quiet spell as a dropped connection. This returns None instead.
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=PUBSUB_POLL_SECONDS)
+                    if message and message.get("type") == "message" and cls.session_cache is not None:
+                        cls.session_cache.pop(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.warning(f"Authn: session invalidation listener lost ({e}), resubscribing")
+                if cls.session_cache is not None:
+                    cls.session_cache.clear()
+                await asyncio.sleep(1)
+            finally:
+                if pubsub is not None:
+                    await pubsub.aclose()
+
+    @classmethod
+    async def _invalidate(cls, session_id: str) -> None:
+        """Drop a changed or deleted session from this worker's cache and, via pub/sub, the others'"""
+        if cls.session_cache is not None and cls.cookie_store is not None:
+            cls.session_cache.pop(session_id)
+            await cls.cookie_store.publish_invalidation(session_id)
+
     @classmethod
     async def authorized(cls) -> Optional[dict]:
         """
@@ -136,8 +374,19 @@ class Authn:
         if not session_id or cls.cookie_store is None:
             return None
 
-        session = await cls.cookie_store.get_session(session_id)
+        # Recently validated in this worker - skip Redis (the sliding window renews on the next miss)
+        cached = cls.session_cache.get(session_id) if cls.session_cache is not None else None
+        if cached is not None and time.time() <= cached.get('absolute_expiry', 0):
+            session = dict(cached)
+            RequestContext.set_session(session)
+            return session
+
+        # Fetch plus lazy TTL renewal (only when below threshold) in a single round trip
+        generation = cls.session_cache.generation if cls.session_cache is not None else None
+        session = await cls.cookie_store.validate_session(session_id, NEAR_EXPIRY_THRESHOLD, SESSION_TTL)
         if not session:
+            if cls.session_cache is not None:
+                cls.session_cache.pop(session_id)
             return None
 
         # Check absolute expiry (force re-login after max time regardless of activity)
@@ -145,16 +394,15 @@ class Authn:
         if time.time() > absolute_expiry:
             # Session exceeded absolute maximum - delete it
             await cls.cookie_store.delete_session(session_id)
+            await cls._invalidate(session_id)
             return None
 
-        # Lazy TTL renewal: Only renew if TTL is below threshold (avoid Redis write on every request)
-        remaining_ttl = await cls.cookie_store.get_session_ttl(session_id)
-        if remaining_ttl > 0 and remaining_ttl < NEAR_EXPIRY_THRESHOLD:
-            # TTL is getting low - renew the sliding window
-            await cls.cookie_store.renew_session(session_id, session, SESSION_TTL)
-
         # Add session_id to session dict and cache in RequestContext
         session['_session_id'] = session_id
+        if cls.session_cache is not None:
+            # skipped if an invalidation arrived during the fetch - it may be for this session,
+            # and caching the data read before it would serve the old session until the entry expires
+            cls.session_cache.put(session_id, dict(session), generation)
         RequestContext.set_session(session)
 
         return session
@@ -202,6 +450,7 @@ class Authn:
         if session:
             session[field] = value
             await cls.cookie_store.set_session(session_id, session, SESSION_TTL)
+            await cls._invalidate(session_id)
 
     async def authenticate(self, request: Request) -> bool:
         token = request.cookies.get(self.cookie_name)
@@ -357,6 +606,7 @@ class Authn:
 
         if session_id and self.cookie_store:
             await self.cookie_store.delete_session(session_id)
+            await self._invalidate(session_id)
             # Delete cookie from response
             response.delete_cookie(key=self.cookie_name)
             # Return through update_response (no session, so no permissions)
@@ -421,6 +671,7 @@ class Authn:
         absolute_expiry = session.get('absolute_expiry', 0)
         if time.time() > absolute_expiry:
             await self.cookie_store.delete_session(session_id)
+            await self._invalidate(session_id)
             Notification.error(HTTP.UNAUTHORIZED, "Session expired")
 
         # Get expanded permissions from authz service if running (same as login)
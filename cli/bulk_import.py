@@ -0,0 +1,98 @@
+import sys
+import json
+import time
+import requests
+import argparse
+from typing import Iterator
+
+# Configuration
+API_BASE_URL = "http://localhost:5500/api"
+
+# bytes read from the dump per chunk sent to the server
+CHUNK_SIZE = 1024 * 1024
+
+def read_chunks(path: str, counter: dict) -> Iterator[bytes]:
+    """Yield the dump file a chunk at a time, so it is streamed rather than loaded into memory"""
+    with open(path, 'rb') as f:
+        while chunk := f.read(CHUNK_SIZE):
+            counter['bytes'] += len(chunk)
+            yield chunk
+
+def content_type_for(path: str, fmt: str) -> str:
+    """Content type for the upload: --format if given, otherwise from the file extension"""
+    if fmt == 'auto':
+        fmt = 'csv' if path.lower().endswith('.csv') else 'ndjson'
+    return 'text/csv' if fmt == 'csv' else 'application/x-ndjson'
+
+def import_file(base_url: str, entity: str, path: str, fmt: str, errors_path: str) -> bool:
+    """Stream a dump to POST /api/{entity}/_import, report throughput and write every failed row
+    to the side file"""
+    counter = {'bytes': 0}
+    started = time.perf_counter()
+    response = requests.post(
+        f"{base_url}/{entity.lower()}/_import",
+        data=read_chunks(path, counter),
+        headers={'Content-Type': content_type_for(path, fmt), 'Accept': 'application/x-ndjson'},
+        stream=True
+    )
+    if response.status_code >= 300 or 'ndjson' not in response.headers.get('content-type', ''):
+        try:
+            result = response.json()
+            print(f"✗ Import failed ({response.status_code}): {json.dumps(result.get('notifications', result))}")
+        except ValueError:
+            print(f"✗ Import failed ({response.status_code}): {response.text}")
+        return False
+
+    # a summary line, then every failed row - copied to the side file without holding them in memory
+    summary = None
+    written = 0
+    errors = None
+    try:
+        for line in response.iter_lines():
+            if not line:
+                continue
+            if summary is None:
+                summary = json.loads(line).get('summary') or {}
+                continue
+            if errors is None:
+                errors = open(errors_path, 'wb')
+            errors.write(line + b"\n")
+            written += 1
+    finally:
+        if errors:
+            errors.close()
+    elapsed = time.perf_counter() - started
+    if not summary:
+        print("✗ Import response had no summary")
+        return False
+
+    megabytes = counter['bytes'] / (1024 * 1024)
+    print(f"Imported {summary['succeeded']}/{summary['total']} {entity} rows from {path} ({megabytes:.1f} MB)")
+    print(f"  database: {summary['seconds']}s, {summary['rowsPerSecond']} rows/s")
+    print(f"  end to end: {elapsed:.3f}s, {round(summary['total'] / elapsed) if elapsed > 0 else summary['total']} rows/s")
+
+    if summary['failed']:
+        print(f"✗ {summary['failed']} rows failed - {written} written to {errors_path}")
+    return summary['failed'] == 0
+
+def main():
+    parser = argparse.ArgumentParser(description='Stream an NDJSON or CSV dump into an entity through the _import endpoint')
+    parser.add_argument('entity', help='Entity to import into (e.g. event, url, crawl)')
+    parser.add_argument('file', help='NDJSON file (one document per line) or CSV file with a header row')
+    parser.add_argument('--format', choices=['auto', 'ndjson', 'csv'], default='auto',
+                        help='Input format (default: from the file extension)')
+    parser.add_argument('--errors', help='Side file for failed rows (default: <file>.errors.ndjson)')
+    parser.add_argument('--url', default=API_BASE_URL, help=f'API base URL (default: {API_BASE_URL})')
+    args = parser.parse_args()
+
+    errors_path = args.errors or f"{args.file}.errors.ndjson"
+
+    try:
+        ok = import_file(args.url.rstrip('/'), args.entity, args.file, args.format, errors_path)
+    except (OSError, requests.exceptions.RequestException) as e:
+        print(f"\nError during import: {str(e)}")
+        ok = False
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+RedisCookieStore.validate_session against an injected in-memory stand-in for Redis.
+Covers the Lua path and the GET+TTL pipeline fallback used when the server refuses scripting,
+each with and without a sliding-window renewal.
+"""
+import asyncio
+import json
+
+from redis.exceptions import ResponseError
+
+from app.services.authn.cookies.redis import RedisCookieStore
+
+THRESHOLD = 300
+TTL = 3600
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio.Redis for validate_session: keys with a TTL in seconds"""
+
+    def __init__(self, scripting: bool = True):
+        self.scripting = scripting
+        self.values = {}
+        self.ttls = {}
+        self.calls = []     # commands/round trips seen, in order
+
+    def set(self, key, value, ttl):
+        self.values[key] = value
+        self.ttls[key] = ttl
+
+    def register_script(self, _source):
+        async def script(keys, args):
+            # what VALIDATE_SESSION_LUA does, one round trip
+            self.calls.append('evalsha')
+            if not self.scripting:
+                raise ResponseError("unknown command 'evalsha'")
+            key, (threshold, ttl) = keys[0], args
+            if key not in self.values:
+                return None
+            if 0 < self.ttls[key] < threshold:
+                self.ttls[key] = ttl
+            return [self.values[key], self.ttls[key]]
+        return script
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def expire(self, key, ttl):
+        self.calls.append('expire')
+        if key in self.values:
+            self.ttls[key] = ttl
+
+    def _ttl(self, key):
+        return self.ttls.get(key, -2)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def get(self, key):
+        self.commands.append(lambda: self.client.values.get(key))
+
+    def ttl(self, key):
+        self.commands.append(lambda: self.client._ttl(key))
+
+    async def execute(self):
+        self.client.calls.append('pipeline')
+        return [command() for command in self.commands]
+
+
+async def make_store(scripting: bool) -> RedisCookieStore:
+    client = FakeRedis(scripting)
+    client.set('fresh', json.dumps({'user': 'a'}), TTL - 10)
+    client.set('stale', json.dumps({'user': 'b'}), THRESHOLD - 10)
+    store = RedisCookieStore(client=client)
+    await store.connect()
+    return store
+
+
+async def run_lua_path() -> None:
+    store = await make_store(scripting=True)
+    client = store.redis_client
+
+    assert await store.validate_session('fresh', THRESHOLD, TTL) == {'user': 'a'}
+    assert client.ttls['fresh'] == TTL - 10, "renewed above the threshold"
+
+    assert await store.validate_session('stale', THRESHOLD, TTL) == {'user': 'b'}
+    assert client.ttls['stale'] == TTL, "not renewed below the threshold"
+
+    assert await store.validate_session('missing', THRESHOLD, TTL) == {}
+    assert client.calls == ['evalsha'] * 3, client.calls
+
+
+async def run_pipeline_fallback() -> None:
+    store = await make_store(scripting=False)
+    client = store.redis_client
+
+    # the refused script is tried once, then the pipeline serves this and every later call
+    assert await store.validate_session('fresh', THRESHOLD, TTL) == {'user': 'a'}
+    assert client.calls == ['evalsha', 'pipeline'], client.calls
+    assert client.ttls['fresh'] == TTL - 10, "renewed above the threshold"
+
+    client.calls.clear()
+    assert await store.validate_session('stale', THRESHOLD, TTL) == {'user': 'b'}
+    assert client.calls == ['pipeline', 'expire'], client.calls
+    assert client.ttls['stale'] == TTL, "not renewed below the threshold"
+
+    client.calls.clear()
+    assert await store.validate_session('missing', THRESHOLD, TTL) == {}
+    assert client.calls == ['pipeline'], client.calls
+
+
+def test_validate_session_lua():
+    asyncio.run(run_lua_path())
+
+
+def test_validate_session_pipeline_fallback():
+    asyncio.run(run_pipeline_fallback())
+
+
+if __name__ == "__main__":
+    test_validate_session_lua()
+    print("✓ validate_session via the Lua script renews only below the threshold")
+    test_validate_session_pipeline_fallback()
+    print("✓ validate_session falls back to GET+TTL pipelining when scripting is refused")
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Keyset pagination cursors.
+Checks tokens survive the lowercasing query params go through, that a cursor is refused for any
+other sort, and that paging SQLite by _build_seek_clause visits every row once, in ORDER BY
+order, when the sort field holds NULLs.
+"""
+import sqlite3
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from itertools import product
+
+from app.core.cursor import decode_cursor, encode_cursor, matches_sort, sort_fingerprint
+from app.db.sqlite.documents import SqliteDocuments
+
+PAGE_SIZE = 2
+
+
+class PlainCodec:
+    """Values are stored as given - the test table has no Date/JSON columns to convert"""
+
+    def encode(self, data):
+        return dict(data)
+
+
+def test_cursor_round_trip():
+    keyset = [('lastName', 'asc'), ('id', 'asc')]
+    values = ['Smith', 42, None, 1.5, True, Decimal('10.25'),
+              date(2024, 2, 29), datetime(2024, 2, 29, 12, 30, tzinfo=timezone.utc), 'usr_01HQ']
+    state = {'s': sort_fingerprint(keyset), 'v': values, 'p': 'pit-id'}
+
+    token = encode_cursor(state)
+    assert token == token.lower(), "the token must survive the lowercased query string"
+    assert decode_cursor(token.lower()) == state
+    assert decode_cursor(token.upper()) == state
+
+
+def test_malformed_cursor_rejected():
+    for token in ('', 'not a cursor', encode_cursor({'s': 'id:asc', 'v': []})[:-3]):
+        try:
+            decode_cursor(token)
+        except ValueError:
+            continue
+        raise AssertionError(f"{token!r} decoded")
+
+
+def test_cursor_bound_to_its_sort():
+    keyset = [('lastName', 'asc'), ('id', 'asc')]
+    cursor = decode_cursor(encode_cursor({'s': sort_fingerprint(keyset), 'v': ['smith', 'usr_1']}))
+
+    assert matches_sort(cursor, keyset)
+    assert matches_sort(cursor, [('LastName', 'ASC'), ('id', 'asc')]), "sort params arrive lowercased"
+    assert not matches_sort(cursor, [('lastName', 'desc'), ('id', 'asc')])
+    assert not matches_sort(cursor, [('firstName', 'asc'), ('id', 'asc')])
+    assert not matches_sort(cursor, [('id', 'asc')])
+    assert not matches_sort({**cursor, 'v': ['smith']}, keyset)
+
+
+def page_through(db, docs, keyset):
+    """Every row, read PAGE_SIZE at a time by seeking past the last row of the previous page"""
+    sort_exprs = [field for field, _ in keyset]
+    order = ', '.join(f"{field} {direction.upper()}" for field, direction in keyset)
+    rows, last = [], None
+    while True:
+        where, params = '', []
+        if last is not None:
+            seek_sql, params = docs._build_seek_clause('Item', keyset, sort_exprs, list(last))
+            where = f"WHERE {seek_sql}"
+        page = db.execute(f"SELECT rank, id FROM Item {where} ORDER BY {order} LIMIT ?", params + [PAGE_SIZE]).fetchall()
+        rows.extend(page)
+        if len(page) < PAGE_SIZE:
+            return rows
+        last = page[-1]
+
+
+def test_seek_with_null_sort_values():
+    db = sqlite3.connect(':memory:')
+    db.execute("CREATE TABLE Item (id TEXT PRIMARY KEY, rank INTEGER)")
+    ranks = [None, 3, None, 1, 3, None, 2, 1, None]
+    db.executemany("INSERT INTO Item VALUES (?, ?)", [(f"item{i}", rank) for i, rank in enumerate(ranks)])
+
+    docs = SqliteDocuments.__new__(SqliteDocuments)
+    docs._codecs = {'Item': PlainCodec()}
+
+    for rank_direction, id_direction in product(('asc', 'desc'), repeat=2):
+        keyset = [('rank', rank_direction), ('id', id_direction)]
+        expected = db.execute(f"SELECT rank, id FROM Item ORDER BY rank {rank_direction}, id {id_direction}").fetchall()
+        assert page_through(db, docs, keyset) == expected, keyset
+
+
+if __name__ == "__main__":
+    test_cursor_round_trip()
+    test_malformed_cursor_rejected()
+    print("✓ cursors round-trip through lowercasing, malformed ones are refused")
+    test_cursor_bound_to_its_sort()
+    print("✓ a cursor only applies to the sort it was issued for")
+    test_seek_with_null_sort_values()
+    print("✓ seek pagination over NULL sort values visits every row once, in order")
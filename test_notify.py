@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Concurrency stress test for Notification.
+Runs hundreds of simulated requests on one event loop, interleaving at every await, and checks
+each one sees only its own errors/warnings and its own suppress() blocks.
+"""
+import asyncio
+import random
+
+from app.core.notify import Notification, Warning, HTTP
+
+REQUESTS = 500
+STEPS = 20
+
+
+async def fake_request(n: int) -> dict:
+    """One request: warnings, suppressed FK-style lookups and a non-raising error, yielding between each"""
+    Notification.start()
+    for step in range(STEPS):
+        if step % 3 == 0:
+            with Notification.suppress():
+                await asyncio.sleep(0)
+                # dropped - must neither be collected nor raise
+                Notification.warning(Warning.NOT_FOUND, message="suppressed", entity="Fk", entity_id=f"req{n}")
+                Notification.error(HTTP.NOT_FOUND, "suppressed", entity="Fk", entity_id=f"req{n}")
+                await asyncio.sleep(0)
+        else:
+            Notification.warning(Warning.DATA_VALIDATION, message=f"step {step}", entity="User", entity_id=f"req{n}")
+        await asyncio.sleep(random.random() / 1000)
+    Notification.request_warning(message=f"request {n}")
+    Notification.error(HTTP.BAD_REQUEST, f"request {n}", entity="User", entity_id=f"req{n}", raise_exception=False)
+    return Notification.get()
+
+
+def check(n: int, response: dict) -> None:
+    notifications = response.get('notifications', {})
+    assert list(notifications) == [f"req{n}"], f"request {n} saw {list(notifications)}"
+    warnings = notifications[f"req{n}"]['warnings']
+    expected = [f"step {step}" for step in range(STEPS) if step % 3 != 0]
+    assert [w['message'] for w in warnings] == expected, f"request {n} warnings {warnings}"
+    assert [e['message'] for e in notifications[f"req{n}"]['errors']] == [f"request {n}"]
+    assert [w['message'] for w in response['request_warnings']] == [f"request {n}"]
+    assert response['status'] == 'error'
+
+
+async def run_requests() -> None:
+    # every request in its own task, as the server runs them
+    tasks = [asyncio.create_task(fake_request(n)) for n in range(REQUESTS)]
+    for n, response in enumerate(await asyncio.gather(*tasks)):
+        check(n, response)
+
+
+async def run_suppress_isolation() -> None:
+    """A request inside suppress() must not silence another request's warnings"""
+    inside = asyncio.Event()
+    release = asyncio.Event()
+
+    async def suppressing():
+        Notification.start()
+        with Notification.suppress():
+            inside.set()
+            await release.wait()
+        return Notification.get()
+
+    async def warning():
+        Notification.start()
+        await inside.wait()
+        Notification.warning(Warning.MISSING, message="kept", entity="User", entity_id="other")
+        release.set()
+        return Notification.get()
+
+    suppressed, warned = await asyncio.gather(asyncio.create_task(suppressing()), asyncio.create_task(warning()))
+    assert suppressed == {'status': 'success'}, suppressed
+    assert warned['notifications']['other']['warnings'][0]['message'] == "kept", warned
+
+
+def test_concurrent_requests_isolated():
+    asyncio.run(run_requests())
+
+
+def test_suppress_isolated():
+    asyncio.run(run_suppress_isolation())
+
+
+if __name__ == "__main__":
+    test_concurrent_requests_isolated()
+    print(f"✓ {REQUESTS} concurrent requests kept their own notifications")
+    test_suppress_isolated()
+    print("✓ suppress() stays within its own request")
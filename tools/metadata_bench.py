@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+MetadataService microbenchmark - per-row cost of metadata lookups in the driver hot paths.
+
+Simulates what the SQL drivers do for every row they decode (one type lookup per column)
+and what the filter builders do per field (proper-name + type lookup). It compares:
+  - scan:        the original linear case-insensitive scan over entities and fields
+  - indexed:     MetadataService.get / get_proper_name (lowercase-keyed dicts)
+  - descriptors: one MetadataService.descriptors() fetch per page, then plain dict hits
+
+Usage:
+    python tools/metadata_bench.py
+    python tools/metadata_bench.py --entity UserEvent --rows 20000
+"""
+import ast
+import sys
+import argparse
+import timeit
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add project root to path
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from app.core.metadata import MetadataService
+
+
+def load_entities() -> List[str]:
+    """Read ENTITIES from app/main.py without importing it (importing main loads config and parses argv)"""
+    tree = ast.parse((ROOT / 'app' / 'main.py').read_text())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(target, 'id', None) == 'ENTITIES' for target in node.targets):
+            return ast.literal_eval(node.value)
+    return []
+
+
+def scan_get(entity: str, field: str, attribute: str) -> Any:
+    """The pre-index MetadataService.get lookup: linear scans with .lower() on every comparison"""
+    for e, metadata in MetadataService._metadata.items():
+        if e.lower() == entity.lower():
+            for f, fd in metadata.get('fields', {}).items():
+                if f.lower() == field.lower():
+                    return fd[attribute]
+    return None
+
+
+def scan_get_proper_name(entity: str, field: Optional[str] = None) -> str:
+    """The pre-index MetadataService.get_proper_name lookup"""
+    for e, md in MetadataService._metadata.items():
+        if e.lower() == entity.lower():
+            if field:
+                for f in md.get('fields', {}):
+                    if f.lower() == field.lower():
+                        return f
+            else:
+                return e
+    return ''
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark MetadataService lookups per decoded row')
+    parser.add_argument('--entity', default='User', help='Entity whose row shape is simulated (default: User)')
+    parser.add_argument('--rows', type=int, default=10000, help='Rows per timing run (default: 10000)')
+    args = parser.parse_args()
+
+    entities = load_entities()
+    MetadataService.initialize(entities)
+    entity = MetadataService.get_proper_name(args.entity)
+    if not entity:
+        print(f"Unknown entity {args.entity}")
+        sys.exit(1)
+    columns = list(MetadataService.fields(entity).keys())
+
+    def decode_scan():
+        for column in columns:
+            scan_get(entity, column, 'type')
+
+    def decode_indexed():
+        for column in columns:
+            MetadataService.get(entity, column, 'type')
+
+    descriptors: Dict[str, Dict[str, Any]] = MetadataService.descriptors(entity)
+
+    def decode_descriptors():
+        for column in columns:
+            descriptors[column]['type']
+
+    def filter_scan():
+        for column in columns:
+            proper = scan_get_proper_name(entity, column.lower())
+            scan_get(entity, proper, 'type')
+
+    def filter_indexed():
+        for column in columns:
+            proper = MetadataService.get_proper_name(entity, column.lower())
+            MetadataService.get(entity, proper, 'type')
+
+    print(f"{len(entities)} entities, {entity} has {len(columns)} columns, {args.rows} rows per run\n")
+    print(f"{'workload':<28}{'scan':>12}{'indexed':>12}{'descriptors':>14}   (usec per row)")
+    runs = [
+        ('row decode (type/column)', decode_scan, decode_indexed, decode_descriptors),
+        ('filter build (name+type)', filter_scan, filter_indexed, None),
+    ]
+    for name, *variants in runs:
+        timings = []
+        for fn in variants:
+            if fn is None:
+                timings.append('-')
+                continue
+            seconds = min(timeit.repeat(fn, number=args.rows, repeat=3))
+            timings.append(f"{seconds / args.rows * 1e6:.2f}")
+        print(f"{name:<28}{timings[0]:>12}{timings[1]:>12}{timings[2]:>14}")
+
+
+if __name__ == "__main__":
+    main()